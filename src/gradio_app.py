@@ -93,11 +93,12 @@ with gr.Blocks(
                 try:
                     response = requests.get(
                         f"{NER_SERVICE_URL}/segments",
-                        params={"identifier": identifier, "namespace": namespace},
+                        params={"identifier": identifier, "namespace": namespace, "stream": True},
                         timeout=30,
+                        stream=True,
                     )
                     if response.status_code == 200:
-                        segments = response.json()
+                        segments = [json.loads(line) for line in response.iter_lines() if line]
                         segments.sort(key=lambda x: x.get("segment_number", 0))
                         rows = [
                             [
@@ -236,9 +236,11 @@ def wait_for_backend(max_retries: int = 60, retry_interval: int = 2) -> bool:
 def get_identifiers(namespace: str = "default_namespace") -> list:
     """Get all identifiers for a given namespace."""
     try:
-        response = requests.get(f"{NER_SERVICE_URL}/identifiers", params={"namespace": namespace}, timeout=30)
+        response = requests.get(
+            f"{NER_SERVICE_URL}/identifiers", params={"namespace": namespace, "stream": True}, timeout=30, stream=True
+        )
         if response.status_code == 200:
-            return response.json()
+            return [json.loads(line) for line in response.iter_lines() if line]
         return []
     except Exception:
         return []
@@ -0,0 +1,135 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Coroutine
+
+import httpx
+from pdf_features.PdfWord import PdfWord
+
+from ner_in_docker.configuration import (
+    PDF_ANALYSIS_SERVICE_URL,
+    PDF_ANALYSIS_MAX_CONCURRENCY,
+    PDF_ANALYSIS_CONNECT_TIMEOUT_SECONDS,
+    PDF_ANALYSIS_TIMEOUT_SECONDS,
+    PDF_ANALYSIS_RETRIES,
+    PDF_ANALYSIS_BACKOFF_SECONDS,
+)
+from ner_in_docker.adapters.LayoutAnalysisCache import LayoutAnalysisCache
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.ports.PDFToSegmentsRepository import PDFToSegmentsRepository
+
+
+class AsyncPDFLayoutAnalysisRepository(PDFToSegmentsRepository):
+    RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+    def __init__(
+        self,
+        service_url: str = PDF_ANALYSIS_SERVICE_URL,
+        max_concurrency: int = PDF_ANALYSIS_MAX_CONCURRENCY,
+        connect_timeout_seconds: float = PDF_ANALYSIS_CONNECT_TIMEOUT_SECONDS,
+        timeout_seconds: float = PDF_ANALYSIS_TIMEOUT_SECONDS,
+        retries: int = PDF_ANALYSIS_RETRIES,
+        backoff_seconds: float = PDF_ANALYSIS_BACKOFF_SECONDS,
+        cache: LayoutAnalysisCache | None = None,
+    ):
+        self.service_url = service_url.rstrip("/")
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = httpx.Timeout(timeout_seconds, connect=connect_timeout_seconds)
+        self.retries = max(0, retries)
+        self.backoff_seconds = max(0.0, backoff_seconds)
+        self.cache = cache
+        self.lock = threading.Lock()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.loop_pid: int | None = None
+        self.client: httpx.AsyncClient | None = None
+        self.semaphore: asyncio.Semaphore | None = None
+
+    def get_segments(self, pdf_path: Path, fast: bool = False) -> list[Segment]:
+        return self.get_segments_from_content(pdf_path.read_bytes(), pdf_path.name, fast)
+
+    def get_word_positions(self, pdf_path: Path) -> list[PdfWord]:
+        return self.get_word_positions_from_content(pdf_path.read_bytes(), pdf_path.name)
+
+    def get_segments_from_content(self, pdf_content: bytes, pdf_name: str, fast: bool = False) -> list[Segment]:
+        return self.submit(self._get_segments(pdf_content, pdf_name, fast)).result()
+
+    def get_word_positions_from_content(self, pdf_content: bytes, pdf_name: str) -> list[PdfWord]:
+        return self.get_word_positions_future(pdf_content, pdf_name).result()
+
+    def get_word_positions_future(self, pdf_content: bytes, pdf_name: str) -> Future:
+        return self.submit(self._get_word_positions(pdf_content, pdf_name))
+
+    def submit(self, coroutine: Coroutine) -> Future:
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+
+    async def _get_segments(self, pdf_content: bytes, pdf_name: str, fast: bool) -> list[Segment]:
+        segments_kind = LayoutAnalysisCache.get_segments_kind(fast)
+        segment_boxes = await self._post_cached(segments_kind, "", pdf_content, pdf_name, {"fast": str(fast)})
+        return [
+            Segment.from_segment_box(segment_box, pdf_name, index + 1) for index, segment_box in enumerate(segment_boxes)
+        ]
+
+    async def _get_word_positions(self, pdf_content: bytes, pdf_name: str) -> list[PdfWord]:
+        pdf_words = await self._post_cached("word_positions", "/word_positions", pdf_content, pdf_name)
+        return [PdfWord(**pdf_word) for pdf_word in pdf_words]
+
+    async def _post_cached(self, kind: str, path: str, pdf_content: bytes, pdf_name: str, data: dict | None = None) -> Any:
+        if not self.cache or not self.cache.is_enabled():
+            return await self._post(path, pdf_content, pdf_name, data)
+
+        key = LayoutAnalysisCache.get_key(pdf_content, kind)
+        payload = await asyncio.to_thread(self.cache.get, key)
+        if payload is not None:
+            return payload
+
+        payload = await self._post(path, pdf_content, pdf_name, data)
+        await asyncio.to_thread(self.cache.put, key, payload)
+        return payload
+
+    async def _post(self, path: str, pdf_content: bytes, pdf_name: str, data: dict | None = None) -> Any:
+        async with self.semaphore:
+            for attempt in range(self.retries + 1):
+                is_last_attempt = attempt == self.retries
+                try:
+                    response = await self.client.post(
+                        self.service_url + path, files={"file": (pdf_name, pdf_content, "application/pdf")}, data=data
+                    )
+                except httpx.TransportError:
+                    if is_last_attempt:
+                        raise
+                    await asyncio.sleep(self.backoff_seconds * 2**attempt)
+                    continue
+
+                if response.status_code in self.RETRY_STATUS_CODES and not is_last_attempt:
+                    await asyncio.sleep(self.backoff_seconds * 2**attempt)
+                    continue
+
+                response.raise_for_status()
+                return response.json()
+
+    def close(self):
+        with self.lock:
+            if self.loop is None or self.loop_pid != os.getpid():
+                return
+
+            asyncio.run_coroutine_threadsafe(self.client.aclose(), self.loop).result()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.loop = None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self.lock:
+            if self.loop is not None and self.loop_pid == os.getpid():
+                return self.loop
+
+            self.loop = asyncio.new_event_loop()
+            self.loop_pid = os.getpid()
+            threading.Thread(target=self.loop.run_forever, name="pdf-layout-analysis-client", daemon=True).start()
+            asyncio.run_coroutine_threadsafe(self._create_client(), self.loop).result()
+            return self.loop
+
+    async def _create_client(self):
+        limits = httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency)
+        self.client = httpx.AsyncClient(timeout=self.timeout, limits=limits)
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
@@ -0,0 +1,115 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any
+
+from ner_in_docker.configuration import LAYOUT_CACHE_PATH, LAYOUT_CACHE_MAX_MEGABYTES
+
+
+class LayoutAnalysisCache:
+    EXTENSION = ".json.gz"
+
+    def __init__(self, cache_path: Path = LAYOUT_CACHE_PATH, max_megabytes: float = LAYOUT_CACHE_MAX_MEGABYTES):
+        self.cache_path = cache_path
+        self.max_bytes = int(max_megabytes * 1024 * 1024)
+        self.lock = threading.Lock()
+        self.size_bytes: int | None = None
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_key(pdf_content: bytes, kind: str) -> str:
+        return f"{hashlib.sha256(pdf_content).hexdigest()}-{kind}"
+
+    @staticmethod
+    def get_segments_kind(fast: bool) -> str:
+        return "segments_fast" if fast else "segments_accurate"
+
+    def is_enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get_path(self, key: str) -> Path:
+        return Path(self.cache_path, key[:2], key + self.EXTENSION)
+
+    def get(self, key: str) -> Any | None:
+        if not self.is_enabled():
+            return None
+
+        path = self.get_path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as file:
+                payload = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            with self.lock:
+                self.misses += 1
+            return None
+
+        with self.lock:
+            self.hits += 1
+        return payload
+
+    def put(self, key: str, payload: Any):
+        if not self.is_enabled():
+            return
+
+        path = self.get_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = path.with_name(f".{uuid.uuid4().hex}.tmp")
+        content = gzip.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"), compresslevel=6)
+        temporary_path.write_bytes(content)
+        os.replace(temporary_path, path)
+
+        with self.lock:
+            self.writes += 1
+            if self.size_bytes is None:
+                self.size_bytes = self.get_files_size()
+            else:
+                self.size_bytes += len(content)
+
+            if self.size_bytes > self.max_bytes:
+                self.evict()
+
+    def get_files(self) -> list[tuple[float, int, Path]]:
+        files = list()
+        for path in self.cache_path.glob("*/*" + self.EXTENSION):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def get_files_size(self) -> int:
+        return sum(size for _, size, _ in self.get_files())
+
+    def evict(self):
+        files = sorted(self.get_files(), key=lambda x: x[0])
+        self.size_bytes = sum(size for _, size, _ in files)
+        target_bytes = int(self.max_bytes * 0.9)
+        for _, size, path in files:
+            if self.size_bytes <= target_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self.size_bytes -= size
+            self.evictions += 1
+
+    def get_metrics(self) -> dict:
+        with self.lock:
+            requests_count = self.hits + self.misses
+            return {
+                "enabled": self.is_enabled(),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / requests_count, 4) if requests_count else 0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "size_bytes": self.size_bytes if self.size_bytes is not None else self.get_files_size(),
+                "max_bytes": self.max_bytes,
+            }
@@ -0,0 +1,160 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import psycopg2
+from psycopg2 import errors
+from psycopg2.extensions import connection as Connection, cursor as Cursor, TRANSACTION_STATUS_IDLE
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+
+from ner_in_docker.configuration import (
+    POSTGRES_POOL_MIN_CONNECTIONS,
+    POSTGRES_POOL_MAX_CONNECTIONS,
+    POSTGRES_POOL_TIMEOUT_SECONDS,
+    POSTGRES_POOL_HEALTH_CHECK_SECONDS,
+)
+
+
+class PostgresConnectionPool:
+    pools: dict[tuple, "PostgresConnectionPool"] = dict()
+    pools_lock = threading.Lock()
+
+    def __init__(
+        self,
+        host: str,
+        port: str,
+        dbname: str,
+        user: str,
+        password: str,
+        min_connections: int = POSTGRES_POOL_MIN_CONNECTIONS,
+        max_connections: int = POSTGRES_POOL_MAX_CONNECTIONS,
+        timeout_seconds: float = POSTGRES_POOL_TIMEOUT_SECONDS,
+        health_check_seconds: float = POSTGRES_POOL_HEALTH_CHECK_SECONDS,
+    ):
+        self.connection_parameters = dict(host=host, port=port, dbname=dbname, user=user, password=password)
+        self.max_connections = max(1, max_connections)
+        self.min_connections = min(max(0, min_connections), self.max_connections)
+        self.timeout_seconds = timeout_seconds
+        self.health_check_seconds = health_check_seconds
+        self.available_connections = threading.BoundedSemaphore(self.max_connections)
+        self.lock = threading.Lock()
+        self.pool: ThreadedConnectionPool | None = None
+        self.last_used: dict[int, float] = dict()
+        self.created_schemas: set[str] = set()
+
+    @staticmethod
+    def get_pool(host: str, port: str, dbname: str, user: str, password: str) -> "PostgresConnectionPool":
+        key = (os.getpid(), host, port, dbname, user, password)
+        with PostgresConnectionPool.pools_lock:
+            if key not in PostgresConnectionPool.pools:
+                PostgresConnectionPool.pools[key] = PostgresConnectionPool(host, port, dbname, user, password)
+            return PostgresConnectionPool.pools[key]
+
+    def get_connections_pool(self) -> ThreadedConnectionPool:
+        with self.lock:
+            if self.pool is None:
+                self.pool = ThreadedConnectionPool(self.min_connections, self.max_connections, **self.connection_parameters)
+            return self.pool
+
+    def is_healthy(self, connection: Connection) -> bool:
+        if connection.closed:
+            return False
+
+        if time.monotonic() - self.last_used.get(id(connection), 0) < self.health_check_seconds:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def get_healthy_connection(self) -> Connection:
+        pool = self.get_connections_pool()
+        for _ in range(self.max_connections):
+            connection = pool.getconn()
+            if self.is_healthy(connection):
+                return connection
+            self.last_used.pop(id(connection), None)
+            pool.putconn(connection, close=True)
+
+        return pool.getconn()
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        if not self.available_connections.acquire(timeout=self.timeout_seconds):
+            raise PoolError(f"No Postgres connection available after {self.timeout_seconds} seconds")
+
+        connection = None
+        broken = False
+        try:
+            connection = self.get_healthy_connection()
+            yield connection
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+            raise
+        except (errors.InvalidSchemaName, errors.UndefinedTable):
+            self.forget_schemas()
+            raise
+        finally:
+            if connection is not None:
+                self.release(connection, broken)
+            self.available_connections.release()
+
+    def release(self, connection: Connection, broken: bool):
+        if broken or connection.closed:
+            self.last_used.pop(id(connection), None)
+            self.get_connections_pool().putconn(connection, close=True)
+            return
+
+        try:
+            if connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+        except psycopg2.Error:
+            self.last_used.pop(id(connection), None)
+            self.get_connections_pool().putconn(connection, close=True)
+            return
+
+        self.last_used[id(connection)] = time.monotonic()
+        self.get_connections_pool().putconn(connection)
+
+    @contextmanager
+    def cursor(self) -> Iterator[Cursor]:
+        with self.connection() as connection:
+            with connection.cursor() as cursor:
+                yield cursor
+
+    @contextmanager
+    def transaction(self) -> Iterator[Cursor]:
+        with self.connection() as connection:
+            with connection:
+                with connection.cursor() as cursor:
+                    yield cursor
+
+    def is_schema_created(self, schema_name: str) -> bool:
+        with self.lock:
+            return schema_name in self.created_schemas
+
+    def set_schema_created(self, schema_name: str):
+        with self.lock:
+            self.created_schemas.add(schema_name)
+
+    def forget_schema(self, schema_name: str):
+        with self.lock:
+            self.created_schemas.discard(schema_name)
+
+    def forget_schemas(self):
+        with self.lock:
+            self.created_schemas.clear()
+
+    def close(self):
+        with self.lock:
+            if self.pool is not None:
+                self.pool.closeall()
+                self.pool = None
+            self.last_used.clear()
+            self.created_schemas.clear()
@@ -1,12 +1,32 @@
-import psycopg2
+import base64
+import json
+from typing import Callable, Iterator, TypeVar
+
+from pdf_features import Rectangle
+from psycopg2 import errors
+from psycopg2.extensions import cursor as Cursor
+from psycopg2.extras import execute_values
+
 from ner_in_docker.adapters.EntityPersistence import EntityPersistence
+from ner_in_docker.adapters.PostgresConnectionPool import PostgresConnectionPool
+from ner_in_docker.adapters.PostgresMigrations import PostgresMigrations
 from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.PriorEntity import PriorEntity
 from ner_in_docker.domain.Segment import Segment
 from ner_in_docker.ports.EntitiesStoreRepository import EntitiesStoreRepository
 import os
 
+T = TypeVar("T")
+
 
 class PostgresEntitiesStoreRepository(EntitiesStoreRepository):
+    PAGE_SIZE = 1000
+    MAX_PAGE_LIMIT = 10000
+    SEGMENTS_COLUMNS = (
+        "id, text, page_number, segment_number, type, source_id, "
+        "bounding_box_left, bounding_box_top, bounding_box_width, bounding_box_height, page_width, page_height"
+    )
+
     def __init__(self, schema_name: str = "public", language: str = "en"):
         self.language = language
         self.schema_name = f"{schema_name}_{language}"
@@ -15,172 +35,207 @@ class PostgresEntitiesStoreRepository(EntitiesStoreRepository):
         self.dbname = os.environ.get("POSTGRES_DB", "ner_db")
         self.user = os.environ.get("POSTGRES_USER", "postgres")
         self.password = os.environ.get("POSTGRES_PASSWORD", "postgres")
-
-    def get_connection(self):
-        connection = psycopg2.connect(
-            host=self.host,
-            port=self.port,
-            dbname=self.dbname,
-            user=self.user,
-            password=self.password,
-        )
-        cursor = connection.cursor()
-        return connection, cursor
+        self.pool = PostgresConnectionPool.get_pool(self.host, self.port, self.dbname, self.user, self.password)
 
     def exists_schema(self) -> bool:
+        if self.pool.is_schema_created(self.schema_name):
+            return True
+
         try:
-            connection, cursor = self.get_connection()
-            cursor.execute(
-                "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
-                (self.schema_name,),
-            )
-            exists = cursor.fetchone() is not None
-            connection.close()
-            return exists
+            with self.pool.cursor() as cursor:
+                cursor.execute(
+                    "SELECT schema_name FROM information_schema.schemata WHERE schema_name = %s",
+                    (self.schema_name,),
+                )
+                exists = cursor.fetchone() is not None
         except Exception:
             return False
 
+        if exists:
+            self.create_database()
+        return exists
+
     def create_database(self):
-        connection, cursor = self.get_connection()
+        if self.pool.is_schema_created(self.schema_name):
+            return
 
-        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema_name}")
+        with self.pool.transaction() as cursor:
+            PostgresMigrations.migrate(cursor, self.schema_name)
 
-        cursor.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {self.schema_name}.named_entities_group (
-                id SERIAL PRIMARY KEY,
-                name TEXT UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        )
-        cursor.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {self.schema_name}.segments (
-                id SERIAL PRIMARY KEY,
-                text TEXT,
-                page_number INTEGER,
-                segment_number INTEGER,
-                type TEXT,
-                source_id TEXT,
-                bounding_box_left INTEGER,
-                bounding_box_top INTEGER,
-                bounding_box_width INTEGER,
-                bounding_box_height INTEGER,
-                page_width INTEGER,
-                page_height INTEGER
-            )
-        """
-        )
-        cursor.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {self.schema_name}.named_entities (
-                id SERIAL PRIMARY KEY,
-                type TEXT NOT NULL,
-                text TEXT,
-                normalized_text TEXT,
-                character_start INTEGER,
-                character_end INTEGER,
-                group_id INTEGER REFERENCES {self.schema_name}.named_entities_group(id),
-                segment_id INTEGER REFERENCES {self.schema_name}.segments(id),
-                appearance_count INTEGER,
-                percentage_to_segment_text INTEGER,
-                first_type_appearance BOOLEAN,
-                last_type_appearance BOOLEAN,
-                relevance_percentage INTEGER
-            )
-        """
-        )
-        cursor.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {self.schema_name}.identifiers (
-                id SERIAL PRIMARY KEY,
-                identifier TEXT UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """
-        )
-        connection.commit()
-        connection.close()
+        self.pool.set_schema_created(self.schema_name)
 
-    def get_entities(self) -> list[NamedEntity]:
+    def read_schema(self, read: Callable[[], T], default: T) -> T:
         if not self.exists_schema():
-            return []
+            return default
+
+        try:
+            return read()
+        except (errors.InvalidSchemaName, errors.UndefinedTable):
+            self.pool.forget_schemas()
+            return read() if self.exists_schema() else default
 
+    def write_schema(self, write: Callable[[Cursor], None]):
         self.create_database()
-        connection, cursor = self.get_connection()
+        try:
+            with self.pool.transaction() as cursor:
+                write(cursor)
+        except (errors.InvalidSchemaName, errors.UndefinedTable):
+            self.pool.forget_schemas()
+            self.create_database()
+            with self.pool.transaction() as cursor:
+                write(cursor)
 
-        cursor.execute(f"SELECT * FROM {self.schema_name}.named_entities")
-        rows = cursor.fetchall()
-        entities = [EntityPersistence.from_row(row).to_named_entity() for row in rows]
+    def get_namespace_version(self) -> int:
+        return self.read_schema(self.select_namespace_version, 0)
 
-        connection.close()
-        return entities
+    def select_namespace_version(self) -> int:
+        with self.pool.cursor() as cursor:
+            cursor.execute(f"SELECT version FROM {self.schema_name}.namespace_version")
+            row = cursor.fetchone()
 
-    def save_entities(self, named_entities: list[NamedEntity]) -> bool:
-        if not self.exists_schema():
-            self.create_database()
-        try:
-            connection, cursor = self.get_connection()
-            source_ids = set(entity.segment.source_id for entity in named_entities if entity.segment is not None)
-            if source_ids:
-                format_strings = ",".join(["%s"] * len(source_ids))
-                cursor.execute(
-                    f"""DELETE FROM {self.schema_name}.named_entities 
-                    WHERE segment_id IN (SELECT id FROM {self.schema_name}.segments WHERE source_id IN ({format_strings}))""",
-                    tuple(source_ids),
-                )
-                connection.commit()
+        return row[0] if row else 0
 
-            for entity in named_entities:
-                persistence = EntityPersistence.from_named_entity(entity)
+    def increase_namespace_version(self, cursor):
+        cursor.execute(f"UPDATE {self.schema_name}.namespace_version SET version = version + 1")
 
-                segment_id = None
-                if entity.segment and entity.segment.source_id:
-                    cursor.execute(
-                        f"SELECT id FROM {self.schema_name}.segments WHERE source_id = %s",
-                        (entity.segment.source_id,),
-                    )
-                    seg_row = cursor.fetchone()
-                    if seg_row:
-                        segment_id = seg_row[0]
+    def get_entities(self) -> list[NamedEntity]:
+        return self.read_schema(self.select_entities, [])
 
-                cursor.execute(
-                    f"""
-                    INSERT INTO {self.schema_name}.named_entities (
-                        type, text, normalized_text, character_start, character_end, group_id,
-                        segment_id,
-                        appearance_count, percentage_to_segment_text, first_type_appearance, last_type_appearance, relevance_percentage
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        str(persistence.type),
-                        persistence.text,
-                        persistence.normalized_text,
-                        persistence.character_start,
-                        persistence.character_end,
-                        None,
-                        segment_id,
-                        persistence.appearance_count,
-                        persistence.percentage_to_segment_text,
-                        persistence.first_type_appearance,
-                        persistence.last_type_appearance,
-                        persistence.relevance_percentage,
-                    ),
-                )
-            connection.commit()
-            connection.close()
+    def select_entities(self) -> list[NamedEntity]:
+        with self.pool.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT ne.id, upper(ne.type), ne.text, ne.normalized_text, ne.character_start, ne.character_end,
+                    COALESCE(ne.group_name, destination.name, ne.text), s.text, s.page_number, s.segment_number,
+                    COALESCE(s.type, 'Text'), COALESCE(s.source_id, ne.source_id), s.bounding_box_left, s.bounding_box_top, s.bounding_box_width, s.bounding_box_height,
+                    ne.appearance_count, ne.percentage_to_segment_text, ne.first_type_appearance, ne.last_type_appearance,
+                    ne.relevance_percentage
+                FROM {self.schema_name}.named_entities ne
+                LEFT JOIN {self.schema_name}.named_entities_group destination ON destination.id = ne.group_id
+                LEFT JOIN {self.schema_name}.segments s ON s.id = ne.segment_id
+                ORDER BY ne.id
+                """
+            )
+            rows = cursor.fetchall()
+
+        return [EntityPersistence.from_row(row).to_named_entity() for row in rows]
+
+    def get_prior_entities(self) -> list[PriorEntity]:
+        return self.read_schema(self.select_prior_entities, [])
+
+    def select_prior_entities(self) -> list[PriorEntity]:
+        query = f"""
+        SELECT upper(ne.type), ne.text, ne.normalized_text, COALESCE(ne.group_name, destination.name, ne.text),
+            ne.relevance_percentage, ne.character_start, ne.character_end,
+            s.type, COALESCE(s.source_id, ne.source_id), s.page_number, s.segment_number,
+            s.text, s.bounding_box_left, s.bounding_box_top, s.bounding_box_width, s.bounding_box_height
+        FROM {self.schema_name}.named_entities ne
+        LEFT JOIN {self.schema_name}.named_entities_group destination ON destination.id = ne.group_id
+        LEFT JOIN {self.schema_name}.segments s ON s.id = ne.segment_id
+        ORDER BY ne.id
+        """
+        return [PriorEntity._make(row) for row in self.iterate_rows("prior_entities", query)]
+
+    def save_entities(self, named_entities: list[NamedEntity]) -> bool:
+        return self.save_documents_entities(named_entities, [])
+
+    def save_documents_entities(self, named_entities: list[NamedEntity], identifiers: list[str]) -> bool:
+        try:
+            self.write_schema(lambda cursor: self.insert_documents_entities(cursor, named_entities, identifiers))
             return True
         except Exception as e:
             print(f"Error saving entities: {e}")
             return False
 
+    def insert_documents_entities(self, cursor: Cursor, named_entities: list[NamedEntity], identifiers: list[str]):
+        source_ids = list(set(entity.segment.source_id for entity in named_entities if entity.segment is not None))
+        if source_ids:
+            cursor.execute(
+                f"DELETE FROM {self.schema_name}.named_entities WHERE source_id = ANY(%s)",
+                (source_ids,),
+            )
+
+        segments = [entity.segment for entity in named_entities if entity.segment is not None]
+        segment_id_by_key = self.get_segment_id_by_key(cursor, segments)
+        rows = list()
+        for entity in named_entities:
+            persistence = EntityPersistence.from_named_entity(entity)
+            segment_id = segment_id_by_key.get(self.get_segment_key(entity.segment)) if entity.segment else None
+            rows.append(
+                (
+                    str(persistence.type),
+                    persistence.text,
+                    persistence.normalized_text,
+                    persistence.character_start,
+                    persistence.character_end,
+                    None,
+                    persistence.group_name,
+                    segment_id,
+                    entity.segment.source_id if entity.segment else None,
+                    persistence.appearance_count,
+                    persistence.percentage_to_segment_text,
+                    persistence.first_type_appearance,
+                    persistence.last_type_appearance,
+                    persistence.relevance_percentage,
+                )
+            )
+
+        execute_values(
+            cursor,
+            f"""
+            INSERT INTO {self.schema_name}.named_entities (
+                type, text, normalized_text, character_start, character_end, group_id, group_name,
+                segment_id, source_id,
+                appearance_count, percentage_to_segment_text, first_type_appearance, last_type_appearance, relevance_percentage
+            ) VALUES %s
+            """,
+            rows,
+            page_size=self.PAGE_SIZE,
+        )
+        self.insert_identifiers(cursor, identifiers)
+        self.increase_namespace_version(cursor)
+
+    @staticmethod
+    def get_segment_key(segment: Segment) -> tuple[str, int, int]:
+        return segment.source_id, segment.page_number, segment.segment_number
+
+    def get_segment_id_by_key(self, cursor, segments: list[Segment]) -> dict[tuple[str, int, int], int]:
+        segments_keys = list(dict.fromkeys(self.get_segment_key(segment) for segment in segments))
+        if not segments_keys:
+            return dict()
+
+        rows = execute_values(
+            cursor,
+            f"""SELECT DISTINCT ON (keys.source_id, keys.page_number, keys.segment_number)
+                keys.source_id, keys.page_number, keys.segment_number, segments.id
+            FROM (VALUES %s) AS keys (source_id, page_number, segment_number)
+            JOIN {self.schema_name}.segments AS segments
+                ON segments.source_id = keys.source_id
+                AND segments.page_number = keys.page_number
+                AND segments.segment_number = keys.segment_number
+            ORDER BY keys.source_id, keys.page_number, keys.segment_number, segments.id""",
+            segments_keys,
+            page_size=len(segments_keys),
+            fetch=True,
+        )
+        return {
+            (source_id, page_number, segment_number): segment_id
+            for source_id, page_number, segment_number, segment_id in rows
+        }
+
+    def insert_identifiers(self, cursor, identifiers: list[str]):
+        execute_values(
+            cursor,
+            f"INSERT INTO {self.schema_name}.identifiers (identifier) VALUES %s ON CONFLICT DO NOTHING",
+            [(identifier,) for identifier in dict.fromkeys(identifiers)],
+            page_size=self.PAGE_SIZE,
+        )
+
     def delete_database(self):
         try:
-            connection, cursor = self.get_connection()
-            cursor.execute(f"DROP SCHEMA IF EXISTS {self.schema_name} CASCADE")
-            connection.commit()
-            connection.close()
+            with self.pool.transaction() as cursor:
+                cursor.execute(f"DROP SCHEMA IF EXISTS {self.schema_name} CASCADE")
+            self.pool.forget_schema(self.schema_name)
         except Exception as e:
             print(f"Error deleting database schema: {e}")
 
@@ -188,17 +243,8 @@ class PostgresEntitiesStoreRepository(EntitiesStoreRepository):
         if not identifier:
             return False
 
-        if not self.exists_schema():
-            self.create_database()
-
         try:
-            connection, cursor = self.get_connection()
-            cursor.execute(
-                f"INSERT INTO {self.schema_name}.identifiers (identifier) VALUES (%s) ON CONFLICT DO NOTHING",
-                (identifier,),
-            )
-            connection.commit()
-            connection.close()
+            self.write_schema(lambda cursor: self.insert_identifiers(cursor, [identifier]))
             return True
         except Exception as e:
             print(f"Error saving identifier: {e}")
@@ -209,129 +255,88 @@ class PostgresEntitiesStoreRepository(EntitiesStoreRepository):
             return False
 
         try:
-            connection, cursor = self.get_connection()
-            cursor.execute(
-                f"SELECT 1 FROM {self.schema_name}.identifiers WHERE identifier = %s",
-                (identifier,),
-            )
-            result = cursor.fetchone() is not None
-            connection.close()
+            with self.pool.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT 1 FROM {self.schema_name}.identifiers WHERE identifier = %s",
+                    (identifier,),
+                )
+                result = cursor.fetchone() is not None
             return result
         except Exception:
             return False
 
     def save_segments(self, segments: list[Segment]) -> bool:
-        if not self.exists_schema():
-            self.create_database()
-
         try:
-            connection, cursor = self.get_connection()
-
-            cursor.execute(
-                f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.segments (
-                    id SERIAL PRIMARY KEY,
-                    text TEXT,
-                    page_number INTEGER,
-                    segment_number INTEGER,
-                    type TEXT,
-                    source_id TEXT,
-                    bounding_box_left INTEGER,
-                    bounding_box_top INTEGER,
-                    bounding_box_width INTEGER,
-                    bounding_box_height INTEGER,
-                    page_width INTEGER,
-                    page_height INTEGER
-                )
-            """
-            )
-
-            source_ids = set(seg.source_id for seg in segments)
-            if source_ids:
-                format_strings = ",".join(["%s"] * len(source_ids))
-                cursor.execute(
-                    f"DELETE FROM {self.schema_name}.segments WHERE source_id IN ({format_strings})",
-                    tuple(source_ids),
-                )
+            self.write_schema(lambda cursor: self.insert_segments(cursor, segments))
+            return True
+        except Exception as e:
+            print(f"Error saving segments: {e}")
+            return False
 
+    def insert_segments(self, cursor: Cursor, segments: list[Segment]):
+        source_ids = list(set(seg.source_id for seg in segments))
+        if source_ids:
             cursor.execute(
-                f"""
-                CREATE TABLE IF NOT EXISTS {self.schema_name}.identifiers (
-                    id SERIAL PRIMARY KEY,
-                    identifier TEXT UNIQUE NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """
+                f"DELETE FROM {self.schema_name}.segments WHERE source_id = ANY(%s)",
+                (source_ids,),
             )
 
-            for segment in segments:
-                cursor.execute(
-                    f"""
-                    INSERT INTO {self.schema_name}.segments (
-                        text, page_number, segment_number, type, source_id,
-                        bounding_box_left, bounding_box_top, bounding_box_width, bounding_box_height,
-                        page_width, page_height
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """,
-                    (
-                        segment.text,
-                        segment.page_number,
-                        segment.segment_number,
-                        segment.type,
-                        segment.source_id,
-                        segment.bounding_box.left,
-                        segment.bounding_box.top,
-                        segment.bounding_box.width,
-                        segment.bounding_box.height,
-                        segment.page_width,
-                        segment.page_height,
-                    ),
-                )
-
-            for source_id in source_ids:
-                cursor.execute(
-                    f"INSERT INTO {self.schema_name}.identifiers (identifier) VALUES (%s) ON CONFLICT DO NOTHING",
-                    (source_id,),
+        execute_values(
+            cursor,
+            f"""
+            INSERT INTO {self.schema_name}.segments (
+                text, page_number, segment_number, type, source_id,
+                bounding_box_left, bounding_box_top, bounding_box_width, bounding_box_height,
+                page_width, page_height
+            ) VALUES %s
+            """,
+            [
+                (
+                    segment.text,
+                    segment.page_number,
+                    segment.segment_number,
+                    segment.type,
+                    segment.source_id,
+                    segment.bounding_box.left,
+                    segment.bounding_box.top,
+                    segment.bounding_box.width,
+                    segment.bounding_box.height,
+                    segment.page_width,
+                    segment.page_height,
                 )
-
-            connection.commit()
-            connection.close()
-            return True
-        except Exception as e:
-            print(f"Error saving segments: {e}")
-            return False
+                for segment in segments
+            ],
+            page_size=self.PAGE_SIZE,
+        )
+        self.insert_identifiers(cursor, source_ids)
+
+    @staticmethod
+    def get_segment_from_row(row: tuple) -> Segment:
+        return Segment(
+            id=row[0],
+            text=row[1],
+            page_number=row[2],
+            segment_number=row[3],
+            type=row[4],
+            source_id=row[5],
+            bounding_box=Rectangle.from_width_height(left=row[6], top=row[7], width=row[8], height=row[9]),
+            page_width=row[10],
+            page_height=row[11],
+        )
 
     def get_segments(self, identifier: str) -> list[Segment]:
         if not self.exists_schema():
             return []
 
         try:
-            connection, cursor = self.get_connection()
-            cursor.execute(
-                f"SELECT * FROM {self.schema_name}.segments WHERE source_id = %s",
-                (identifier,),
-            )
-            rows = cursor.fetchall()
-            connection.close()
-
-            segments = []
-            for row in rows:
-                from pdf_features import Rectangle
-
-                segments.append(
-                    Segment(
-                        id=row[0],
-                        text=row[1],
-                        page_number=row[2],
-                        segment_number=row[3],
-                        type=row[4],
-                        source_id=row[5],
-                        bounding_box=Rectangle.from_width_height(left=row[6], top=row[7], width=row[8], height=row[9]),
-                        page_width=row[10],
-                        page_height=row[11],
-                    )
+            with self.pool.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT {self.SEGMENTS_COLUMNS} FROM {self.schema_name}.segments WHERE source_id = %s",
+                    (identifier,),
                 )
-            return segments
+                rows = cursor.fetchall()
+
+            return [self.get_segment_from_row(row) for row in rows]
         except Exception as e:
             print(f"Error getting segments: {e}")
             return []
@@ -341,180 +346,265 @@ class PostgresEntitiesStoreRepository(EntitiesStoreRepository):
             return []
 
         try:
-            connection, cursor = self.get_connection()
-            cursor.execute(f"SELECT identifier FROM {self.schema_name}.identifiers")
-            rows = cursor.fetchall()
-            connection.close()
+            with self.pool.cursor() as cursor:
+                cursor.execute(f"SELECT identifier FROM {self.schema_name}.identifiers")
+                rows = cursor.fetchall()
             return [row[0] for row in rows]
         except Exception as e:
             print(f"Error getting identifiers: {e}")
             return []
 
-    def save_reference(self, segment_id: int | None, reference_text: str, to_text: str) -> bool:
-        self.create_database()
+    @staticmethod
+    def get_cursor_token(key: tuple) -> str:
+        return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
 
-        try:
-            connection, cursor = self.get_connection()
+    @staticmethod
+    def get_cursor_key(cursor_token: str | None, key_size: int) -> tuple | None:
+        if not cursor_token:
+            return None
+
+        key = json.loads(base64.urlsafe_b64decode(cursor_token.encode()))
+        if not isinstance(key, list) or len(key) != key_size or not all(type(x) is int for x in key):
+            raise ValueError(f"Invalid cursor {cursor_token}")
+        return tuple(key)
+
+    def get_page_limit(self, limit: int | None) -> int:
+        return max(1, min(limit if limit else self.PAGE_SIZE, self.MAX_PAGE_LIMIT))
+
+    def get_identifiers_page(
+        self, limit: int | None = None, cursor_token: str | None = None
+    ) -> tuple[list[str], str | None]:
+        limit = self.get_page_limit(limit)
+        key = self.get_cursor_key(cursor_token, 1)
+        if not self.exists_schema():
+            return [], None
 
+        with self.pool.cursor() as cursor:
             cursor.execute(
-                f"SELECT id FROM {self.schema_name}.named_entities_group WHERE name = %s",
-                (to_text,),
+                f"SELECT id, identifier FROM {self.schema_name}.identifiers WHERE id > %s ORDER BY id LIMIT %s",
+                (key[0] if key else 0, limit + 1),
             )
-            row = cursor.fetchone()
-            if row is not None:
-                destination_id = row[0]
-            else:
-                cursor.execute(
-                    f"""
-                    INSERT INTO {self.schema_name}.named_entities_group (name)
-                    VALUES (%s)
-                    RETURNING id
-                    """,
-                    (to_text,),
-                )
-                result = cursor.fetchone()
-                destination_id = result[0] if result is not None else None
+            rows = cursor.fetchall()
+
+        next_cursor_token = self.get_cursor_token((rows[limit - 1][0],)) if len(rows) > limit else None
+        return [row[1] for row in rows[:limit]], next_cursor_token
 
-            # Get segment details - now we just use segment_id directly
+    def get_segments_page(
+        self, identifier: str, limit: int | None = None, cursor_token: str | None = None
+    ) -> tuple[list[Segment], str | None]:
+        limit = self.get_page_limit(limit)
+        key = self.get_cursor_key(cursor_token, 3)
+        if not self.exists_schema():
+            return [], None
 
+        key_condition = "AND (page_number, segment_number, id) > (%s, %s, %s)" if key else ""
+        with self.pool.cursor() as cursor:
             cursor.execute(
-                f"""
-                INSERT INTO {self.schema_name}.named_entities (
-                    type, text, normalized_text, character_start, character_end, group_id,
-                    segment_id,
-                    appearance_count, percentage_to_segment_text, first_type_appearance, last_type_appearance, relevance_percentage
-                ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """,
-                (
-                    "Reference",
-                    reference_text,
-                    reference_text,
-                    0,
-                    0,
-                    destination_id,
-                    segment_id,
-                    0,
-                    0,
-                    False,
-                    False,
-                    0,
-                ),
+                f"""SELECT {self.SEGMENTS_COLUMNS} FROM {self.schema_name}.segments
+                WHERE source_id = %s {key_condition}
+                ORDER BY page_number, segment_number, id LIMIT %s""",
+                (identifier, *(key if key else ()), limit + 1),
             )
-            connection.commit()
-            connection.close()
+            rows = cursor.fetchall()
+
+        segments = [self.get_segment_from_row(row) for row in rows[:limit]]
+        last_segment = segments[-1] if len(rows) > limit else None
+        if not last_segment:
+            return segments, None
+
+        return segments, self.get_cursor_token((last_segment.page_number, last_segment.segment_number, last_segment.id))
+
+    def iterate_rows(self, name: str, query: str, parameters: tuple = ()) -> Iterator[tuple]:
+        with self.pool.connection() as connection:
+            with connection.cursor(name=name) as cursor:
+                cursor.itersize = self.PAGE_SIZE
+                cursor.execute(query, parameters)
+                yield from cursor
+
+    def iterate_identifiers(self) -> Iterator[str]:
+        if not self.exists_schema():
+            return
+
+        query = f"SELECT identifier FROM {self.schema_name}.identifiers ORDER BY id"
+        for row in self.iterate_rows("identifiers", query):
+            yield row[0]
+
+    def iterate_segments(self, identifier: str) -> Iterator[Segment]:
+        if not self.exists_schema():
+            return
+
+        query = f"""SELECT {self.SEGMENTS_COLUMNS} FROM {self.schema_name}.segments
+        WHERE source_id = %s ORDER BY page_number, segment_number, id"""
+        for row in self.iterate_rows("segments", query, (identifier,)):
+            yield self.get_segment_from_row(row)
+
+    def save_reference(self, segment_id: int | None, reference_text: str, to_text: str) -> bool:
+        try:
+            self.write_schema(lambda cursor: self.insert_reference(cursor, segment_id, reference_text, to_text))
             return True
         except Exception as e:
             print(f"Error saving reference: {e}")
             return False
 
-    def get_references(self) -> list:
+    def insert_reference(self, cursor: Cursor, segment_id: int | None, reference_text: str, to_text: str):
+        cursor.execute(
+            f"SELECT id FROM {self.schema_name}.named_entities_group WHERE name = %s",
+            (to_text,),
+        )
+        row = cursor.fetchone()
+        if row is not None:
+            destination_id = row[0]
+        else:
+            cursor.execute(
+                f"""
+                INSERT INTO {self.schema_name}.named_entities_group (name)
+                VALUES (%s)
+                RETURNING id
+                """,
+                (to_text,),
+            )
+            result = cursor.fetchone()
+            destination_id = result[0] if result is not None else None
+
+        # Get segment details - now we just use segment_id directly
+
+        cursor.execute(
+            f"""
+            INSERT INTO {self.schema_name}.named_entities (
+                type, text, normalized_text, character_start, character_end, group_id,
+                segment_id, source_id,
+                appearance_count, percentage_to_segment_text, first_type_appearance, last_type_appearance, relevance_percentage
+            ) VALUES (
+                %s, %s, %s, %s, %s, %s, %s, (SELECT source_id FROM {self.schema_name}.segments WHERE id = %s),
+                %s, %s, %s, %s, %s
+            )
+            """,
+            (
+                "Reference",
+                reference_text,
+                reference_text,
+                0,
+                0,
+                destination_id,
+                segment_id,
+                segment_id,
+                0,
+                0,
+                False,
+                False,
+                0,
+            ),
+        )
+        self.increase_namespace_version(cursor)
+
+    def get_references(self, limit: int | None = None, offset: int = 0, identifier: str | None = None) -> list:
         if not self.exists_schema():
             return []
 
         try:
-            connection, cursor = self.get_connection()
-            # Fetch destinations
-            cursor.execute(f"SELECT id, name FROM {self.schema_name}.named_entities_group ORDER BY id")
-            destinations = cursor.fetchall()
-
-            groups = []
-            from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
-            from ner_in_docker.domain.NamedEntity import NamedEntity
-            from ner_in_docker.domain.NamedEntityType import NamedEntityType
-            from pdf_features import Rectangle
-            from ner_in_docker.domain.Segment import Segment
-
-            for dest_id, dest_name in destinations:
-                group = NamedEntityGroup(
-                    type=NamedEntityType.REFERENCE,
-                    name=dest_name,
-                    segment=None,
-                    named_entities=[],
-                )
-
+            with self.pool.cursor() as cursor:
                 cursor.execute(
                     f"""
-                    SELECT ne.id, ne.text, s.text, s.page_number, s.segment_number, s.type, s.source_id, s.bounding_box_left, s.bounding_box_top, s.bounding_box_width, s.bounding_box_height
-                    FROM {self.schema_name}.named_entities ne
+                    WITH destinations AS (
+                        SELECT destination.id, destination.name
+                        FROM {self.schema_name}.named_entities_group destination
+                        WHERE %(identifier)s IS NULL OR EXISTS (
+                            SELECT 1 FROM {self.schema_name}.named_entities ne
+                            JOIN {self.schema_name}.segments s ON ne.segment_id = s.id
+                            WHERE ne.group_id = destination.id AND ne.type = 'Reference' AND s.source_id = %(identifier)s
+                        )
+                        ORDER BY destination.id
+                        LIMIT %(limit)s OFFSET %(offset)s
+                    )
+                    SELECT destinations.id, destinations.name, ne.id, ne.text, s.text, s.page_number, s.segment_number, s.type, s.source_id, s.bounding_box_left, s.bounding_box_top, s.bounding_box_width, s.bounding_box_height
+                    FROM destinations
+                    LEFT JOIN {self.schema_name}.named_entities ne ON ne.group_id = destinations.id AND ne.type = 'Reference'
                     LEFT JOIN {self.schema_name}.segments s ON ne.segment_id = s.id
-                    WHERE ne.group_id = %s AND ne.type = 'Reference'
-                    ORDER BY ne.id
+                    WHERE %(identifier)s IS NULL OR s.source_id = %(identifier)s
+                    ORDER BY destinations.id, ne.id
                     """,
-                    (dest_id,),
+                    {"identifier": identifier, "limit": limit, "offset": max(0, offset)},
                 )
-
-                refs = cursor.fetchall()
-                for ref in refs:
-                    ref_id, ref_text = ref[0], ref[1]
-                    (
-                        segment_text,
-                        segment_page_number,
-                        segment_segment_number,
-                        segment_type,
-                        segment_source_id,
-                        segment_bounding_box_left,
-                        segment_bounding_box_top,
-                        segment_bounding_box_width,
-                        segment_bounding_box_height,
-                    ) = (
-                        ref[2],
-                        ref[3],
-                        ref[4],
-                        ref[5],
-                        ref[6],
-                        ref[7],
-                        ref[8],
-                        ref[9],
-                        ref[10],
-                    )
-
-                    segment = None
-                    if segment_text is not None or segment_source_id is not None:
-                        segment = Segment(
-                            text=segment_text if segment_text else "",
-                            page_number=(segment_page_number if segment_page_number else 0),
-                            segment_number=(segment_segment_number if segment_segment_number else 0),
-                            type=segment_type if segment_type else "Text",
-                            source_id=segment_source_id if segment_source_id else "",
-                            bounding_box=Rectangle.from_width_height(
-                                left=(segment_bounding_box_left if segment_bounding_box_left else 0),
-                                top=(segment_bounding_box_top if segment_bounding_box_top else 0),
-                                width=(segment_bounding_box_width if segment_bounding_box_width else 0),
-                                height=(segment_bounding_box_height if segment_bounding_box_height else 0),
-                            ),
-                        )
-
-                    entity = NamedEntity(type=NamedEntityType.REFERENCE, text=ref_text, segment=segment)
-                    entity_dict = entity.model_dump()
-                    entity_dict["id"] = ref_id
-                    group.named_entities.append(entity_dict)
-
-                groups.append(group.model_dump())
-
-            connection.close()
-            return groups
+                rows = cursor.fetchall()
         except Exception as e:
             print(f"Error getting references: {e}")
             return []
 
+        return self.get_references_from_rows(rows)
+
+    @staticmethod
+    def get_references_from_rows(rows: list[tuple]) -> list:
+        from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+        from ner_in_docker.domain.NamedEntityType import NamedEntityType
+
+        empty_rectangle = Rectangle.from_width_height(left=0, top=0, width=0, height=0)
+        group_template = NamedEntityGroup(type=NamedEntityType.REFERENCE, name="").model_dump()
+        entity_template = NamedEntity(type=NamedEntityType.REFERENCE, text="").model_dump()
+        segment_template = Segment(text="", page_number=0, segment_number=0, bounding_box=empty_rectangle).model_dump()
+
+        groups = []
+        group_by_id = dict()
+        for row in rows:
+            destination_id, destination_name, reference_id = row[0], row[1], row[2]
+            if destination_id not in group_by_id:
+                group_by_id[destination_id] = {**group_template, "name": destination_name, "named_entities": []}
+                groups.append(group_by_id[destination_id])
+
+            if reference_id is None:
+                continue
+
+            (
+                segment_text,
+                segment_page_number,
+                segment_segment_number,
+                segment_type,
+                segment_source_id,
+                segment_bounding_box_left,
+                segment_bounding_box_top,
+                segment_bounding_box_width,
+                segment_bounding_box_height,
+            ) = row[4:]
+
+            segment = None
+            if segment_text is not None or segment_source_id is not None:
+                bounding_box = Rectangle.from_width_height(
+                    left=(segment_bounding_box_left if segment_bounding_box_left else 0),
+                    top=(segment_bounding_box_top if segment_bounding_box_top else 0),
+                    width=(segment_bounding_box_width if segment_bounding_box_width else 0),
+                    height=(segment_bounding_box_height if segment_bounding_box_height else 0),
+                )
+                segment = {
+                    **segment_template,
+                    "text": segment_text if segment_text else "",
+                    "page_number": segment_page_number if segment_page_number else 0,
+                    "segment_number": segment_segment_number if segment_segment_number else 0,
+                    "type": segment_type if segment_type else "Text",
+                    "source_id": segment_source_id if segment_source_id else "",
+                    "bounding_box": bounding_box.model_dump(),
+                }
+
+            entity = {**entity_template, "text": row[3], "segment": segment, "text_positions": [], "id": reference_id}
+            group_by_id[destination_id]["named_entities"].append(entity)
+
+        return groups
+
     def delete_reference(self, reference_id: int) -> bool:
         if not self.exists_schema():
             return False
 
         try:
-            connection, cursor = self.get_connection()
-            cursor.execute(
-                f"DELETE FROM {self.schema_name}.named_entities WHERE id = %s AND type = 'Reference'",
-                (reference_id,),
-            )
-            cursor.execute(
-                f"""
-                DELETE FROM {self.schema_name}.named_entities_group
-                WHERE id NOT IN (SELECT DISTINCT group_id FROM {self.schema_name}.named_entities WHERE type = 'Reference' AND group_id IS NOT NULL)
-            """
-            )
-            connection.commit()
-            connection.close()
+            with self.pool.transaction() as cursor:
+                cursor.execute(
+                    f"DELETE FROM {self.schema_name}.named_entities WHERE id = %s AND type = 'Reference'",
+                    (reference_id,),
+                )
+                cursor.execute(
+                    f"""
+                    DELETE FROM {self.schema_name}.named_entities_group
+                    WHERE id NOT IN (SELECT DISTINCT group_id FROM {self.schema_name}.named_entities WHERE type = 'Reference' AND group_id IS NOT NULL)
+                """
+                )
+                self.increase_namespace_version(cursor)
             return True
         except Exception as e:
             print(f"Error deleting reference: {e}")
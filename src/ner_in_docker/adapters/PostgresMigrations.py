@@ -0,0 +1,141 @@
+class PostgresMigrations:
+    MIGRATIONS: list[tuple[int, str, list[str]]] = [
+        (
+            1,
+            "create_tables",
+            [
+                """CREATE TABLE IF NOT EXISTS {schema}.named_entities_group (
+                    id SERIAL PRIMARY KEY,
+                    name TEXT UNIQUE NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )""",
+                """CREATE TABLE IF NOT EXISTS {schema}.segments (
+                    id SERIAL PRIMARY KEY,
+                    text TEXT,
+                    page_number INTEGER,
+                    segment_number INTEGER,
+                    type TEXT,
+                    source_id TEXT,
+                    bounding_box_left INTEGER,
+                    bounding_box_top INTEGER,
+                    bounding_box_width INTEGER,
+                    bounding_box_height INTEGER,
+                    page_width INTEGER,
+                    page_height INTEGER
+                )""",
+                """CREATE TABLE IF NOT EXISTS {schema}.named_entities (
+                    id SERIAL PRIMARY KEY,
+                    type TEXT NOT NULL,
+                    text TEXT,
+                    normalized_text TEXT,
+                    character_start INTEGER,
+                    character_end INTEGER,
+                    group_id INTEGER REFERENCES {schema}.named_entities_group(id),
+                    segment_id INTEGER REFERENCES {schema}.segments(id),
+                    appearance_count INTEGER,
+                    percentage_to_segment_text INTEGER,
+                    first_type_appearance BOOLEAN,
+                    last_type_appearance BOOLEAN,
+                    relevance_percentage INTEGER
+                )""",
+                """CREATE TABLE IF NOT EXISTS {schema}.identifiers (
+                    id SERIAL PRIMARY KEY,
+                    identifier TEXT UNIQUE NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )""",
+            ],
+        ),
+        (
+            2,
+            "add_segments_and_references_indexes",
+            [
+                """CREATE INDEX IF NOT EXISTS segments_key_index
+                ON {schema}.segments (source_id, page_number, segment_number)""",
+                "CREATE INDEX IF NOT EXISTS named_entities_segment_id_index ON {schema}.named_entities (segment_id)",
+                "CREATE INDEX IF NOT EXISTS named_entities_group_type_index ON {schema}.named_entities (group_id, type)",
+            ],
+        ),
+        (
+            3,
+            "add_namespace_version",
+            [
+                """CREATE TABLE IF NOT EXISTS {schema}.namespace_version (
+                    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+                    version BIGINT NOT NULL
+                )""",
+                """INSERT INTO {schema}.namespace_version (version)
+                VALUES ((EXTRACT(EPOCH FROM clock_timestamp()) * 1000000)::BIGINT) ON CONFLICT DO NOTHING""",
+            ],
+        ),
+        (
+            4,
+            "add_named_entities_group_name",
+            ["ALTER TABLE {schema}.named_entities ADD COLUMN IF NOT EXISTS group_name TEXT"],
+        ),
+        (
+            5,
+            "add_normalized_text_index",
+            [
+                """CREATE INDEX IF NOT EXISTS named_entities_normalized_text_type_index
+                ON {schema}.named_entities (normalized_text, type)"""
+            ],
+        ),
+        (
+            6,
+            "add_named_entities_source_id",
+            [
+                "ALTER TABLE {schema}.named_entities ADD COLUMN IF NOT EXISTS source_id TEXT",
+                """UPDATE {schema}.named_entities ne SET source_id = s.source_id
+                FROM {schema}.segments s WHERE s.id = ne.segment_id AND ne.source_id IS NULL""",
+                "CREATE INDEX IF NOT EXISTS named_entities_source_id_index ON {schema}.named_entities (source_id)",
+            ],
+        ),
+    ]
+
+    @staticmethod
+    def get_latest_version() -> int:
+        return max(version for version, _, _ in PostgresMigrations.MIGRATIONS)
+
+    @staticmethod
+    def get_applied_versions(cursor, schema_name: str) -> set[int]:
+        cursor.execute(f"SELECT version FROM {schema_name}.schema_migrations")
+        return {row[0] for row in cursor.fetchall()}
+
+    @staticmethod
+    def migrate(cursor, schema_name: str) -> list[int]:
+        cursor.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (schema_name,))
+        cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {schema_name}")
+        cursor.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {schema_name}.schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name TEXT NOT NULL,
+                applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """
+        )
+
+        applied_versions = PostgresMigrations.get_applied_versions(cursor, schema_name)
+        migrated_versions = list()
+        for version, name, statements in PostgresMigrations.MIGRATIONS:
+            if version in applied_versions:
+                continue
+
+            for statement in statements:
+                cursor.execute(statement.format(schema=schema_name))
+
+            cursor.execute(
+                f"INSERT INTO {schema_name}.schema_migrations (version, name) VALUES (%s, %s)",
+                (version, name),
+            )
+            migrated_versions.append(version)
+
+        return migrated_versions
+
+    @staticmethod
+    def get_namespace_schemas(cursor) -> list[str]:
+        cursor.execute(
+            """SELECT table_schema FROM information_schema.tables
+            WHERE table_name = 'named_entities' ORDER BY table_schema"""
+        )
+        return [row[0] for row in cursor.fetchall()]
@@ -1,9 +1,11 @@
+import random
 import sqlite3
 from pathlib import Path
 
 from ner_in_docker.adapters.EntityPersistence import EntityPersistence
 from ner_in_docker.configuration import ROOT_PATH
 from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.PriorEntity import PriorEntity
 from ner_in_docker.ports.EntitiesStoreRepository import EntitiesStoreRepository
 
 
@@ -61,6 +63,7 @@ class SQLiteEntitiesStoreRepository(EntitiesStoreRepository):
             )
             """
         )
+        cursor.execute(f"PRAGMA user_version = {random.randrange(1, 2**30)}")
         connection.commit()
         connection.close()
 
@@ -78,7 +81,25 @@ class SQLiteEntitiesStoreRepository(EntitiesStoreRepository):
         connection.close()
         return entities
 
+    def get_prior_entities(self) -> list[PriorEntity]:
+        if not self.exists_database():
+            return []
+
+        connection, cursor = self.get_connection()
+        cursor.execute(
+            """SELECT type, text, normalized_text, group_name, relevance_percentage, character_start, character_end,
+            segment_type, segment_source_id, segment_page_number, segment_segment_number, segment_text,
+            segment_bounding_box_left, segment_bounding_box_top, segment_bounding_box_width, segment_bounding_box_height
+            FROM named_entities ORDER BY id"""
+        )
+        prior_entities = [PriorEntity._make(row) for row in cursor]
+        connection.close()
+        return prior_entities
+
     def save_entities(self, named_entities: list[NamedEntity]) -> bool:
+        return self.save_documents_entities(named_entities, [])
+
+    def save_documents_entities(self, named_entities: list[NamedEntity], identifiers: list[str]) -> bool:
         if not self.exists_database():
             self.create_database()
         try:
@@ -88,7 +109,6 @@ class SQLiteEntitiesStoreRepository(EntitiesStoreRepository):
                 "DELETE FROM named_entities WHERE segment_source_id IN ({})".format(", ".join("?" for _ in source_ids)),
                 tuple(source_ids),
             )
-            connection.commit()
 
             for entity in named_entities:
                 persistence = EntityPersistence.from_named_entity(entity)
@@ -124,6 +144,10 @@ class SQLiteEntitiesStoreRepository(EntitiesStoreRepository):
                         persistence.relevance_percentage,
                     ),
                 )
+
+            for identifier in identifiers:
+                cursor.execute("INSERT OR IGNORE INTO identifiers (identifier) VALUES (?)", (identifier,))
+            self.increase_namespace_version(cursor)
             connection.commit()
             connection.close()
             return True
@@ -131,6 +155,21 @@ class SQLiteEntitiesStoreRepository(EntitiesStoreRepository):
             print(f"Error saving entities: {e}")
             return False
 
+    def get_namespace_version(self) -> int:
+        if not self.exists_database():
+            return 0
+
+        connection, cursor = self.get_connection()
+        cursor.execute("PRAGMA user_version")
+        namespace_version = cursor.fetchone()[0]
+        connection.close()
+        return namespace_version
+
+    @staticmethod
+    def increase_namespace_version(cursor):
+        cursor.execute("PRAGMA user_version")
+        cursor.execute(f"PRAGMA user_version = {cursor.fetchone()[0] + 1}")
+
     def delete_database(self):
         Path(ROOT_PATH, "data", self.database_name).unlink(missing_ok=True)
 
@@ -0,0 +1,172 @@
+import shutil
+import sqlite3
+import time
+from pathlib import Path
+
+from ner_in_docker.configuration import DATA_PATH
+from ner_in_docker.domain.ExtractionJob import ExtractionJob
+from ner_in_docker.domain.ExtractionJobStatus import ExtractionJobStatus
+from ner_in_docker.ports.JobsRepository import JobsRepository
+
+
+class SQLiteJobsRepository(JobsRepository):
+    COLUMNS = [
+        "job_id",
+        "status",
+        "stage",
+        "progress_percentage",
+        "namespace",
+        "identifier",
+        "language",
+        "fast",
+        "use_llm",
+        "file_name",
+        "error",
+        "worker_pid",
+        "lease_expires_at",
+        "created_at",
+        "updated_at",
+    ]
+
+    def __init__(self, jobs_path: Path = Path(DATA_PATH, "jobs")):
+        self.jobs_path = jobs_path
+        self.database_path = Path(jobs_path, "jobs.db")
+        self.created = False
+
+    def get_connection(self) -> sqlite3.Connection:
+        if not self.created:
+            self.create_database()
+
+        return sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+
+    def create_database(self):
+        self.jobs_path.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.database_path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                stage TEXT,
+                progress_percentage INTEGER,
+                namespace TEXT,
+                identifier TEXT,
+                language TEXT,
+                fast BOOLEAN,
+                use_llm BOOLEAN,
+                file_name TEXT,
+                error TEXT,
+                worker_pid INTEGER,
+                lease_expires_at REAL,
+                created_at REAL,
+                updated_at REAL,
+                result TEXT
+            )
+            """
+        )
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(jobs)")]
+        if "lease_expires_at" not in columns:
+            connection.execute("ALTER TABLE jobs ADD COLUMN lease_expires_at REAL")
+        connection.execute("CREATE INDEX IF NOT EXISTS jobs_status_created_at ON jobs (status, created_at)")
+        connection.close()
+        self.created = True
+
+    @staticmethod
+    def get_job_from_row(row: tuple) -> ExtractionJob:
+        return ExtractionJob(**dict(zip(SQLiteJobsRepository.COLUMNS, row)))
+
+    def get_job_values(self, job: ExtractionJob) -> list:
+        job_dict = job.model_dump()
+        return [job_dict[column] for column in self.COLUMNS]
+
+    def create_job(self, job: ExtractionJob, pdf_content: bytes):
+        connection = self.get_connection()
+        pdf_path = self.get_pdf_path(job)
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        pdf_path.write_bytes(pdf_content)
+        placeholders = ", ".join(["?"] * len(self.COLUMNS))
+        connection.execute(f"INSERT INTO jobs ({', '.join(self.COLUMNS)}) VALUES ({placeholders})", self.get_job_values(job))
+        connection.close()
+
+    def get_job(self, job_id: str) -> ExtractionJob | None:
+        connection = self.get_connection()
+        row = connection.execute(f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        connection.close()
+        return self.get_job_from_row(row) if row else None
+
+    def update_job(self, job: ExtractionJob):
+        connection = self.get_connection()
+        assignments = ", ".join([f"{column} = ?" for column in self.COLUMNS[1:]])
+        connection.execute(f"UPDATE jobs SET {assignments} WHERE job_id = ?", self.get_job_values(job)[1:] + [job.job_id])
+        connection.close()
+
+    def claim_next_job(self, worker_pid: int, lease_seconds: float) -> ExtractionJob | None:
+        connection = self.get_connection()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                (ExtractionJobStatus.QUEUED.value,),
+            ).fetchone()
+            if not row:
+                connection.execute("COMMIT")
+                return None
+
+            job = self.get_job_from_row(row)
+            job.status = ExtractionJobStatus.RUNNING
+            job.worker_pid = worker_pid
+            job.updated_at = time.time()
+            job.renew_lease(lease_seconds)
+            connection.execute(
+                "UPDATE jobs SET status = ?, worker_pid = ?, lease_expires_at = ?, updated_at = ? WHERE job_id = ?",
+                (job.status.value, job.worker_pid, job.lease_expires_at, job.updated_at, job.job_id),
+            )
+            connection.execute("COMMIT")
+            return job
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            connection.close()
+
+    def renew_lease(self, job: ExtractionJob, lease_seconds: float):
+        job.renew_lease(lease_seconds)
+        connection = self.get_connection()
+        connection.execute(
+            "UPDATE jobs SET lease_expires_at = ? WHERE job_id = ? AND status = ?",
+            (job.lease_expires_at, job.job_id, ExtractionJobStatus.RUNNING.value),
+        )
+        connection.close()
+
+    def requeue_abandoned_jobs(self) -> int:
+        connection = self.get_connection()
+        now = time.time()
+        cursor = connection.execute(
+            """
+            UPDATE jobs SET status = ?, worker_pid = NULL, lease_expires_at = NULL, updated_at = ?
+            WHERE status = ? AND (lease_expires_at IS NULL OR lease_expires_at < ?)
+            """,
+            (ExtractionJobStatus.QUEUED.value, now, ExtractionJobStatus.RUNNING.value, now),
+        )
+        connection.close()
+        return cursor.rowcount
+
+    def get_pdf_path(self, job: ExtractionJob) -> Path:
+        return Path(self.jobs_path, job.job_id, job.file_name)
+
+    def finish_job(self, job: ExtractionJob, result: str | None):
+        connection = self.get_connection()
+        assignments = ", ".join([f"{column} = ?" for column in self.COLUMNS[1:]])
+        connection.execute(
+            f"UPDATE jobs SET {assignments}, result = ? WHERE job_id = ?",
+            self.get_job_values(job)[1:] + [result, job.job_id],
+        )
+        connection.close()
+        shutil.rmtree(self.get_pdf_path(job).parent, ignore_errors=True)
+
+    def get_result(self, job_id: str) -> str | None:
+        connection = self.get_connection()
+        row = connection.execute("SELECT result FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        connection.close()
+        return row[0] if row else None
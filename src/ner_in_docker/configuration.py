@@ -10,3 +10,28 @@ SEPARATOR = " ||| "
 PDF_ANALYSIS_SERVICE_URL = "http://pdf-layout-analysis:5060"
 OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "gpt-oss:120b-cloud")
+FLAIR_MAX_BATCH_SIZE = int(os.getenv("FLAIR_MAX_BATCH_SIZE", "32"))
+FLAIR_MAX_WAIT_MILLISECONDS = int(os.getenv("FLAIR_MAX_WAIT_MILLISECONDS", "10"))
+TEXT_PIPELINE_WORKERS = int(os.getenv("TEXT_PIPELINE_WORKERS", "4"))
+TEXT_PIPELINE_QUEUE_SIZE = int(os.getenv("TEXT_PIPELINE_QUEUE_SIZE", "32"))
+PDF_PIPELINE_WORKERS = int(os.getenv("PDF_PIPELINE_WORKERS", "2"))
+PDF_PIPELINE_QUEUE_SIZE = int(os.getenv("PDF_PIPELINE_QUEUE_SIZE", "8"))
+JOBS_WORKERS = int(os.getenv("JOBS_WORKERS", "1"))
+JOBS_POLL_SECONDS = float(os.getenv("JOBS_POLL_SECONDS", "2"))
+JOBS_MAX_WAIT_SECONDS = float(os.getenv("JOBS_MAX_WAIT_SECONDS", "60"))
+JOBS_LEASE_SECONDS = float(os.getenv("JOBS_LEASE_SECONDS", "60"))
+PRIOR_GROUPS_INDEX_MAX_NAMESPACES = int(os.getenv("PRIOR_GROUPS_INDEX_MAX_NAMESPACES", "16"))
+BATCH_LAYOUT_CONCURRENCY = int(os.getenv("BATCH_LAYOUT_CONCURRENCY", "4"))
+BATCH_INFERENCE_SEGMENTS = int(os.getenv("BATCH_INFERENCE_SEGMENTS", "256"))
+STREAM_SEGMENTS_CHUNK_SIZE = int(os.getenv("STREAM_SEGMENTS_CHUNK_SIZE", "16"))
+PDF_ANALYSIS_MAX_CONCURRENCY = int(os.getenv("PDF_ANALYSIS_MAX_CONCURRENCY", "4"))
+PDF_ANALYSIS_CONNECT_TIMEOUT_SECONDS = float(os.getenv("PDF_ANALYSIS_CONNECT_TIMEOUT_SECONDS", "10"))
+PDF_ANALYSIS_TIMEOUT_SECONDS = float(os.getenv("PDF_ANALYSIS_TIMEOUT_SECONDS", "900"))
+PDF_ANALYSIS_RETRIES = int(os.getenv("PDF_ANALYSIS_RETRIES", "2"))
+PDF_ANALYSIS_BACKOFF_SECONDS = float(os.getenv("PDF_ANALYSIS_BACKOFF_SECONDS", "0.5"))
+LAYOUT_CACHE_PATH = Path(os.getenv("LAYOUT_CACHE_PATH", str(Path(DATA_PATH, "layout_cache"))))
+LAYOUT_CACHE_MAX_MEGABYTES = float(os.getenv("LAYOUT_CACHE_MAX_MEGABYTES", "1024"))
+POSTGRES_POOL_MIN_CONNECTIONS = int(os.getenv("POSTGRES_POOL_MIN_CONNECTIONS", "1"))
+POSTGRES_POOL_MAX_CONNECTIONS = int(os.getenv("POSTGRES_POOL_MAX_CONNECTIONS", "10"))
+POSTGRES_POOL_TIMEOUT_SECONDS = float(os.getenv("POSTGRES_POOL_TIMEOUT_SECONDS", "30"))
+POSTGRES_POOL_HEALTH_CHECK_SECONDS = float(os.getenv("POSTGRES_POOL_HEALTH_CHECK_SECONDS", "30"))
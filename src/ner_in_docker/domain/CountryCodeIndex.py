@@ -0,0 +1,47 @@
+import logging
+import re
+from functools import lru_cache
+
+import country_converter as coco
+
+logging.getLogger("country_converter").setLevel(logging.ERROR)
+
+
+class CountryCodeIndex:
+    NOT_FOUND = "not found"
+    NAME_COLUMNS = ["name_short", "name_official"]
+    EXCLUDE_PREFIXES = ["excl\\w.*", "without", "w/o"]
+    CACHE_SIZE = 8192
+
+    def __init__(self):
+        self.converter = coco.CountryConverter()
+        self.iso3_by_name: dict[str, str] = self._get_iso3_by_name()
+        self.convert = lru_cache(maxsize=self.CACHE_SIZE)(self._convert)
+
+    def _get_iso3_by_name(self) -> dict[str, str]:
+        excluder = re.compile("|".join(self.EXCLUDE_PREFIXES))
+        iso3_codes = self.converter.data["ISO3"].tolist()
+        iso3_by_name = dict()
+        for column in self.NAME_COLUMNS:
+            for name in self.converter.data[column].dropna().astype(str):
+                if len(name) <= 3 or name.isdigit() or excluder.search(name):
+                    continue
+
+                matches = [iso3 for regex, iso3 in zip(self.converter.regexes, iso3_codes) if regex.search(name)]
+                if len(matches) == 1:
+                    iso3_by_name[name.lower()] = matches[0]
+
+        return iso3_by_name
+
+    def _convert(self, text: str) -> str | list[str]:
+        return self.converter.convert(names=[text], to="ISO3", not_found=self.NOT_FOUND)
+
+    def to_iso3(self, text: str) -> str | list[str]:
+        iso3 = self.iso3_by_name.get(text.lower())
+        return iso3 if iso3 else self.convert(text)
+
+    def has_iso3(self, text: str) -> bool:
+        return self.to_iso3(text) != self.NOT_FOUND
+
+
+country_code_index = CountryCodeIndex()
@@ -0,0 +1,68 @@
+import time
+import uuid
+from pathlib import Path
+from typing import ClassVar
+
+from pydantic import BaseModel
+
+from ner_in_docker.domain.ExtractionJobStatus import ExtractionJobStatus
+
+
+class ExtractionJob(BaseModel):
+    STAGES: ClassVar[tuple[str, ...]] = ("layout", "entities", "references", "positions", "grouping", "saving")
+
+    job_id: str
+    status: ExtractionJobStatus = ExtractionJobStatus.QUEUED
+    stage: str = ""
+    progress_percentage: int = 0
+    namespace: str | None = None
+    identifier: str | None = None
+    language: str = "en"
+    fast: bool = False
+    use_llm: bool = False
+    file_name: str = ""
+    error: str = ""
+    worker_pid: int | None = None
+    lease_expires_at: float | None = None
+    created_at: float = 0
+    updated_at: float = 0
+
+    @staticmethod
+    def from_request(
+        file_name: str, namespace: str | None, identifier: str | None, language: str, fast: bool, use_llm: bool
+    ) -> "ExtractionJob":
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        return ExtractionJob(
+            job_id=job_id,
+            namespace=namespace,
+            identifier=identifier,
+            language=language,
+            fast=fast,
+            use_llm=use_llm,
+            file_name=Path(file_name).name if file_name else f"{job_id}.pdf",
+            created_at=now,
+            updated_at=now,
+        )
+
+    def set_stage(self, stage: str):
+        self.stage = stage
+        self.progress_percentage = int(100 * self.STAGES.index(stage) / len(self.STAGES))
+        self.updated_at = time.time()
+
+    def renew_lease(self, lease_seconds: float):
+        self.lease_expires_at = time.time() + lease_seconds
+
+    def set_done(self):
+        self.status = ExtractionJobStatus.DONE
+        self.stage = ""
+        self.progress_percentage = 100
+        self.updated_at = time.time()
+
+    def set_failed(self, error: str):
+        self.status = ExtractionJobStatus.FAILED
+        self.error = error
+        self.updated_at = time.time()
+
+    def to_status_dict(self) -> dict:
+        return self.model_dump(exclude={"worker_pid", "lease_expires_at"}, mode="json")
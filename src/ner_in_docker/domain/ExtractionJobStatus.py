@@ -0,0 +1,11 @@
+from enum import StrEnum
+
+
+class ExtractionJobStatus(StrEnum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    DONE = "DONE"
+    FAILED = "FAILED"
+
+    def is_finished(self) -> bool:
+        return self in [ExtractionJobStatus.DONE, ExtractionJobStatus.FAILED]
@@ -1,3 +1,4 @@
+from collections import Counter
 from typing import Optional
 from dateparser.search import search_dates
 from dateparser_data.settings import default_parsers
@@ -7,15 +8,12 @@ from pdf_token_type_labels import TokenType
 from pydantic import BaseModel
 from unidecode import unidecode
 import dateparser
-import logging
 
 from ner_in_docker.configuration import TITLES_TYPES, SEPARATOR
+from ner_in_docker.domain.CountryCodeIndex import country_code_index
 from ner_in_docker.domain.NamedEntityType import NamedEntityType
-import country_converter as coco
 from ner_in_docker.domain.Segment import Segment
 
-logging.getLogger("country_converter").setLevel(logging.ERROR)
-
 
 class NamedEntity(BaseModel):
     type: NamedEntityType
@@ -53,8 +51,8 @@ class NamedEntity(BaseModel):
         return text.split(SEPARATOR)[0].strip()
 
     def normalize_location(self, text):
-        iso_3 = coco.convert(names=[text], to="ISO3")
-        return iso_3 if iso_3 != "not found" else self.normalize_text(text)
+        iso_3 = country_code_index.to_iso3(text)
+        return iso_3 if iso_3 != country_code_index.NOT_FOUND else self.normalize_text(text)
 
     def normalize_date(self, text, language: str = "en"):
         if self.normalized_text:
@@ -86,7 +84,67 @@ class NamedEntity(BaseModel):
 
     def set_relevance_score(self, named_entities: list["NamedEntity"]):
         self.set_score_parameters(named_entities)
+        return self.add_relevance_percentage()
+
+    @staticmethod
+    def set_relevance_scores(named_entities: list["NamedEntity"]) -> list["NamedEntity"]:
+        appearance_counts = Counter((x.type, x.text) for x in named_entities)
+        first_text_by_type: dict[NamedEntityType, str] = dict()
+        last_text_by_type: dict[NamedEntityType, str] = dict()
+        for named_entity in named_entities:
+            first_text_by_type.setdefault(named_entity.type, named_entity.text)
+            last_text_by_type[named_entity.type] = named_entity.text
+
+        for named_entity in named_entities:
+            named_entity.appearance_count = appearance_counts[(named_entity.type, named_entity.text)]
+            named_entity.set_percentage_to_segment_text()
+            named_entity.first_type_appearance = first_text_by_type[named_entity.type] == named_entity.text
+            named_entity.last_type_appearance = last_text_by_type[named_entity.type] == named_entity.text
+            named_entity.add_relevance_percentage()
+
+        return named_entities
+
+    @staticmethod
+    def remove_overlapping_entities(named_entities: list["NamedEntity"]) -> list["NamedEntity"]:
+        sorted_entities = sorted(named_entities, key=lambda x: (x.character_start, -len(x.text)))
+        result = []
+        last_end = -1
+        for named_entity in sorted_entities:
+            if named_entity.character_start >= last_end:
+                result.append(named_entity)
+                last_end = named_entity.character_end
+        return result
 
+    @staticmethod
+    def remove_overlapping_references(named_entities: list["NamedEntity"]) -> list["NamedEntity"]:
+        references = [x for x in named_entities if x.type == NamedEntityType.REFERENCE]
+        ordered_references = sorted(
+            references,
+            key=lambda x: (x.segment.source_id, x.segment.page_number, x.segment.segment_number, x.character_start),
+        )
+
+        removed_ids = set()
+        for reference, next_reference in zip(ordered_references, ordered_references[1:]):
+            if not reference.is_in_same_segment(next_reference):
+                continue
+            if reference.character_end <= next_reference.character_start:
+                continue
+            if len(reference.text) > len(next_reference.text):
+                removed_ids.add(id(next_reference))
+            else:
+                removed_ids.add(id(reference))
+
+        named_entities[:] = [x for x in named_entities if id(x) not in removed_ids]
+        return named_entities
+
+    def is_in_same_segment(self, other: "NamedEntity") -> bool:
+        if self.segment.source_id != other.segment.source_id:
+            return False
+        if self.segment.page_number != other.segment.page_number:
+            return False
+        return self.segment.segment_number == other.segment.segment_number
+
+    def add_relevance_percentage(self):
         if self.type == NamedEntityType.REFERENCE:
             self.relevance_percentage = 100 if str(self.segment_type).lower() in TITLES_TYPES else 0
             return self
@@ -105,14 +163,17 @@ class NamedEntity(BaseModel):
 
         return self
 
-    def set_score_parameters(self, named_entities):
-        # Set appearance_count
-        self.appearance_count = sum(1 for ne in named_entities if ne.type == self.type and ne.text == self.text)
-        # Set percentage_to_segment_text
+    def set_percentage_to_segment_text(self):
         if self.segment and hasattr(self.segment, "text") and self.segment.text:
             self.percentage_to_segment_text = int(100 * len(self.text) / len(self.segment.text))
         else:
             self.percentage_to_segment_text = 0
+
+    def set_score_parameters(self, named_entities):
+        # Set appearance_count
+        self.appearance_count = sum(1 for ne in named_entities if ne.type == self.type and ne.text == self.text)
+        # Set percentage_to_segment_text
+        self.set_percentage_to_segment_text()
         # Set first_type_appearance and last_type_appearance
         same_type_entities = [ne for ne in named_entities if ne.type == self.type]
         if same_type_entities:
@@ -137,5 +198,4 @@ class NamedEntity(BaseModel):
         if self.type != NamedEntityType.LOCATION:
             return True
 
-        iso_3 = coco.convert(names=[self.text], to="ISO3")
-        return iso_3 != "not found"
+        return country_code_index.has_iso3(self.text)
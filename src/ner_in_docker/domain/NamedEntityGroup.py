@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from ner_in_docker.domain.NamedEntityType import NamedEntityType
-from rapidfuzz import fuzz
+from ner_in_docker.domain.SimilarTextsMatrix import SimilarTextsMatrix
 
 from ner_in_docker.domain.NamedEntity import NamedEntity
 import re
@@ -21,17 +21,27 @@ class NamedEntityGroup(BaseModel):
     def is_exact_match(self, named_entity: NamedEntity) -> bool:
         return self.name == named_entity.normalized_text
 
-    def is_similar_entity(self, named_entity: NamedEntity) -> bool:
+    def is_similar_entity(
+        self,
+        named_entity: NamedEntity,
+        candidate_texts: set[str] | None = None,
+        similar_texts: SimilarTextsMatrix | None = None,
+    ) -> bool:
         normalized_entity = named_entity.get_with_normalize_entity_text()
         entity_normalized_text = normalized_entity.normalized_text
 
-        for each_normalized_text in [x.normalized_text for x in self.named_entities]:
+        if candidate_texts is None:
+            candidate_texts = [x.normalized_text for x in self.named_entities]
+
+        similar_text = similar_texts.is_similar if similar_texts else self.similar_text
+
+        for each_normalized_text in candidate_texts:
             if self.type in [NamedEntityType.LOCATION, NamedEntityType.PERSON, NamedEntityType.ORGANIZATION]:
                 if entity_normalized_text in each_normalized_text or each_normalized_text in entity_normalized_text:
                     return True
             if self.equal_but_less_words(entity_normalized_text, each_normalized_text):
                 return True
-            if self.similar_text(each_normalized_text, entity_normalized_text):
+            if similar_text(each_normalized_text, entity_normalized_text):
                 return True
             if self.is_abbreviation(each_normalized_text, entity_normalized_text):
                 return True
@@ -90,17 +100,17 @@ class NamedEntityGroup(BaseModel):
 
     @staticmethod
     def similar_text(text: str, other_text: str):
-        if abs(len(text) - len(other_text)) > 1:
-            return False
-
-        length = max(len(text), len(other_text))
-        threshold = 100 * (length - 1) / length if length > 10 else 100
-        return fuzz.ratio(text, other_text) >= threshold
-
-    def belongs_to_group(self, named_entity: NamedEntity) -> bool:
+        return SimilarTextsMatrix.similar_text(text, other_text)
+
+    def belongs_to_group(
+        self,
+        named_entity: NamedEntity,
+        candidate_texts: set[str] | None = None,
+        similar_texts: SimilarTextsMatrix | None = None,
+    ) -> bool:
         # Use similarity logic for PERSON, LOCATION, ORGANIZATION
         if self.type in [NamedEntityType.PERSON, NamedEntityType.LOCATION, NamedEntityType.ORGANIZATION]:
-            return self.is_similar_entity(named_entity)
+            return self.is_similar_entity(named_entity, candidate_texts, similar_texts)
         return self.is_exact_match(named_entity)
 
     def is_same_group(self, other_group: "NamedEntityGroup") -> bool:
@@ -124,16 +134,8 @@ class NamedEntityGroup(BaseModel):
 
         self.named_entities.append(named_entity.get_with_normalize_entity_text())
 
-    def get_references_in_text(self, text: str) -> list[tuple[int, int]]:
-        if self.type != NamedEntityType.REFERENCE:
-            return []
-
+    def get_reference_search_patterns(self) -> set[str]:
         original_name = self.name.strip()
-        stripped_text = text.strip()
-
-        if not original_name or not stripped_text:
-            return []
-
         search_patterns = set()
         search_patterns.add(original_name)
 
@@ -157,6 +159,20 @@ class NamedEntityGroup(BaseModel):
             if title_part:
                 search_patterns.add(title_part)
 
+        return search_patterns
+
+    def get_references_in_text(self, text: str) -> list[tuple[int, int]]:
+        if self.type != NamedEntityType.REFERENCE:
+            return []
+
+        original_name = self.name.strip()
+        stripped_text = text.strip()
+
+        if not original_name or not stripped_text:
+            return []
+
+        search_patterns = self.get_reference_search_patterns()
+
         matches = []
 
         for pattern_text in search_patterns:
@@ -0,0 +1,160 @@
+from collections import Counter, defaultdict
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.SimilarTextsMatrix import SimilarTextsMatrix
+
+
+class NamedEntityGroupIndex:
+    SIMILARITY_TYPES = [NamedEntityType.PERSON, NamedEntityType.LOCATION, NamedEntityType.ORGANIZATION]
+    NGRAM_SIZE = 3
+    MIN_WORDS_TEXT_LENGTH = 4
+    MIN_FUZZY_TEXT_LENGTH = SimilarTextsMatrix.EXACT_MATCH_MAX_LENGTH
+
+    def __init__(self):
+        self.groups: dict[str, NamedEntityGroup] = dict()
+        self.sequences: dict[str, int | tuple] = dict()
+        self.next_sequence = 0
+        self.texts_by_name: dict[str, set[str]] = dict()
+        self.names_by_text: dict[str, set[str]] = defaultdict(set)
+        self.indexed_texts: set[str] = set()
+        self.short_texts: set[str] = set()
+        self.texts_by_ngram: dict[str, set[str]] = defaultdict(set)
+        self.first_ngrams: set[str] = set()
+        self.texts_by_word: dict[str, set[str]] = defaultdict(set)
+        self.texts_by_deletion_key: dict[int, set[str]] = defaultdict(set)
+        self.texts_by_initials: dict[str, set[str]] = defaultdict(set)
+        self.abbreviated_texts_by_initials: dict[str, set[str]] = defaultdict(set)
+
+    @staticmethod
+    def get_ngrams(text: str) -> set[str]:
+        size = NamedEntityGroupIndex.NGRAM_SIZE
+        return {text[index : index + size] for index in range(len(text) - size + 1)}
+
+    @staticmethod
+    def get_deletion_keys(text: str) -> set[int]:
+        # similar_text accepts at most one deletion and one insertion, so similar texts share the shorter
+        # text or one of its single-deletion variants
+        if len(text) < NamedEntityGroupIndex.MIN_FUZZY_TEXT_LENGTH:
+            return set()
+
+        keys = {hash(text)}
+        if len(text) > NamedEntityGroupIndex.MIN_FUZZY_TEXT_LENGTH:
+            keys.update(hash(text[:index] + text[index + 1 :]) for index in range(len(text)))
+        return keys
+
+    @staticmethod
+    def get_initials(text: str) -> str:
+        return "".join([word[0] for word in text.split()])
+
+    @staticmethod
+    def is_abbreviated(text: str) -> bool:
+        return any(len(word) == 1 for word in text.split())
+
+    def set_group(self, name: str, group: NamedEntityGroup, sequence: int | tuple | None = None):
+        if name in self.groups:
+            self._remove_texts(name)
+        elif sequence is None:
+            sequence = self.next_sequence
+            self.next_sequence += 1
+
+        if sequence is not None:
+            self.sequences[name] = sequence
+
+        self.groups[name] = group
+        if group.type not in self.SIMILARITY_TYPES:
+            return
+
+        self.texts_by_name[name] = set()
+        for named_entity in group.named_entities:
+            self._add_text(name, named_entity.normalized_text)
+
+    def delete_group(self, name: str):
+        if name not in self.groups:
+            return
+
+        self._remove_texts(name)
+        del self.groups[name]
+        del self.sequences[name]
+
+    def add_named_entity(self, name: str, named_entity: NamedEntity):
+        if name in self.texts_by_name:
+            self._add_text(name, named_entity.normalized_text)
+
+    def get_candidates(self, named_entity: NamedEntity) -> list[tuple[NamedEntityGroup, set[str] | None]]:
+        text = named_entity.normalized_text
+        candidate_texts_by_name: dict[str, set[str] | None] = dict()
+
+        if text in self.groups and text not in self.texts_by_name:
+            candidate_texts_by_name[text] = None
+
+        for candidate_text in self.get_candidate_texts(text):
+            for name in self.names_by_text.get(candidate_text, ()):
+                candidate_texts_by_name.setdefault(name, set()).add(candidate_text)
+
+        names = sorted(candidate_texts_by_name, key=lambda x: self.sequences[x])
+        return [(self.groups[name], candidate_texts_by_name[name]) for name in names]
+
+    def get_candidate_texts(self, text: str) -> set[str]:
+        if len(text) < self.NGRAM_SIZE:
+            return self.indexed_texts
+
+        candidate_texts = set(self.short_texts)
+
+        for start in range(len(text) - self.NGRAM_SIZE + 1):
+            if text[start : start + self.NGRAM_SIZE] not in self.first_ngrams:
+                continue
+            for end in range(start + self.NGRAM_SIZE, len(text) + 1):
+                if text[start:end] in self.indexed_texts:
+                    candidate_texts.add(text[start:end])
+
+        ngrams_texts = sorted([self.texts_by_ngram.get(x, set()) for x in self.get_ngrams(text)], key=len)
+        containing_texts = ngrams_texts[0]
+        for ngram_texts in ngrams_texts[1:]:
+            if not containing_texts:
+                break
+            containing_texts = containing_texts & ngram_texts
+        candidate_texts.update(containing_texts)
+
+        for key in self.get_deletion_keys(text):
+            candidate_texts.update(self.texts_by_deletion_key.get(key, ()))
+
+        if len(text) < self.MIN_WORDS_TEXT_LENGTH:
+            return candidate_texts
+
+        texts_by_initials = self.texts_by_initials if self.is_abbreviated(text) else self.abbreviated_texts_by_initials
+        candidate_texts.update(texts_by_initials.get(self.get_initials(text), ()))
+        shared_words_count = Counter()
+        for word in text.split():
+            shared_words_count.update(self.texts_by_word.get(word, ()))
+
+        candidate_texts.update([x for x, count in shared_words_count.items() if count > 1])
+        return candidate_texts
+
+    def _add_text(self, name: str, text: str):
+        self.texts_by_name[name].add(text)
+        self.names_by_text[text].add(name)
+
+        if text in self.indexed_texts:
+            return
+
+        self.indexed_texts.add(text)
+        if len(text) < self.NGRAM_SIZE:
+            self.short_texts.add(text)
+        else:
+            self.first_ngrams.add(text[: self.NGRAM_SIZE])
+
+        for ngram in self.get_ngrams(text):
+            self.texts_by_ngram[ngram].add(text)
+        for word in set(text.split()):
+            self.texts_by_word[word].add(text)
+        for key in self.get_deletion_keys(text):
+            self.texts_by_deletion_key[key].add(text)
+        self.texts_by_initials[self.get_initials(text)].add(text)
+        if self.is_abbreviated(text):
+            self.abbreviated_texts_by_initials[self.get_initials(text)].add(text)
+
+    def _remove_texts(self, name: str):
+        for text in self.texts_by_name.pop(name, set()):
+            self.names_by_text[text].discard(name)
@@ -0,0 +1,55 @@
+from typing import NamedTuple
+
+from pdf_features import Rectangle
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.Segment import Segment
+
+
+class PriorEntity(NamedTuple):
+    type: str
+    text: str
+    normalized_text: str
+    group_name: str
+    relevance_percentage: int
+    character_start: int
+    character_end: int
+    segment_type: str
+    source_id: str
+    page_number: int
+    segment_number: int
+    segment_text: str = ""
+    bounding_box_left: int = 0
+    bounding_box_top: int = 0
+    bounding_box_width: int = 0
+    bounding_box_height: int = 0
+
+    def get_segment_key(self) -> tuple:
+        return self.source_id, self.page_number, self.segment_number, self.segment_type
+
+    def to_segment(self) -> Segment:
+        return Segment(
+            text=self.segment_text or "",
+            page_number=self.page_number or 0,
+            segment_number=self.segment_number or 0,
+            type=self.segment_type or "Text",
+            source_id=self.source_id or "",
+            bounding_box=Rectangle.from_width_height(
+                left=self.bounding_box_left or 0,
+                top=self.bounding_box_top or 0,
+                width=self.bounding_box_width or 0,
+                height=self.bounding_box_height or 0,
+            ),
+        )
+
+    def to_named_entity(self, segment: Segment | None = None) -> NamedEntity:
+        return NamedEntity(
+            type=self.type,
+            text=self.text or "",
+            normalized_text=self.normalized_text or "",
+            character_start=self.character_start or 0,
+            character_end=self.character_end or 0,
+            group_name=self.group_name or "",
+            segment=segment if segment else self.to_segment(),
+            relevance_percentage=self.relevance_percentage or 0,
+        )
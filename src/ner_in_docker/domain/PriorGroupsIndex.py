@@ -0,0 +1,110 @@
+import threading
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityGroupIndex import NamedEntityGroupIndex
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.PriorEntity import PriorEntity
+from ner_in_docker.domain.ReferencesMatcher import ReferencesMatcher
+
+
+class PriorGroupsIndex:
+    def __init__(self):
+        self.entities: list[NamedEntity] = list()
+        self.groups_index = NamedEntityGroupIndex()
+        self.lock = threading.RLock()
+        self.namespace_version: int | None = None
+        self.reference_destinations: list[NamedEntityGroup] | None = None
+        self.references_matcher: ReferencesMatcher | None = None
+
+    @staticmethod
+    def from_entities(named_entities: list[NamedEntity]) -> "PriorGroupsIndex":
+        prior_groups_index = PriorGroupsIndex()
+        prior_groups_index.add_entities(named_entities)
+        return prior_groups_index
+
+    @staticmethod
+    def from_prior_entities(prior_entities: list[PriorEntity]) -> "PriorGroupsIndex":
+        segments = dict()
+        named_entities = list()
+        for prior_entity in prior_entities:
+            segment_key = prior_entity.get_segment_key()
+            if segment_key not in segments:
+                segments[segment_key] = prior_entity.to_segment()
+            named_entities.append(prior_entity.to_named_entity(segments[segment_key]))
+
+        return PriorGroupsIndex.from_entities(named_entities)
+
+    def get_entities(self) -> list[NamedEntity]:
+        with self.lock:
+            return list(self.entities)
+
+    def get_groups(self) -> list[NamedEntityGroup]:
+        with self.lock:
+            names = sorted(self.groups_index.groups, key=lambda x: self.groups_index.sequences[x])
+            return [self.groups_index.groups[name] for name in names]
+
+    @staticmethod
+    def get_reference_destinations_from_entities(named_entities: list[NamedEntity]) -> list[NamedEntityGroup]:
+        return [
+            NamedEntityGroup(type=NamedEntityType.REFERENCE, name=entity.text)
+            for entity in named_entities
+            if entity.type == NamedEntityType.REFERENCE and entity.relevance_percentage == 100
+        ]
+
+    def get_reference_destinations(self) -> list[NamedEntityGroup]:
+        with self.lock:
+            if self.reference_destinations is None:
+                self.reference_destinations = self.get_reference_destinations_from_entities(self.entities)
+            return list(self.reference_destinations)
+
+    def get_references_matcher(self) -> ReferencesMatcher:
+        with self.lock:
+            if self.references_matcher is None:
+                self.references_matcher = ReferencesMatcher(self.get_reference_destinations())
+            return self.references_matcher
+
+    def get_candidates(self, named_entity: NamedEntity) -> list[tuple[NamedEntityGroup, set[str] | None]]:
+        return self.groups_index.get_candidates(named_entity)
+
+    def get_candidate_texts(self, text: str) -> set[str]:
+        return self.groups_index.get_candidate_texts(text)
+
+    def add_entities(self, named_entities: list[NamedEntity]):
+        with self.lock:
+            self.reference_destinations = None
+            self.references_matcher = None
+            source_ids = set(entity.segment.source_id for entity in named_entities if entity.segment is not None)
+            if any(entity.segment is not None and entity.segment.source_id in source_ids for entity in self.entities):
+                self._rebuild([x for x in self.entities if x.segment is None or x.segment.source_id not in source_ids])
+
+            for named_entity in named_entities:
+                self._add_entity(named_entity)
+
+    def _rebuild(self, named_entities: list[NamedEntity]):
+        self.entities = list()
+        self.groups_index = NamedEntityGroupIndex()
+        for named_entity in named_entities:
+            self._add_entity(named_entity)
+
+    def _add_entity(self, named_entity: NamedEntity):
+        sequence = (-named_entity.relevance_percentage, len(self.entities))
+        self.entities.append(named_entity)
+
+        name = named_entity.group_name
+        group = self.groups_index.groups.get(name)
+        if group is None:
+            group = NamedEntityGroup(
+                type=named_entity.type, name=name, named_entities=[named_entity], top_relevance_entity=named_entity
+            )
+            self.groups_index.set_group(name, group, sequence)
+            return
+
+        group.named_entities.append(named_entity)
+        if named_entity.relevance_percentage <= group.top_relevance_entity.relevance_percentage:
+            self.groups_index.add_named_entity(name, named_entity)
+            return
+
+        group.type = named_entity.type
+        group.top_relevance_entity = named_entity
+        self.groups_index.set_group(name, group, sequence)
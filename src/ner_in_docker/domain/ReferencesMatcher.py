@@ -0,0 +1,115 @@
+from collections import defaultdict, deque
+
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+
+
+class ReferencesMatcher:
+    QUOTES = "\"'"
+
+    def __init__(self, groups: list[NamedEntityGroup]):
+        self.groups_count = len(groups)
+        self.groups = [x for x in groups if x.type == NamedEntityType.REFERENCE and x.name.strip()]
+        self.patterns_by_group = [[x for x in group.get_reference_search_patterns() if x] for group in self.groups]
+        self.transitions: list[dict[str, int]] = [dict()]
+        self.failures: list[int] = [0]
+        self.outputs: list[list[str]] = [list()]
+
+        for patterns in self.patterns_by_group:
+            for pattern in patterns:
+                self._add_pattern(pattern)
+
+        self._add_failures()
+
+    def get_references_in_text(self, text: str) -> list[tuple[NamedEntityGroup, list[tuple[int, int]]]]:
+        if not text.strip():
+            return []
+
+        spans_by_pattern = {
+            pattern: self.get_pattern_spans(text, len(pattern), starts)
+            for pattern, starts in self.get_pattern_starts(text).items()
+        }
+
+        references = list()
+        for group, patterns in zip(self.groups, self.patterns_by_group):
+            matches = [span for pattern in patterns for span in spans_by_pattern.get(pattern, [])]
+            if matches:
+                references.append((group, sorted(list(set(matches)), key=lambda m: m[0])))
+
+        return references
+
+    def get_pattern_starts(self, text: str) -> dict[str, list[int]]:
+        starts_by_pattern = defaultdict(list)
+        state = 0
+        for index, character in enumerate(text):
+            while state and character not in self.transitions[state]:
+                state = self.failures[state]
+            state = self.transitions[state].get(character, 0)
+            for pattern in self.outputs[state]:
+                starts_by_pattern[pattern].append(index - len(pattern) + 1)
+
+        return starts_by_pattern
+
+    @staticmethod
+    def is_boundary(text: str, index: int) -> bool:
+        if index < 0 or index >= len(text):
+            return True
+
+        character = text[index]
+        return not (character.isalnum() or character == "_" or character == ".")
+
+    def get_pattern_spans(self, text: str, pattern_length: int, starts: list[int]) -> list[tuple[int, int]]:
+        starts_set = set(starts)
+        match_starts = set(starts)
+        match_starts.update([x - 1 for x in starts if x > 0 and text[x - 1] in self.QUOTES])
+
+        spans = list()
+        last_end = 0
+        for match_start in sorted(match_starts):
+            if match_start < last_end or not self.is_boundary(text, match_start - 1):
+                continue
+
+            span = None
+            if text[match_start] in self.QUOTES and match_start + 1 in starts_set:
+                span = self._get_span(text, match_start, match_start + 1 + pattern_length)
+            if span is None and match_start in starts_set:
+                span = self._get_span(text, match_start, match_start + pattern_length)
+            if span is not None:
+                spans.append(span)
+                last_end = span[1]
+
+        return spans
+
+    def _get_span(self, text: str, match_start: int, pattern_end: int) -> tuple[int, int] | None:
+        if pattern_end < len(text) and text[pattern_end] in self.QUOTES and self.is_boundary(text, pattern_end + 1):
+            return match_start, pattern_end + 1
+
+        if self.is_boundary(text, pattern_end):
+            return match_start, pattern_end
+
+        return None
+
+    def _add_pattern(self, pattern: str):
+        state = 0
+        for character in pattern:
+            if character not in self.transitions[state]:
+                self.transitions.append(dict())
+                self.failures.append(0)
+                self.outputs.append(list())
+                self.transitions[state][character] = len(self.transitions) - 1
+            state = self.transitions[state][character]
+
+        if pattern not in self.outputs[state]:
+            self.outputs[state].append(pattern)
+
+    def _add_failures(self):
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for character, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                failure = self.failures[state]
+                while failure and character not in self.transitions[failure]:
+                    failure = self.failures[failure]
+                self.failures[next_state] = self.transitions[failure].get(character, 0)
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.failures[next_state]]
@@ -0,0 +1,72 @@
+from collections import defaultdict
+
+from rapidfuzz import fuzz, process
+
+
+class SimilarTextsMatrix:
+    CHUNK_SIZE = 1024
+    SCORE_CUTOFF_MARGIN = 0.01
+    EXACT_MATCH_MAX_LENGTH = 10
+
+    def __init__(self, texts: list[str], other_texts: list[str]):
+        self.texts = set(texts)
+        self.other_texts = set(other_texts)
+        self.similar_texts: dict[str, set[str]] = defaultdict(set)
+        self._compute()
+
+    @staticmethod
+    def get_threshold(text_length: int, other_text_length: int) -> float | None:
+        if abs(text_length - other_text_length) > 1:
+            return None
+
+        length = max(text_length, other_text_length)
+        return 100 * (length - 1) / length if length > SimilarTextsMatrix.EXACT_MATCH_MAX_LENGTH else 100
+
+    @staticmethod
+    def similar_text(text: str, other_text: str) -> bool:
+        threshold = SimilarTextsMatrix.get_threshold(len(text), len(other_text))
+        return threshold is not None and fuzz.ratio(text, other_text) >= threshold
+
+    def is_similar(self, text: str, other_text: str) -> bool:
+        if text in self.texts and other_text in self.other_texts:
+            return other_text in self.similar_texts.get(text, ())
+
+        if other_text in self.texts and text in self.other_texts:
+            return text in self.similar_texts.get(other_text, ())
+
+        return self.similar_text(text, other_text)
+
+    @staticmethod
+    def get_texts_by_length(texts: set[str]) -> dict[int, list[str]]:
+        texts_by_length = defaultdict(list)
+        for text in texts:
+            texts_by_length[len(text)].append(text)
+        return texts_by_length
+
+    def _compute(self):
+        other_texts_by_length = self.get_texts_by_length(self.other_texts)
+        for length, texts in self.get_texts_by_length(self.texts).items():
+            for other_length in [length - 1, length, length + 1]:
+                if other_length not in other_texts_by_length:
+                    continue
+
+                threshold = self.get_threshold(length, other_length)
+                for start in range(0, len(texts), self.CHUNK_SIZE):
+                    self._add_similar_texts(
+                        texts[start : start + self.CHUNK_SIZE], other_texts_by_length[other_length], threshold
+                    )
+
+    def _add_similar_texts(self, texts: list[str], other_texts: list[str], threshold: float):
+        if threshold >= 100:
+            other_texts_set = set(other_texts)
+            for text in texts:
+                if text in other_texts_set:
+                    self.similar_texts[text].add(text)
+            return
+
+        score_cutoff = threshold - self.SCORE_CUTOFF_MARGIN
+        scores = process.cdist(texts, other_texts, scorer=fuzz.ratio, score_cutoff=score_cutoff, workers=-1)
+        for text_index, other_text_index in zip(*scores.nonzero()):
+            text, other_text = texts[text_index], other_texts[other_text_index]
+            if fuzz.ratio(text, other_text) >= threshold:
+                self.similar_texts[text].add(other_text)
@@ -1,11 +1,15 @@
 import time
 import random
+import copy
 import sys
 import traceback
 from ner_in_docker.use_cases.GroupNamedEntitiesUseCase import GroupNamedEntitiesUseCase
 from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
 from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.PriorGroupsIndex import PriorGroupsIndex
 from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.domain.SimilarTextsMatrix import SimilarTextsMatrix
 from pdf_token_type_labels import TokenType
 from pdf_features.Rectangle import Rectangle
 
@@ -325,6 +329,155 @@ def generate_test_entities_by_type(count: int, entity_type: NamedEntityType) ->
     return entities
 
 
+class LinearScanGroupNamedEntitiesUseCase(GroupNamedEntitiesUseCase):
+    def _try_assign_to_prior_group(self, named_entity: NamedEntity) -> bool:
+        for prior_group in self.prior_groups_index.get_groups():
+            if prior_group.name in self.used_prior_groups_names:
+                continue
+
+            if prior_group.belongs_to_group(named_entity):
+                self._assign_to_prior_group(named_entity, prior_group)
+                return True
+        return False
+
+    def _try_assign_to_existing_group(self, named_entity: NamedEntity) -> bool:
+        for group in self.groups.values():
+            if group.belongs_to_group(named_entity):
+                self._assign_to_existing_group(named_entity, group)
+                return True
+        return False
+
+
+def generate_distinct_person_entities(count: int) -> list[NamedEntity]:
+    syllables = ["an", "bel", "car", "dor", "el", "fin", "gar", "hal", "ir", "jon", "kal", "lin", "mar", "nor", "ol"]
+    syllables += ["per", "quin", "ros", "sal", "tor", "ul", "ver", "wen", "xan", "yor", "zel"]
+
+    segment = Segment(
+        text="This is a sample segment text for testing purposes.",
+        type=TokenType.TEXT,
+        page_number=1,
+        segment_number=0,
+        bounding_box=Rectangle.from_width_height(left=0, top=0, width=100, height=20),
+    )
+
+    names = []
+    for _ in range(max(1, count // 4)):
+        first_name = "".join(random.sample(syllables, 2)).capitalize()
+        last_name = "".join(random.sample(syllables, 3)).capitalize()
+        names.append(f"{first_name} {last_name}")
+
+    entities = []
+    for i in range(count):
+        base_text = random.choice(names)
+        variation = random.choice([base_text, base_text.upper(), base_text.lower(), base_text.replace(" ", "  ")])
+        entities.append(
+            NamedEntity(
+                type=NamedEntityType.PERSON,
+                text=variation,
+                character_start=i * 10,
+                character_end=i * 10 + len(variation),
+                segment=segment,
+            )
+        )
+
+    return entities
+
+
+def get_grouping_summary(groups: list[NamedEntityGroup]) -> list[tuple]:
+    return [(group.type, group.name, [entity.text for entity in group.named_entities]) for group in groups]
+
+
+def benchmark_blocking_index():
+    print("=" * 80)
+    print("BENCHMARKING group candidates - linear scan vs blocking index")
+    print("=" * 80)
+    print(f"{'Entities':<12} {'Groups':<10} {'Linear scan (s)':<18} {'Blocking index (s)':<20} {'Speedup':<10}")
+    print(f"{'-' * 12} {'-' * 10} {'-' * 18} {'-' * 20} {'-' * 10}")
+    sys.stdout.flush()
+
+    for count in [500, 1000, 2000, 4000]:
+        random.seed(count)
+        entities = generate_distinct_person_entities(count)
+
+        start_time = time.time()
+        linear_groups = LinearScanGroupNamedEntitiesUseCase().group(copy.deepcopy(entities))
+        linear_time = time.time() - start_time
+
+        start_time = time.time()
+        indexed_groups = GroupNamedEntitiesUseCase().group(copy.deepcopy(entities))
+        indexed_time = time.time() - start_time
+
+        assert get_grouping_summary(linear_groups) == get_grouping_summary(indexed_groups), f"Different groups for {count}"
+
+        speedup = linear_time / indexed_time if indexed_time else float("inf")
+        print(f"{count:<12} {len(indexed_groups):<10} {linear_time:<18.4f} {indexed_time:<20.4f} {speedup:<10.1f}")
+        sys.stdout.flush()
+
+
+def benchmark_prior_groups_index():
+    print("=" * 80)
+    print("BENCHMARKING prior groups - linear scan vs prior groups index")
+    print("=" * 80)
+    print(f"{'Entities':<12} {'Prior groups':<14} {'Linear scan (s)':<18} {'Prior index (s)':<18} {'Speedup':<10}")
+    print(f"{'-' * 12} {'-' * 14} {'-' * 18} {'-' * 18} {'-' * 10}")
+    sys.stdout.flush()
+
+    for count, prior_count in [(500, 4000), (500, 16000)]:
+        random.seed(count + prior_count)
+        prior_entities = generate_distinct_person_entities(prior_count)
+        GroupNamedEntitiesUseCase().group(prior_entities)
+        entities = random.sample(prior_entities, count // 2) + generate_distinct_person_entities(count // 2)
+        prior_groups_index = PriorGroupsIndex.from_entities(prior_entities)
+
+        start_time = time.time()
+        linear_use_case = LinearScanGroupNamedEntitiesUseCase(prior_groups_index=prior_groups_index)
+        linear_groups = linear_use_case.group(copy.deepcopy(entities))
+        linear_time = time.time() - start_time
+
+        start_time = time.time()
+        indexed_groups = GroupNamedEntitiesUseCase(prior_groups_index=prior_groups_index).group(copy.deepcopy(entities))
+        indexed_time = time.time() - start_time
+
+        assert get_grouping_summary(linear_groups) == get_grouping_summary(indexed_groups), f"Different groups for {count}"
+
+        speedup = linear_time / indexed_time if indexed_time else float("inf")
+        groups_count = len(prior_groups_index.get_groups())
+        print(f"{count:<12} {groups_count:<14} {linear_time:<18.4f} {indexed_time:<18.4f} {speedup:<10.1f}")
+        sys.stdout.flush()
+
+
+def benchmark_similar_texts_matrix():
+    print("=" * 80)
+    print("BENCHMARKING similar texts - pairwise fuzz.ratio vs cdist matrix")
+    print("=" * 80)
+    print(f"{'New texts':<12} {'Prior texts':<12} {'Pairwise (s)':<15} {'Matrix (s)':<15} {'Speedup':<10}")
+    print(f"{'-' * 12} {'-' * 12} {'-' * 15} {'-' * 15} {'-' * 10}")
+    sys.stdout.flush()
+
+    for texts_count, prior_texts_count in [(250, 5000), (500, 10000), (500, 20000)]:
+        random.seed(texts_count + prior_texts_count)
+        prior_entities = generate_distinct_person_entities(prior_texts_count * 4)
+        prior_texts = sorted({NamedEntity.normalize_text(entity.text) for entity in prior_entities})
+        new_entities = generate_distinct_person_entities(texts_count * 2)
+        texts = random.sample(prior_texts, texts_count // 2)
+        texts += sorted({NamedEntity.normalize_text(entity.text) for entity in new_entities})[: texts_count // 2]
+
+        start_time = time.time()
+        pairwise_similar = {(x, y) for x in texts for y in prior_texts if NamedEntityGroup.similar_text(y, x)}
+        pairwise_time = time.time() - start_time
+
+        start_time = time.time()
+        matrix = SimilarTextsMatrix(texts, prior_texts)
+        matrix_similar = {(x, y) for x in matrix.similar_texts for y in matrix.similar_texts[x]}
+        matrix_time = time.time() - start_time
+
+        assert pairwise_similar == matrix_similar, f"Different similar texts for {texts_count}x{prior_texts_count}"
+
+        speedup = pairwise_time / matrix_time if matrix_time else float("inf")
+        print(f"{len(texts):<12} {len(prior_texts):<12} {pairwise_time:<15.4f} {matrix_time:<15.4f} {speedup:<10.1f}")
+        sys.stdout.flush()
+
+
 def benchmark_grouping():
     try:
         print("=" * 80)
@@ -392,5 +545,41 @@ def benchmark_grouping():
         sys.stdout.flush()
 
 
+def benchmark_relevance_scores():
+    print("=" * 80)
+    print("BENCHMARKING relevance scoring - per-entity scan vs single pass")
+    print("=" * 80)
+    print(f"{'Entities':<12} {'Per entity (s)':<18} {'Single pass (s)':<18} {'Speedup':<10}")
+    print(f"{'-' * 12} {'-' * 18} {'-' * 18} {'-' * 10}")
+    sys.stdout.flush()
+
+    for count in [500, 1000, 2000, 5000]:
+        entities = generate_test_entities(count)
+        for entity in entities:
+            entity.relevance_percentage = 0
+
+        per_entity = copy.deepcopy(entities)
+        start_time = time.time()
+        for entity in per_entity:
+            entity.set_relevance_score(per_entity)
+        per_entity_time = time.time() - start_time
+
+        single_pass = copy.deepcopy(entities)
+        start_time = time.time()
+        NamedEntity.set_relevance_scores(single_pass)
+        single_pass_time = time.time() - start_time
+
+        expected_scores = [x.relevance_percentage for x in per_entity]
+        assert expected_scores == [x.relevance_percentage for x in single_pass], f"Different scores for {count} entities"
+
+        speedup = per_entity_time / single_pass_time if single_pass_time else float("inf")
+        print(f"{count:<12} {per_entity_time:<18.4f} {single_pass_time:<18.4f} {speedup:<10.1f}")
+        sys.stdout.flush()
+
+
 if __name__ == "__main__":
     benchmark_grouping()
+    benchmark_relevance_scores()
+    benchmark_blocking_index()
+    benchmark_similar_texts_matrix()
+    benchmark_prior_groups_index()
@@ -0,0 +1,160 @@
+import random
+import sys
+import time
+
+from pdf_features.Rectangle import Rectangle
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.use_cases.ReferencesUseCase import ReferencesUseCase
+
+WORDS = ["analysis", "results", "methods", "annex", "report", "rights", "court", "state", "article", "review"]
+
+
+def generate_titles(count: int) -> list[str]:
+    titles = []
+    for i in range(count):
+        words = " ".join(random.sample(WORDS, 3)).capitalize()
+        titles.append(random.choice([f"{i + 1}. {words}", f"Section {i + 1}: {words}", f"{words} {i + 1}"]))
+    return titles
+
+
+def generate_segments(titles: list[str], count: int) -> list[Segment]:
+    segments = []
+    for i in range(count):
+        words = random.choices(WORDS, k=60)
+        for _ in range(3):
+            words.insert(random.randint(0, len(words)), f'"{random.choice(titles)}",')
+        segments.append(
+            Segment(
+                text=" ".join(words),
+                page_number=1 + i // 10,
+                segment_number=i,
+                source_id="benchmark.pdf",
+                bounding_box=Rectangle.from_width_height(left=0, top=0, width=100, height=20),
+            )
+        )
+    return segments
+
+
+def get_entities_with_regex(prior_entities: list[NamedEntity], segments: list[Segment]) -> list[NamedEntity]:
+    use_case = ReferencesUseCase(prior_entities)
+    entities = []
+    for segment in segments:
+        segment_entities = []
+        for group in use_case.references_groups:
+            for character_start, character_end in group.get_references_in_text(segment.text):
+                entity = NamedEntity(
+                    type=NamedEntityType.REFERENCE,
+                    text=segment.text[character_start:character_end],
+                    group_name=group.name,
+                    normalized_text=group.name,
+                    character_start=character_start,
+                    character_end=character_end,
+                )
+                segment_entities.append(NamedEntity.from_segment(entity, segment, group.name))
+        entities.extend(use_case.remove_references_in_same_words(segment_entities))
+    return entities
+
+
+def remove_references_in_same_words_by_index(entities: list[NamedEntity]) -> list[NamedEntity]:
+    only_references = [e for e in entities if e.type == NamedEntityType.REFERENCE]
+    ordered_entities = sorted(
+        only_references,
+        key=lambda e: (e.segment.source_id, e.segment.page_number, e.segment.segment_number, e.character_start),
+    )
+    indexes_to_remove = set()
+    for index, (entity, next_entity) in enumerate(zip(ordered_entities, ordered_entities[1:])):
+        if not entity.is_in_same_segment(next_entity) or entity.character_end <= next_entity.character_start:
+            continue
+        indexes_to_remove.add(index + 1 if len(entity.text) > len(next_entity.text) else index)
+
+    for index in indexes_to_remove:
+        del entities[entities.index(ordered_entities[index])]
+
+    return entities
+
+
+def generate_overlapping_references(count: int) -> list[NamedEntity]:
+    segments = generate_segments(["Title"], max(1, count // 50))
+    entities = []
+    for i in range(count):
+        segment = random.choice(segments)
+        character_start = random.randint(0, len(segment.text) - 20)
+        character_end = character_start + random.randint(3, 20)
+        entity = NamedEntity(
+            type=NamedEntityType.REFERENCE,
+            text=segment.text[character_start:character_end],
+            group_name=f"Title {i % 20}",
+            character_start=character_start,
+            character_end=character_end,
+        )
+        entities.append(NamedEntity.from_segment(entity, segment))
+    return entities
+
+
+def benchmark_remove_references_in_same_words():
+    print("=" * 80)
+    print("BENCHMARKING overlapping references - index and delete vs identity sweep")
+    print("=" * 80)
+    print(f"{'References':<12} {'Index (s)':<15} {'Sweep (s)':<15} {'Speedup':<10}")
+    print(f"{'-' * 12} {'-' * 15} {'-' * 15} {'-' * 10}")
+    sys.stdout.flush()
+
+    for count in [1000, 5000, 20000]:
+        random.seed(count)
+        entities = generate_overlapping_references(count)
+
+        start_time = time.time()
+        index_entities = remove_references_in_same_words_by_index(list(entities))
+        index_time = time.time() - start_time
+
+        start_time = time.time()
+        sweep_entities = ReferencesUseCase.remove_references_in_same_words(list(entities))
+        sweep_time = time.time() - start_time
+
+        assert [id(x) for x in index_entities] == [id(x) for x in sweep_entities], f"Different references for {count}"
+
+        speedup = index_time / sweep_time if sweep_time else float("inf")
+        print(f"{count:<12} {index_time:<15.4f} {sweep_time:<15.4f} {speedup:<10.1f}")
+        sys.stdout.flush()
+
+
+def get_summary(entities: list[NamedEntity]) -> list[tuple]:
+    return [(x.segment.segment_number, x.group_name, x.character_start, x.character_end) for x in entities]
+
+
+def benchmark_references():
+    print("=" * 80)
+    print("BENCHMARKING references - regex per title vs references matcher")
+    print("=" * 80)
+    print(f"{'Titles':<10} {'Segments':<10} {'Regex (s)':<15} {'Matcher (s)':<15} {'Speedup':<10}")
+    print(f"{'-' * 10} {'-' * 10} {'-' * 15} {'-' * 15} {'-' * 10}")
+    sys.stdout.flush()
+
+    for titles_count, segments_count in [(50, 200), (200, 500), (800, 1000)]:
+        random.seed(titles_count)
+        titles = generate_titles(titles_count)
+        prior_entities = [NamedEntity(type=NamedEntityType.REFERENCE, text=x, relevance_percentage=100) for x in titles]
+        segments = generate_segments(titles, segments_count)
+
+        start_time = time.time()
+        regex_entities = get_entities_with_regex(prior_entities, segments)
+        regex_time = time.time() - start_time
+
+        start_time = time.time()
+        use_case = ReferencesUseCase(prior_entities)
+        matcher_entities = [x for segment in segments for x in use_case.get_entities(segment)]
+        matcher_time = time.time() - start_time
+
+        assert get_summary(regex_entities) == get_summary(matcher_entities), f"Different references for {titles_count}"
+
+        speedup = regex_time / matcher_time if matcher_time else float("inf")
+        print(f"{titles_count:<10} {segments_count:<10} {regex_time:<15.4f} {matcher_time:<15.4f} {speedup:<10.1f}")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    benchmark_references()
+    benchmark_remove_references_in_same_words()
@@ -0,0 +1,115 @@
+import random
+import sys
+import time
+
+from pdf_features.Rectangle import Rectangle
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.drivers.rest.response_entities.EntityTextResponse import EntityTextResponse
+from ner_in_docker.drivers.rest.response_entities.GroupResponse import GroupResponse
+from ner_in_docker.drivers.rest.response_entities.NamedEntitiesResponse import NamedEntitiesResponse
+from ner_in_docker.drivers.rest.response_entities.NamedEntityResponse import NamedEntityResponse
+
+TYPES = [NamedEntityType.PERSON, NamedEntityType.ORGANIZATION, NamedEntityType.LOCATION, NamedEntityType.DATE]
+
+
+def generate_groups(entities_count: int) -> list[NamedEntityGroup]:
+    segments = [
+        Segment(
+            text="x" * 200,
+            page_number=1 + i // 20,
+            segment_number=i,
+            source_id="benchmark.pdf",
+            bounding_box=Rectangle.from_width_height(left=0, top=0, width=100, height=20),
+        )
+        for i in range(max(1, entities_count // 5))
+    ]
+
+    groups: dict[str, NamedEntityGroup] = dict()
+    for i in range(entities_count):
+        name = f"Entity {random.randint(0, entities_count // 4)}"
+        character_start = random.randint(0, 190)
+        entity = NamedEntity(
+            type=TYPES[hash(name) % len(TYPES)],
+            text=f"{name} {i}",
+            group_name=name,
+            character_start=character_start,
+            character_end=character_start + 10,
+            relevance_percentage=random.randint(0, 100),
+        )
+        entity = NamedEntity.from_segment(entity, random.choice(segments))
+        if name not in groups:
+            groups[name] = NamedEntityGroup(type=entity.type, name=name, named_entities=[], top_relevance_entity=entity)
+        groups[name].named_entities.append(entity)
+        if entity.relevance_percentage > groups[name].top_relevance_entity.relevance_percentage:
+            groups[name].top_relevance_entity = entity
+
+    return list(groups.values())
+
+
+def from_groups_by_list_index(named_entity_groups: list[NamedEntityGroup]) -> NamedEntitiesResponse:
+    named_entities = [x for group in named_entity_groups for x in group.named_entities]
+    groups_dict = {}
+    for group in named_entity_groups:
+        groups_dict.setdefault(group.name, group)
+
+    named_entities.sort(key=lambda x: (x.segment.source_id, x.character_start), reverse=True)
+    entities = [NamedEntityResponse.from_named_entity(x) for x in named_entities]
+    entities.sort(key=lambda x: (x.source_id, x.segment.page_number, x.segment.segment_number, x.segment.character_start))
+
+    groups_response: dict[str, GroupResponse] = {}
+    for entity in sorted(entities, key=lambda x: x.relevance_percentage, reverse=True):
+        entity_text = EntityTextResponse(index=entities.index(entity), text=entity.text)
+        if entity.group_name in groups_response:
+            groups_response[entity.group_name].entities.append(entity_text)
+            continue
+
+        group = groups_dict[entity.group_name]
+        top_relevance_entity = entity
+        if group.top_relevance_entity.relevance_percentage > entity.relevance_percentage:
+            top_relevance_entity = NamedEntityResponse.from_named_entity(group.top_relevance_entity)
+        groups_response[entity.group_name] = GroupResponse(
+            group_name=entity.group_name, type=entity.type, entities=[entity_text], top_relevance_entity=top_relevance_entity
+        )
+
+    for group_response in groups_response.values():
+        group_response.entities.sort(key=lambda x: x.index)
+    groups = sorted(groups_response.values(), key=lambda x: x.entities[0].index)
+    return NamedEntitiesResponse(entities=entities, groups=groups)
+
+
+def benchmark_response():
+    print("=" * 80)
+    print("BENCHMARKING response assembly - list index vs index map")
+    print("=" * 80)
+    print(f"{'Entities':<10} {'List index (s)':<16} {'Index map (s)':<16} {'us/entity':<12} {'Speedup':<10}")
+    print(f"{'-' * 10} {'-' * 16} {'-' * 16} {'-' * 12} {'-' * 10}")
+    sys.stdout.flush()
+
+    for entities_count in [1000, 2000, 4000, 8000]:
+        random.seed(entities_count)
+        groups = generate_groups(entities_count)
+
+        start_time = time.time()
+        list_index_response = from_groups_by_list_index(groups)
+        list_index_time = time.time() - start_time
+
+        start_time = time.time()
+        index_map_response = NamedEntitiesResponse.from_groups(groups)
+        index_map_time = time.time() - start_time
+
+        assert list_index_response == index_map_response, f"Different responses for {entities_count}"
+
+        microseconds = 1_000_000 * index_map_time / entities_count
+        speedup = list_index_time / index_map_time if index_map_time else float("inf")
+        print(
+            f"{entities_count:<10} {list_index_time:<16.4f} {index_map_time:<16.4f} {microseconds:<12.1f} {speedup:<10.1f}"
+        )
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":
+    benchmark_response()
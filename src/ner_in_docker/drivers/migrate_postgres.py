@@ -0,0 +1,24 @@
+import sys
+
+from ner_in_docker.adapters.PostgresEntitiesStoreRepository import PostgresEntitiesStoreRepository
+from ner_in_docker.adapters.PostgresMigrations import PostgresMigrations
+
+
+def migrate_postgres(schemas_names: list[str]):
+    pool = PostgresEntitiesStoreRepository().pool
+    if not schemas_names:
+        with pool.cursor() as cursor:
+            schemas_names = PostgresMigrations.get_namespace_schemas(cursor)
+
+    for schema_name in schemas_names:
+        with pool.transaction() as cursor:
+            migrated_versions = PostgresMigrations.migrate(cursor, schema_name)
+        pool.set_schema_created(schema_name)
+        migrated = ", ".join(str(x) for x in migrated_versions) if migrated_versions else "up to date"
+        print(f"{schema_name}: {migrated} (version {PostgresMigrations.get_latest_version()})")
+
+    pool.close()
+
+
+if __name__ == "__main__":
+    migrate_postgres(sys.argv[1:])
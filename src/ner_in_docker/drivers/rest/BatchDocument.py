@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class BatchDocument(BaseModel):
+    index: int
+    identifier: str | None = None
+    text: str | None = None
+    pdf_content: bytes | None = None
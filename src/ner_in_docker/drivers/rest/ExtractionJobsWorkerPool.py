@@ -0,0 +1,90 @@
+import os
+import threading
+import traceback
+
+from ner_in_docker.domain.ExtractionJob import ExtractionJob
+from ner_in_docker.drivers.rest.NamedEntitiesPipeline import NamedEntitiesPipeline
+from ner_in_docker.drivers.rest.response_entities.NamedEntitiesResponse import NamedEntitiesResponse
+from ner_in_docker.ports.JobsRepository import JobsRepository
+
+
+class ExtractionJobsWorkerPool:
+    def __init__(self, jobs_repository: JobsRepository, workers_count: int, poll_seconds: float, lease_seconds: float):
+        self.jobs_repository = jobs_repository
+        self.workers_count = max(1, workers_count)
+        self.poll_seconds = max(0.1, poll_seconds)
+        self.lease_seconds = max(1.0, lease_seconds)
+        self.new_job = threading.Event()
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+        self.workers: list[threading.Thread] = []
+
+    def start(self):
+        with self.lock:
+            if self.workers:
+                return
+
+            self.stopped.clear()
+            for index in range(self.workers_count):
+                worker = threading.Thread(target=self._run, name=f"extraction-jobs-{index}", daemon=True)
+                worker.start()
+                self.workers.append(worker)
+
+    def stop(self):
+        with self.lock:
+            self.stopped.set()
+            self.new_job.set()
+            self.workers = []
+
+    def submit(self, job: ExtractionJob, pdf_content: bytes):
+        self.jobs_repository.create_job(job, pdf_content)
+        self.new_job.set()
+
+    def process_job(self, job: ExtractionJob):
+        finished = threading.Event()
+        threading.Thread(target=self._keep_lease, args=(job, finished), daemon=True).start()
+        try:
+            self._process_job(job)
+        finally:
+            finished.set()
+
+    def _process_job(self, job: ExtractionJob):
+        pipeline = NamedEntitiesPipeline(
+            job.namespace, job.identifier, job.language, job.use_llm, lambda stage: self._set_stage(job, stage)
+        )
+        try:
+            pdf_path = self.jobs_repository.get_pdf_path(job)
+            named_entities_groups = pipeline.get_named_entities_groups(pdf_path.read_bytes(), pdf_path.name, fast=job.fast)
+            result = NamedEntitiesResponse.from_groups(named_entities_groups).model_dump_json()
+            job.set_done()
+            self.jobs_repository.finish_job(job, result)
+        except Exception as e:
+            traceback.print_exc()
+            job.set_failed(f"{type(e).__name__}: {e}")
+            self.jobs_repository.finish_job(job, None)
+
+    def _keep_lease(self, job: ExtractionJob, finished: threading.Event):
+        while not finished.wait(self.lease_seconds / 3):
+            try:
+                self.jobs_repository.renew_lease(job, self.lease_seconds)
+            except Exception:
+                traceback.print_exc()
+
+    def _set_stage(self, job: ExtractionJob, stage: str):
+        job.set_stage(stage)
+        self.jobs_repository.update_job(job)
+
+    def _run(self):
+        while not self.stopped.is_set():
+            try:
+                self.jobs_repository.requeue_abandoned_jobs()
+                job = self.jobs_repository.claim_next_job(os.getpid(), self.lease_seconds)
+                if job is None:
+                    self.new_job.wait(self.poll_seconds)
+                    self.new_job.clear()
+                    continue
+
+                self.process_job(job)
+            except Exception:
+                traceback.print_exc()
+                self.stopped.wait(self.poll_seconds)
@@ -0,0 +1,246 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterator
+
+from ner_in_docker.adapters.AsyncPDFLayoutAnalysisRepository import AsyncPDFLayoutAnalysisRepository
+from ner_in_docker.adapters.LayoutAnalysisCache import LayoutAnalysisCache
+from ner_in_docker.adapters.PostgresEntitiesStoreRepository import PostgresEntitiesStoreRepository
+from ner_in_docker.configuration import BATCH_INFERENCE_SEGMENTS, BATCH_LAYOUT_CONCURRENCY, STREAM_SEGMENTS_CHUNK_SIZE
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.PriorGroupsIndex import PriorGroupsIndex
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.drivers.rest.BatchDocument import BatchDocument
+from ner_in_docker.drivers.rest.response_entities.GroupsStreamResponse import GroupsStreamResponse
+from ner_in_docker.drivers.rest.response_entities.SegmentEntitiesResponse import SegmentEntitiesResponse
+from ner_in_docker.use_cases.GetPositionsUseCase import GetPositionsUseCase
+from ner_in_docker.use_cases.GroupNamedEntitiesUseCase import GroupNamedEntitiesUseCase
+from ner_in_docker.use_cases.NamedEntitiesUseCase import NamedEntitiesUseCase
+from ner_in_docker.use_cases.PriorGroupsIndexUseCase import PriorGroupsIndexUseCase
+from ner_in_docker.use_cases.ReferencesUseCase import ReferencesUseCase
+
+layout_analysis_cache = LayoutAnalysisCache()
+pdf_layout_analysis_repository = AsyncPDFLayoutAnalysisRepository(cache=layout_analysis_cache)
+
+
+class NamedEntitiesPipeline:
+    def __init__(
+        self,
+        namespace: str | None,
+        identifier: str | None,
+        language: str = "en",
+        use_llm: bool = False,
+        on_stage: Callable[[str], None] | None = None,
+    ):
+        self.namespace = namespace
+        self.identifier = identifier
+        self.language = language
+        self.use_llm = use_llm
+        self.on_stage = on_stage
+        self.batch_named_entities: list[NamedEntity] = list()
+        self.batch_identifiers: list[str] = list()
+        self.repository = PostgresEntitiesStoreRepository(namespace, language)
+        self.prior_groups_index_use_case = PriorGroupsIndexUseCase(self.repository, namespace, language)
+
+    def set_stage(self, stage: str):
+        if self.on_stage:
+            self.on_stage(stage)
+
+    def get_segments(
+        self,
+        pdf_content: bytes | None,
+        pdf_name: str,
+        text: str | None,
+        fast: bool = False,
+        identifier: str | None = None,
+    ) -> list[Segment]:
+        if pdf_content is not None:
+            return pdf_layout_analysis_repository.get_segments_from_content(pdf_content, pdf_name, fast)
+
+        return [Segment.from_text(text=text if text else "", source_id=identifier if identifier else self.identifier)]
+
+    @staticmethod
+    def get_word_positions_future(pdf_content: bytes | None, pdf_name: str) -> Future | None:
+        if pdf_content is not None:
+            return pdf_layout_analysis_repository.get_word_positions_future(pdf_content, pdf_name)
+
+        return None
+
+    @staticmethod
+    def get_positions_use_case(word_positions_future: Future | None) -> GetPositionsUseCase | None:
+        if word_positions_future:
+            return GetPositionsUseCase(word_positions_future.result())
+
+        return None
+
+    def get_prior_groups_index(self) -> PriorGroupsIndex:
+        if self.namespace:
+            return self.prior_groups_index_use_case.get_prior_groups_index()
+
+        return PriorGroupsIndex()
+
+    def get_extractor_use_case(self):
+        if not self.use_llm:
+            return NamedEntitiesUseCase(self.language)
+
+        from ner_in_docker.use_cases.NamedEntitiesLLMUseCase import NamedEntitiesLLMUseCase
+
+        return NamedEntitiesLLMUseCase(self.language)
+
+    def get_named_entities_groups(
+        self, pdf_content: bytes | None = None, pdf_name: str = "", text: str | None = None, fast: bool = False
+    ) -> list[NamedEntityGroup]:
+        self.set_stage("layout")
+        word_positions_future = self.get_word_positions_future(pdf_content, pdf_name)
+        segments = self.get_segments(pdf_content, pdf_name, text, fast)
+
+        prior_groups_index = self.get_prior_groups_index()
+
+        self.set_stage("entities")
+        named_entities = self.get_extractor_use_case().get_entities_from_segments(segments)
+        self.set_stage("references")
+        named_entities += ReferencesUseCase.from_prior_groups_index(prior_groups_index).get_entities_from_segments(segments)
+        if word_positions_future:
+            self.set_stage("positions")
+            named_entities = self.get_positions_use_case(word_positions_future).add_positions(named_entities)
+        self.set_stage("grouping")
+        named_entities_groups = GroupNamedEntitiesUseCase(
+            language=self.language, prior_groups_index=prior_groups_index
+        ).group(named_entities)
+
+        if self.namespace:
+            self.set_stage("saving")
+            self.prior_groups_index_use_case.save_entities(named_entities, [self.identifier] if self.identifier else [])
+
+        return named_entities_groups
+
+    def stream_named_entities(
+        self, pdf_content: bytes | None = None, pdf_name: str = "", text: str | None = None, fast: bool = False
+    ) -> Iterator[SegmentEntitiesResponse | GroupsStreamResponse]:
+        word_positions_future = self.get_word_positions_future(pdf_content, pdf_name)
+        segments = self.get_segments(pdf_content, pdf_name, text, fast)
+
+        prior_groups_index = self.get_prior_groups_index()
+        references_use_case = ReferencesUseCase.from_prior_groups_index(prior_groups_index)
+        titles_entities = references_use_case.get_titles_entities(segments)
+        extractor_use_case = self.get_extractor_use_case()
+        positions_use_case = None
+
+        extracted_entities: list[NamedEntity] = list()
+        references_entities: list[NamedEntity] = list()
+        index_by_entity: dict[int, int] = dict()
+        for start in range(0, len(segments), STREAM_SEGMENTS_CHUNK_SIZE):
+            chunk_segments = segments[start : start + STREAM_SEGMENTS_CHUNK_SIZE]
+            chunk_extracted_entities = extractor_use_case.get_entities_from_segments(chunk_segments)
+            chunk_references_entities = [x for segment in chunk_segments for x in references_use_case.get_entities(segment)]
+            extracted_entities += chunk_extracted_entities
+            references_entities += chunk_references_entities
+            if word_positions_future:
+                positions_use_case = positions_use_case or self.get_positions_use_case(word_positions_future)
+                positions_use_case.add_positions(chunk_extracted_entities + chunk_references_entities)
+
+            entities_by_segment = {id(segment): list() for segment in chunk_segments}
+            for entity in chunk_extracted_entities + chunk_references_entities:
+                entities_by_segment[id(entity.segment)].append(entity)
+
+            for segment in chunk_segments:
+                segment_entities = sorted(entities_by_segment[id(segment)], key=lambda x: x.character_start)
+                if segment_entities:
+                    yield self.get_segment_entities_response(segment, segment_entities, index_by_entity)
+
+        named_entities = extracted_entities + titles_entities + references_entities
+        named_entities_groups = GroupNamedEntitiesUseCase(
+            language=self.language, prior_groups_index=prior_groups_index
+        ).group(named_entities)
+
+        grouped_entities = set(id(x) for group in named_entities_groups for x in group.named_entities)
+        for title_entity in titles_entities:
+            if id(title_entity) in grouped_entities:
+                if word_positions_future:
+                    positions_use_case = positions_use_case or self.get_positions_use_case(word_positions_future)
+                    positions_use_case.add_positions([title_entity])
+                yield self.get_segment_entities_response(title_entity.segment, [title_entity], index_by_entity)
+
+        if self.namespace:
+            self.prior_groups_index_use_case.save_entities(named_entities, [self.identifier] if self.identifier else [])
+
+        yield GroupsStreamResponse.from_groups(named_entities_groups, index_by_entity)
+
+    @staticmethod
+    def get_segment_entities_response(
+        segment: Segment, named_entities: list[NamedEntity], index_by_entity: dict[int, int]
+    ) -> SegmentEntitiesResponse:
+        first_index = len(index_by_entity)
+        for index, named_entity in enumerate(named_entities):
+            index_by_entity[id(named_entity)] = first_index + index
+        return SegmentEntitiesResponse.from_segment(segment, named_entities, first_index)
+
+    def get_batch_named_entities_groups(
+        self, documents: list[BatchDocument], fast: bool = False
+    ) -> Iterator[tuple[BatchDocument, list[NamedEntityGroup], str]]:
+        prior_groups_index = self.get_prior_groups_index()
+        references_use_case = ReferencesUseCase.from_prior_groups_index(prior_groups_index)
+        named_entities_use_case = NamedEntitiesUseCase(self.language)
+
+        word_positions_futures = [
+            self.get_word_positions_future(document.pdf_content, document.identifier) for document in documents
+        ]
+        with ThreadPoolExecutor(max_workers=BATCH_LAYOUT_CONCURRENCY) as executor:
+            segments_futures = [
+                executor.submit(
+                    self.get_segments, document.pdf_content, document.identifier, document.text, fast, document.identifier
+                )
+                for document in documents
+            ]
+
+            chunk: list[tuple[BatchDocument, list[Segment], Future | None]] = list()
+            for document, segments_future, word_positions_future in zip(documents, segments_futures, word_positions_futures):
+                if segments_future.exception():
+                    if word_positions_future:
+                        word_positions_future.cancel()
+                    yield document, [], f"{type(segments_future.exception()).__name__}: {segments_future.exception()}"
+                    continue
+
+                chunk.append((document, segments_future.result(), word_positions_future))
+                if sum(len(segments) for _, segments, _ in chunk) >= BATCH_INFERENCE_SEGMENTS:
+                    yield from self.get_chunk_named_entities_groups(
+                        chunk, named_entities_use_case, references_use_case, prior_groups_index
+                    )
+                    chunk = list()
+
+            yield from self.get_chunk_named_entities_groups(
+                chunk, named_entities_use_case, references_use_case, prior_groups_index
+            )
+
+    def get_chunk_named_entities_groups(
+        self,
+        chunk: list[tuple[BatchDocument, list[Segment], Future | None]],
+        named_entities_use_case: NamedEntitiesUseCase,
+        references_use_case: ReferencesUseCase,
+        prior_groups_index: PriorGroupsIndex,
+    ) -> Iterator[tuple[BatchDocument, list[NamedEntityGroup], str]]:
+        if not chunk:
+            return
+
+        documents_entities = named_entities_use_case.get_entities_from_documents([segments for _, segments, _ in chunk])
+        for (document, segments, word_positions_future), named_entities in zip(chunk, documents_entities):
+            try:
+                named_entities += references_use_case.get_entities_from_segments(segments)
+                if word_positions_future:
+                    named_entities = self.get_positions_use_case(word_positions_future).add_positions(named_entities)
+                named_entities_groups = GroupNamedEntitiesUseCase(
+                    language=self.language, prior_groups_index=prior_groups_index
+                ).group(named_entities)
+            except Exception as e:
+                yield document, [], f"{type(e).__name__}: {e}"
+                continue
+
+            self.batch_named_entities.extend(named_entities)
+            if document.identifier:
+                self.batch_identifiers.append(document.identifier)
+            yield document, named_entities_groups, ""
+
+    def save_batch(self) -> bool:
+        if not self.namespace:
+            return False
+
+        return self.prior_groups_index_use_case.save_entities(self.batch_named_entities, self.batch_identifiers)
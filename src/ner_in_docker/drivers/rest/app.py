@@ -1,38 +1,166 @@
+import asyncio
+import json
 import sys
 import tempfile
+import time
+import traceback
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI, Form, UploadFile, File
-from starlette.responses import FileResponse
-from ner_in_docker.adapters.PDFLayoutAnalysisRepository import PDFLayoutAnalysisRepository
+from typing import Callable, Iterator
+from fastapi import FastAPI, Form, UploadFile, File, HTTPException
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import FileResponse, Response, StreamingResponse
 from ner_in_docker.adapters.PDFVisualizationRepository import PDFVisualizationRepository
 from ner_in_docker.adapters.PostgresEntitiesStoreRepository import PostgresEntitiesStoreRepository
-
-from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.adapters.SQLiteJobsRepository import SQLiteJobsRepository
+from ner_in_docker.configuration import (
+    TEXT_PIPELINE_WORKERS,
+    TEXT_PIPELINE_QUEUE_SIZE,
+    PDF_PIPELINE_WORKERS,
+    PDF_PIPELINE_QUEUE_SIZE,
+    JOBS_WORKERS,
+    JOBS_POLL_SECONDS,
+    JOBS_MAX_WAIT_SECONDS,
+    JOBS_LEASE_SECONDS,
+)
+from ner_in_docker.domain.ExtractionJob import ExtractionJob
+from ner_in_docker.drivers.rest.BatchDocument import BatchDocument
+from ner_in_docker.drivers.rest.ExtractionJobsWorkerPool import ExtractionJobsWorkerPool
+
+from ner_in_docker.drivers.rest.NamedEntitiesPipeline import (
+    NamedEntitiesPipeline,
+    layout_analysis_cache,
+    pdf_layout_analysis_repository,
+)
 from ner_in_docker.drivers.rest.catch_exceptions import catch_exceptions
 from ner_in_docker.drivers.rest.response_entities.NamedEntitiesResponse import NamedEntitiesResponse
+from ner_in_docker.use_cases.GetFlairEntitiesUseCase import get_flair_model
 from ner_in_docker.use_cases.GetGeolocationUseCase import GetGeolocationUseCase
-from ner_in_docker.use_cases.GetPositionsUseCase import GetPositionsUseCase
-from ner_in_docker.use_cases.GroupNamedEntitiesUseCase import GroupNamedEntitiesUseCase
 from ner_in_docker.use_cases.NamedEntitiesUseCase import NamedEntitiesUseCase
-
-# from ner_in_docker.use_cases.NamedEntitiesLLMUseCase import NamedEntitiesLLMUseCase
-from ner_in_docker.use_cases.ReferencesUseCase import ReferencesUseCase
+from ner_in_docker.use_cases.PipelineExecutor import PipelineExecutor
+from ner_in_docker.use_cases.PriorGroupsIndexUseCase import PriorGroupsIndexUseCase
 from ner_in_docker.use_cases.VisualizeEntitiesUseCase import VisualizeEntitiesUseCase
 import logging
 
 logging.basicConfig(level=logging.INFO)
 
-app = FastAPI()
+jobs_repository = SQLiteJobsRepository()
+extraction_jobs_worker_pool = ExtractionJobsWorkerPool(jobs_repository, JOBS_WORKERS, JOBS_POLL_SECONDS, JOBS_LEASE_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await asyncio.to_thread(get_flair_model)
+    extraction_jobs_worker_pool.start()
+    yield
+    extraction_jobs_worker_pool.stop()
+    pdf_layout_analysis_repository.close()
+
+
+app = FastAPI(lifespan=lifespan)
+text_pipeline_executor = PipelineExecutor(TEXT_PIPELINE_WORKERS, TEXT_PIPELINE_QUEUE_SIZE, "text-pipeline")
+pdf_pipeline_executor = PipelineExecutor(PDF_PIPELINE_WORKERS, PDF_PIPELINE_QUEUE_SIZE, "pdf-pipeline")
+
+
+def get_pdf_name(file_name: str = None) -> str:
+    return Path(file_name).name if file_name else str(uuid.uuid1()) + ".pdf"
 
 
 def pdf_content_to_pdf_path(file_content, file_name: str = None) -> Path:
-    file_name = file_name if file_name else str(uuid.uuid1()) + ".pdf"
-    pdf_path = Path(tempfile.gettempdir()) / file_name
+    pdf_path = Path(tempfile.gettempdir()) / get_pdf_name(file_name)
     pdf_path.write_bytes(file_content)
     return pdf_path
 
 
+def stream_from_executor(executor: PipelineExecutor, function: Callable, *args) -> StreamingResponse:
+    loop = asyncio.get_running_loop()
+    lines: asyncio.Queue[str | None] = asyncio.Queue()
+
+    def emit(line: str | None):
+        loop.call_soon_threadsafe(lines.put_nowait, line + "\n" if line is not None else None)
+
+    def run():
+        try:
+            function(*args, emit)
+        except Exception as e:
+            traceback.print_exc()
+            emit(json.dumps({"error": f"{type(e).__name__}: {e}"}))
+        finally:
+            emit(None)
+
+    executor.submit(run)
+
+    async def iterate_lines():
+        while (line := await lines.get()) is not None:
+            yield line
+
+    return StreamingResponse(iterate_lines(), media_type="application/x-ndjson")
+
+
+def run_batch(pipeline: NamedEntitiesPipeline, documents: list[BatchDocument], fast: bool, emit: Callable[[str], None]):
+    for document, named_entities_groups, error in pipeline.get_batch_named_entities_groups(documents, fast):
+        record = {"index": document.index, "identifier": document.identifier}
+        if error:
+            record["error"] = error
+        else:
+            record["result"] = NamedEntitiesResponse.from_groups(named_entities_groups).model_dump(mode="json")
+        emit(json.dumps(record))
+
+    emit(json.dumps({"documents": len(documents), "saved": pipeline.save_batch()}))
+
+
+def get_named_entities_response(
+    pipeline: NamedEntitiesPipeline, pdf_content: bytes | None, pdf_name: str, text: str | None, fast: bool
+) -> NamedEntitiesResponse:
+    return NamedEntitiesResponse.from_groups(pipeline.get_named_entities_groups(pdf_content, pdf_name, text, fast))
+
+
+def run_stream(
+    pipeline: NamedEntitiesPipeline, pdf_content: bytes | None, pdf_name: str, text: str | None, fast: bool, emit: Callable
+):
+    for record in pipeline.stream_named_entities(pdf_content, pdf_name, text, fast):
+        emit(record.model_dump_json())
+
+
+async def run_pipeline(
+    namespace: str,
+    identifier: str,
+    text: str,
+    file: UploadFile,
+    fast: bool,
+    language: str,
+    use_llm: bool,
+    stream: bool = False,
+) -> NamedEntitiesResponse | StreamingResponse:
+    pipeline = NamedEntitiesPipeline(namespace, identifier, language, use_llm)
+    executor = pdf_pipeline_executor if file else text_pipeline_executor
+    pdf_content = await file.read() if file else None
+    pdf_name = get_pdf_name(file.filename) if file else ""
+    if stream:
+        return stream_from_executor(executor, run_stream, pipeline, pdf_content, pdf_name, text, fast)
+
+    return await executor.run(get_named_entities_response, pipeline, pdf_content, pdf_name, text, fast)
+
+
+def save_segments(
+    pipeline: NamedEntitiesPipeline, pdf_content: bytes | None, pdf_name: str, text: str | None, fast: bool
+) -> str:
+    if pipeline.repository.is_processed(pipeline.identifier):
+        return "Already processed"
+
+    pipeline.repository.save_segments(pipeline.get_segments(pdf_content, pdf_name, text, fast))
+    return "Texts saved"
+
+
+def create_annotated_pdf(pdf_content: bytes, pdf_path: Path, fast: bool, language: str) -> Path:
+    word_positions_future = NamedEntitiesPipeline.get_word_positions_future(pdf_content, pdf_path.name)
+    segments = pdf_layout_analysis_repository.get_segments_from_content(pdf_content, pdf_path.name, fast)
+    named_entities = NamedEntitiesUseCase(language).get_entities_from_segments(segments)
+    named_entities = NamedEntitiesPipeline.get_positions_use_case(word_positions_future).add_positions(named_entities)
+    return VisualizeEntitiesUseCase(PDFVisualizationRepository()).create_annotated_pdf(pdf_path, named_entities)
+
+
 @app.get("/")
 async def info():
     return sys.version
@@ -48,47 +176,64 @@ async def get_named_entities(
     fast: bool = Form(False),
     language: str = Form("en"),
     use_llm: bool = Form(False),
+    stream: bool = Form(False),
 ):
-    pdf_path = None
-    if file:
-        pdf_path = pdf_content_to_pdf_path(await file.read(), file.filename)
-        segments = PDFLayoutAnalysisRepository().get_segments(pdf_path, fast)
-    else:
-        segments = [Segment.from_text(text=text if text else "", source_id=identifier)]
+    return await run_pipeline(namespace, identifier, text, file, fast, language, use_llm, stream)
 
-    entities_from_db = PostgresEntitiesStoreRepository(namespace, language).get_entities() if namespace else list()
 
-    extractor_use_case = NamedEntitiesLLMUseCase(language) if use_llm else NamedEntitiesUseCase(language)
-    named_entities = extractor_use_case.get_entities_from_segments(segments)
-    named_entities += ReferencesUseCase(entities_from_db).get_entities_from_segments(segments)
-    if file and pdf_path:
-        named_entities = GetPositionsUseCase(PDFLayoutAnalysisRepository(), pdf_path).add_positions(named_entities)
-    named_entities_groups = GroupNamedEntitiesUseCase(entities_from_db, language).group(named_entities)
+def stream_json_lines(records: Iterator) -> StreamingResponse:
+    return StreamingResponse((json.dumps(record) + "\n" for record in records), media_type="application/x-ndjson")
 
-    if namespace:
-        repository = PostgresEntitiesStoreRepository(namespace, language)
-        repository.save_entities(named_entities)
-        if identifier:
-            repository.save_identifier(identifier)
 
-    return NamedEntitiesResponse.from_groups(named_entities_groups)
+def get_page(get_page_function: Callable, *args) -> tuple[list, str | None]:
+    try:
+        return get_page_function(*args)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 
 @app.get("/identifiers")
 @catch_exceptions
-async def get_identifiers(namespace: str = "default_namespace", language: str = "en"):
+def get_identifiers(
+    namespace: str = "default_namespace",
+    language: str = "en",
+    limit: int | None = None,
+    cursor: str | None = None,
+    stream: bool = False,
+):
     store_repository = PostgresEntitiesStoreRepository(namespace, language)
-    return store_repository.get_identifiers()
+    if stream:
+        return stream_json_lines(store_repository.iterate_identifiers())
+
+    if limit is None and cursor is None:
+        return store_repository.get_identifiers()
+
+    identifiers, next_cursor = get_page(store_repository.get_identifiers_page, limit, cursor)
+    return {"identifiers": identifiers, "next_cursor": next_cursor}
 
 
 @app.get("/segments")
 @catch_exceptions
-async def get_segments(identifier: str, namespace: str = "default_namespace", language: str = "en"):
+def get_segments(
+    identifier: str,
+    namespace: str = "default_namespace",
+    language: str = "en",
+    limit: int | None = None,
+    cursor: str | None = None,
+    stream: bool = False,
+):
     store_repository = PostgresEntitiesStoreRepository(namespace, language)
-    return [
-        segment.to_dict() if hasattr(segment, "to_dict") else segment.__dict__
-        for segment in store_repository.get_segments(identifier)
-    ]
+    if stream:
+        return stream_json_lines(x.model_dump(mode="json") for x in store_repository.iterate_segments(identifier))
+
+    if limit is None and cursor is None:
+        return [
+            segment.to_dict() if hasattr(segment, "to_dict") else segment.__dict__
+            for segment in store_repository.get_segments(identifier)
+        ]
+
+    segments, next_cursor = get_page(store_repository.get_segments_page, identifier, limit, cursor)
+    return {"segments": [x.model_dump(mode="json") for x in segments], "next_cursor": next_cursor}
 
 
 @app.post("/save_text")
@@ -101,30 +246,27 @@ async def save_text(
     fast: bool = Form(False),
     language: str = Form("en"),
 ):
-    store_repository = PostgresEntitiesStoreRepository(namespace, language)
-    if store_repository.is_processed(identifier):
-        return "Already processed"
+    pipeline = NamedEntitiesPipeline(namespace, identifier, language)
+    if not file:
+        return await text_pipeline_executor.run(save_segments, pipeline, None, "", text, fast)
 
-    if file:
-        pdf_path = pdf_content_to_pdf_path(await file.read(), file.filename)
-        segments = PDFLayoutAnalysisRepository().get_segments(pdf_path, fast)
-    else:
-        segments = [Segment.from_text(text=text if text else "", source_id=identifier)]
-
-    store_repository.save_segments(segments)
-    return "Texts saved"
+    return await pdf_pipeline_executor.run(
+        save_segments, pipeline, await file.read(), get_pdf_name(file.filename), None, fast
+    )
 
 
 @app.post("/delete_namespace")
 @catch_exceptions
-async def delete_namespace(namespace: str = Form(None), language: str = Form("en")):
-    PostgresEntitiesStoreRepository(namespace, language).delete_database()
+def delete_namespace(namespace: str = Form(None), language: str = Form("en")):
+    store_repository = PostgresEntitiesStoreRepository(namespace, language)
+    store_repository.delete_database()
+    PriorGroupsIndexUseCase(store_repository, namespace, language).delete_prior_groups_index()
     return "Deleted"
 
 
 @app.post("/is_processed")
 @catch_exceptions
-async def is_processed(namespace: str = Form(None), identifier: str = Form(None), language: str = Form("en")):
+def is_processed(namespace: str = Form(None), identifier: str = Form(None), language: str = Form("en")):
     if not namespace or not identifier:
         return False
 
@@ -135,22 +277,16 @@ async def is_processed(namespace: str = Form(None), identifier: str = Form(None)
 @app.post("/visualize")
 @catch_exceptions
 async def visualize(file: UploadFile = File(...), fast: bool = Form(False), language: str = Form("en")):
-    pdf_path = pdf_content_to_pdf_path(await file.read(), file.filename)
-    segments = PDFLayoutAnalysisRepository().get_segments(pdf_path, fast)
-
-    named_entities = NamedEntitiesUseCase(language).get_entities_from_segments(segments)
-    named_entities = GetPositionsUseCase(PDFLayoutAnalysisRepository(), pdf_path).add_positions(named_entities)
-
-    annotated_pdf_path = VisualizeEntitiesUseCase(PDFVisualizationRepository()).create_annotated_pdf(
-        pdf_path, named_entities
-    )
+    pdf_content = await file.read()
+    pdf_path = pdf_content_to_pdf_path(pdf_content, file.filename)
+    annotated_pdf_path = await pdf_pipeline_executor.run(create_annotated_pdf, pdf_content, pdf_path, fast, language)
 
     return FileResponse(path=annotated_pdf_path, media_type="application/pdf", filename=f"annotated_{file.filename}")
 
 
 @app.post("/geolocation")
 @catch_exceptions
-async def geolocation(location: str = Form(...)):
+def geolocation(location: str = Form(...)):
     return GetGeolocationUseCase().get_coordinates(location)
 
 
@@ -163,34 +299,14 @@ async def get_named_entities_llm(
     file: UploadFile = File(None),
     fast: bool = Form(False),
     language: str = Form("en"),
+    stream: bool = Form(False),
 ):
-    pdf_path = None
-    if file:
-        pdf_path = pdf_content_to_pdf_path(await file.read(), file.filename)
-        segments = PDFLayoutAnalysisRepository().get_segments(pdf_path, fast)
-    else:
-        segments = [Segment.from_text(text=text if text else "", source_id=identifier)]
-
-    entities_from_db = PostgresEntitiesStoreRepository(namespace, language).get_entities() if namespace else list()
-
-    named_entities = NamedEntitiesLLMUseCase(language).get_entities_from_segments(segments)
-    named_entities += ReferencesUseCase(entities_from_db).get_entities_from_segments(segments)
-    if file and pdf_path:
-        named_entities = GetPositionsUseCase(PDFLayoutAnalysisRepository(), pdf_path).add_positions(named_entities)
-    named_entities_groups = GroupNamedEntitiesUseCase(entities_from_db, language).group(named_entities)
-
-    if namespace:
-        repository = PostgresEntitiesStoreRepository(namespace, language)
-        repository.save_entities(named_entities)
-        if identifier:
-            repository.save_identifier(identifier)
-
-    return NamedEntitiesResponse.from_groups(named_entities_groups)
+    return await run_pipeline(namespace, identifier, text, file, fast, language, True, stream)
 
 
 @app.post("/create_reference")
 @catch_exceptions
-async def create_reference(
+def create_reference(
     namespace: str = Form(...),
     segment_id: int = Form(None),
     reference_text: str = Form(...),
@@ -199,6 +315,7 @@ async def create_reference(
 ):
     store_repository = PostgresEntitiesStoreRepository(namespace, language)
     success = store_repository.save_reference(segment_id, reference_text, to_text)
+    PriorGroupsIndexUseCase(store_repository, namespace, language).delete_prior_groups_index()
     if success:
         return {"status": "success", "message": "Reference created successfully"}
     else:
@@ -207,17 +324,106 @@ async def create_reference(
 
 @app.get("/references")
 @catch_exceptions
-async def get_references(namespace: str = "default_namespace", language: str = "en"):
+def get_references(
+    namespace: str = "default_namespace",
+    language: str = "en",
+    limit: int | None = None,
+    offset: int = 0,
+    identifier: str | None = None,
+):
     store_repository = PostgresEntitiesStoreRepository(namespace, language)
-    return store_repository.get_references()
+    return store_repository.get_references(limit, offset, identifier)
 
 
 @app.post("/delete_reference")
 @catch_exceptions
-async def delete_reference(namespace: str = Form(...), reference_id: int = Form(...), language: str = "en"):
+def delete_reference(namespace: str = Form(...), reference_id: int = Form(...), language: str = "en"):
     store_repository = PostgresEntitiesStoreRepository(namespace, language)
     success = store_repository.delete_reference(reference_id)
+    PriorGroupsIndexUseCase(store_repository, namespace, language).delete_prior_groups_index()
     if success:
         return {"status": "success", "message": "Reference deleted successfully"}
     else:
         return {"status": "error", "message": "Failed to delete reference"}
+
+
+@app.post("/jobs")
+@catch_exceptions
+async def create_job(
+    file: UploadFile = File(...),
+    namespace: str = Form(None),
+    identifier: str = Form(None),
+    fast: bool = Form(False),
+    language: str = Form("en"),
+    use_llm: bool = Form(False),
+):
+    job = ExtractionJob.from_request(file.filename, namespace, identifier, language, fast, use_llm)
+    await run_in_threadpool(extraction_jobs_worker_pool.submit, job, await file.read())
+    return job.to_status_dict()
+
+
+@app.get("/jobs/{job_id}")
+@catch_exceptions
+async def get_job(job_id: str, wait: float = 0):
+    deadline = time.monotonic() + min(max(0.0, wait), JOBS_MAX_WAIT_SECONDS)
+    job = await run_in_threadpool(jobs_repository.get_job, job_id)
+    while job and not job.status.is_finished() and time.monotonic() < deadline:
+        await asyncio.sleep(min(0.5, max(0.0, deadline - time.monotonic())))
+        job = await run_in_threadpool(jobs_repository.get_job, job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return job.to_status_dict()
+
+
+@app.get("/jobs/{job_id}/result")
+@catch_exceptions
+def get_job_result(job_id: str):
+    job = jobs_repository.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    if not job.status.is_finished():
+        raise HTTPException(status_code=409, detail=f"Job is {job.status.value}")
+
+    if job.error:
+        raise HTTPException(status_code=422, detail=job.error)
+
+    return Response(content=jobs_repository.get_result(job_id), media_type="application/json")
+
+
+@app.post("/batch")
+@catch_exceptions
+async def batch(
+    namespace: str = Form(None),
+    texts: list[str] = Form(None),
+    identifiers: list[str] = Form(None),
+    files: list[UploadFile] = File(None),
+    fast: bool = Form(False),
+    language: str = Form("en"),
+):
+    texts = texts if texts else []
+    identifiers = identifiers if identifiers else []
+    files = files if files else []
+
+    if namespace and any(index >= len(identifiers) or not identifiers[index] for index in range(len(texts))):
+        raise HTTPException(status_code=400, detail="Every text needs an identifier when a namespace is set")
+
+    documents = [
+        BatchDocument(index=index, identifier=identifiers[index] if index < len(identifiers) else None, text=text)
+        for index, text in enumerate(texts)
+    ]
+    for file in files:
+        documents.append(
+            BatchDocument(index=len(documents), identifier=get_pdf_name(file.filename), pdf_content=await file.read())
+        )
+
+    executor = pdf_pipeline_executor if files else text_pipeline_executor
+    return stream_from_executor(executor, run_batch, NamedEntitiesPipeline(namespace, None, language), documents, fast)
+
+
+@app.get("/layout_cache")
+@catch_exceptions
+def get_layout_cache_metrics():
+    return layout_analysis_cache.get_metrics()
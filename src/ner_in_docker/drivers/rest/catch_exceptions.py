@@ -1,5 +1,9 @@
+import asyncio
+import queue
+import httpx
 from functools import wraps
 from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
 from requests import HTTPError
 import traceback
 
@@ -8,8 +12,14 @@ def catch_exceptions(func):
     @wraps(func)
     async def wrapper(*args, **kwargs):
         try:
-            return await func(*args, **kwargs)
-        except HTTPError:
+            if asyncio.iscoroutinefunction(func):
+                return await func(*args, **kwargs)
+            return await run_in_threadpool(func, *args, **kwargs)
+        except HTTPException:
+            raise
+        except queue.Full:
+            raise HTTPException(status_code=503, detail="Server busy, try again later", headers={"Retry-After": "1"})
+        except (HTTPError, httpx.HTTPStatusError):
             raise HTTPException(status_code=400, detail="Unprocessable text or PDF file")
         except Exception as e:
             print(f"error {e}")
@@ -8,6 +8,5 @@ class EntityTextResponse(BaseModel):
     text: str
 
     @staticmethod
-    def from_entity(entities: list[NamedEntityResponse], entity: NamedEntityResponse) -> "EntityTextResponse":
-        index = entities.index(entity)
-        return EntityTextResponse(index=index, text=entity.text)
+    def from_index(entities: list[NamedEntityResponse], index: int) -> "EntityTextResponse":
+        return EntityTextResponse(index=index, text=entities[index].text)
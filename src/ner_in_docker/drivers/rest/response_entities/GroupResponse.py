@@ -13,15 +13,18 @@ class GroupResponse(BaseModel):
     top_relevance_entity: NamedEntityResponse
 
     @staticmethod
-    def from_entity(
-        entities: list[NamedEntityResponse], entity: NamedEntityResponse, group: NamedEntityGroup
+    def from_indexes(
+        entities: list[NamedEntityResponse], indexes: list[int], entity: NamedEntityResponse, group: NamedEntityGroup
     ) -> "GroupResponse":
-        entity_text = EntityTextResponse.from_entity(entities, entity)
+        entities_texts = [EntityTextResponse.from_index(entities, index) for index in indexes]
         if group.top_relevance_entity and group.top_relevance_entity.relevance_percentage > entity.relevance_percentage:
             top_relevance_entity = NamedEntityResponse.from_named_entity(group.top_relevance_entity)
         else:
             top_relevance_entity = entity
 
         return GroupResponse(
-            group_name=entity.group_name, type=entity.type, entities=[entity_text], top_relevance_entity=top_relevance_entity
+            group_name=entity.group_name,
+            type=entity.type,
+            entities=entities_texts,
+            top_relevance_entity=top_relevance_entity,
         )
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.drivers.rest.response_entities.GroupResponse import GroupResponse
+from ner_in_docker.drivers.rest.response_entities.NamedEntitiesResponse import NamedEntitiesResponse
+from ner_in_docker.drivers.rest.response_entities.NamedEntityResponse import NamedEntityResponse
+
+
+class GroupsStreamResponse(BaseModel):
+    record: str = "groups"
+    groups: list[GroupResponse]
+
+    @staticmethod
+    def from_groups(named_entity_groups: list[NamedEntityGroup], index_by_entity: dict[int, int]) -> "GroupsStreamResponse":
+        groups_response: list[GroupResponse] = []
+        for group in named_entity_groups:
+            named_entities = [x for x in group.named_entities if id(x) in index_by_entity]
+            if not named_entities:
+                continue
+
+            entities = {index_by_entity[id(x)]: NamedEntityResponse.from_named_entity(x) for x in named_entities}
+            top_entity = max(
+                sorted(named_entities, key=NamedEntitiesResponse.get_order_key), key=lambda x: x.relevance_percentage
+            )
+            groups_response.append(
+                GroupResponse.from_indexes(entities, sorted(entities), entities[index_by_entity[id(top_entity)]], group)
+            )
+
+        return GroupsStreamResponse(groups=sorted(groups_response, key=lambda x: x.entities[0].index))
@@ -1,7 +1,6 @@
 from pydantic import BaseModel
 from ner_in_docker.domain.NamedEntity import NamedEntity
 from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
-from ner_in_docker.drivers.rest.response_entities.EntityTextResponse import EntityTextResponse
 from ner_in_docker.drivers.rest.response_entities.GroupResponse import GroupResponse
 from ner_in_docker.drivers.rest.response_entities.NamedEntityResponse import NamedEntityResponse
 
@@ -20,13 +19,17 @@ class NamedEntitiesResponse(BaseModel):
             if group.name not in groups_dict:
                 groups_dict[group.name] = group
 
-        named_entities.sort(key=lambda x: (x.segment.source_id, x.character_start), reverse=True)
+        named_entities.sort(key=NamedEntitiesResponse.get_order_key)
         entities_response = NamedEntitiesResponse._create_entities_response(named_entities)
-        entities_response = NamedEntitiesResponse._sort_entities(entities_response)
         groups_response = NamedEntitiesResponse._create_groups_response(groups_dict, entities_response)
 
         return NamedEntitiesResponse(entities=entities_response, groups=groups_response)
 
+    @staticmethod
+    def get_order_key(named_entity: NamedEntity) -> tuple:
+        segment = named_entity.segment
+        return segment.source_id, segment.page_number, segment.segment_number, named_entity.character_start
+
     @staticmethod
     def _create_entities_response(named_entities: list[NamedEntity]) -> list[NamedEntityResponse]:
         entities_response: list[NamedEntityResponse] = []
@@ -37,39 +40,22 @@ class NamedEntitiesResponse(BaseModel):
 
         return entities_response
 
-    @staticmethod
-    def _sort_entities(entities_response: list[NamedEntityResponse]) -> list[NamedEntityResponse]:
-        sort_key = lambda x: (x.source_id, x.segment.page_number, x.segment.segment_number, x.segment.character_start)
-
-        return sorted(entities_response, key=sort_key)
-
-    @staticmethod
-    def group_min_index(group: GroupResponse):
-        if not group.entities:
-            return float("inf")
-        return min(getattr(entity, "index", float("inf")) for entity in group.entities)
-
-    @staticmethod
-    def _sort_groups(groups_response: list[GroupResponse]) -> list[GroupResponse]:
-        for group in groups_response:
-            group.entities.sort(key=lambda x: x.index)
-
-        return sorted(groups_response, key=NamedEntitiesResponse.group_min_index)
-
     @staticmethod
     def _create_groups_response(
         groups_dict: dict[str, NamedEntityGroup], entities_response: list[NamedEntityResponse]
     ) -> list[GroupResponse]:
-        groups_response: dict[str, GroupResponse] = {}
-        sorted_entities_by_score = sorted(entities_response, key=lambda x: x.relevance_percentage, reverse=True)
-        for entity in sorted_entities_by_score:
+        indexes_by_group_name: dict[str, list[int]] = {}
+        top_entity_by_group_name: dict[str, NamedEntityResponse] = {}
+        for index, entity in enumerate(entities_response):
             group_name = entity.group_name
-
-            if group_name not in groups_response:
-                groups_response[group_name] = GroupResponse.from_entity(entities_response, entity, groups_dict[group_name])
-                continue
-
-            entity_text_response = EntityTextResponse.from_entity(entities_response, entity)
-            groups_response[group_name].entities.append(entity_text_response)
-
-        return NamedEntitiesResponse._sort_groups(list(groups_response.values()))
+            indexes_by_group_name.setdefault(group_name, []).append(index)
+            top_entity = top_entity_by_group_name.get(group_name)
+            if top_entity is None or entity.relevance_percentage > top_entity.relevance_percentage:
+                top_entity_by_group_name[group_name] = entity
+
+        return [
+            GroupResponse.from_indexes(
+                entities_response, indexes, top_entity_by_group_name[group_name], groups_dict[group_name]
+            )
+            for group_name, indexes in indexes_by_group_name.items()
+        ]
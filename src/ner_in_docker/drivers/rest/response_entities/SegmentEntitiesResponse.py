@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.drivers.rest.response_entities.SegmentEntityResponse import SegmentEntityResponse
+from ner_in_docker.drivers.rest.response_entities.SegmentResponse import SegmentResponse
+
+
+class SegmentEntitiesResponse(BaseModel):
+    record: str = "segment"
+    source_id: str
+    segment: SegmentResponse
+    entities: list[SegmentEntityResponse]
+
+    @staticmethod
+    def from_segment(segment: Segment, named_entities: list[NamedEntity], first_index: int) -> "SegmentEntitiesResponse":
+        return SegmentEntitiesResponse(
+            source_id=segment.source_id,
+            segment=SegmentResponse.from_segment(segment),
+            entities=[SegmentEntityResponse.from_named_entity(first_index + i, x) for i, x in enumerate(named_entities)],
+        )
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.drivers.rest.response_entities.BoundingBoxResponse import BoundingBoxResponse
+
+
+class SegmentEntityResponse(BaseModel):
+    index: int
+    type: NamedEntityType
+    text: str
+    character_start: int
+    character_end: int
+    text_positions: list[BoundingBoxResponse] = []
+
+    @staticmethod
+    def from_named_entity(index: int, named_entity: NamedEntity) -> "SegmentEntityResponse":
+        return SegmentEntityResponse(
+            index=index,
+            type=named_entity.type,
+            text=named_entity.text,
+            character_start=named_entity.character_start,
+            character_end=named_entity.character_end,
+            text_positions=[BoundingBoxResponse.from_rectangle(x) for x in named_entity.text_positions],
+        )
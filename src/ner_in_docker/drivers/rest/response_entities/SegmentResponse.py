@@ -2,6 +2,7 @@ from pydantic import BaseModel
 
 from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
 from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.Segment import Segment
 from ner_in_docker.drivers.rest.response_entities.BoundingBoxResponse import BoundingBoxResponse
 
 
@@ -25,3 +26,15 @@ class SegmentResponse(BaseModel):
             bounding_box=BoundingBoxResponse.from_rectangle(named_entity.segment.bounding_box),
             pdf_name=named_entity.segment.source_id,
         )
+
+    @staticmethod
+    def from_segment(segment: Segment) -> "SegmentResponse":
+        return SegmentResponse(
+            text=segment.text,
+            page_number=segment.page_number,
+            segment_number=segment.segment_number,
+            character_start=0,
+            character_end=len(segment.text),
+            bounding_box=BoundingBoxResponse.from_rectangle(segment.bounding_box),
+            pdf_name=segment.source_id,
+        )
@@ -1,6 +1,7 @@
 from abc import abstractmethod, ABC
 
 from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.PriorEntity import PriorEntity
 from ner_in_docker.domain.Segment import Segment
 
 
@@ -10,10 +11,22 @@ class EntitiesStoreRepository(ABC):
     def get_entities(self) -> list[NamedEntity]:
         pass
 
+    @abstractmethod
+    def get_prior_entities(self) -> list[PriorEntity]:
+        pass
+
     @abstractmethod
     def save_entities(self, named_entities: list[NamedEntity]) -> bool:
         pass
 
+    @abstractmethod
+    def save_documents_entities(self, named_entities: list[NamedEntity], identifiers: list[str]) -> bool:
+        pass
+
+    @abstractmethod
+    def get_namespace_version(self) -> int:
+        pass
+
     @abstractmethod
     def delete_database(self):
         pass
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from ner_in_docker.domain.ExtractionJob import ExtractionJob
+
+
+class JobsRepository(ABC):
+
+    @abstractmethod
+    def create_job(self, job: ExtractionJob, pdf_content: bytes):
+        pass
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> ExtractionJob | None:
+        pass
+
+    @abstractmethod
+    def update_job(self, job: ExtractionJob):
+        pass
+
+    @abstractmethod
+    def claim_next_job(self, worker_pid: int, lease_seconds: float) -> ExtractionJob | None:
+        pass
+
+    @abstractmethod
+    def renew_lease(self, job: ExtractionJob, lease_seconds: float):
+        pass
+
+    @abstractmethod
+    def requeue_abandoned_jobs(self) -> int:
+        pass
+
+    @abstractmethod
+    def get_pdf_path(self, job: ExtractionJob) -> Path:
+        pass
+
+    @abstractmethod
+    def finish_job(self, job: ExtractionJob, result: str | None):
+        pass
+
+    @abstractmethod
+    def get_result(self, job_id: str) -> str | None:
+        pass
@@ -8,12 +8,18 @@ from ner_in_docker.domain.Segment import Segment
 
 class PDFToSegmentsRepository(ABC):
 
-    @staticmethod
     @abstractmethod
-    def get_segments(pdf_path: Path, fast: bool) -> list[Segment]:
+    def get_segments(self, pdf_path: Path, fast: bool) -> list[Segment]:
         pass
 
-    @staticmethod
     @abstractmethod
-    def get_word_positions(pdf_path: Path) -> list[PdfWord]:
+    def get_word_positions(self, pdf_path: Path) -> list[PdfWord]:
+        pass
+
+    @abstractmethod
+    def get_segments_from_content(self, pdf_content: bytes, pdf_name: str, fast: bool) -> list[Segment]:
+        pass
+
+    @abstractmethod
+    def get_word_positions_from_content(self, pdf_content: bytes, pdf_name: str) -> list[PdfWord]:
         pass
@@ -0,0 +1,76 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable
+
+
+class BatchInferenceScheduler:
+    def __init__(self, predict_batch: Callable[[list[Any]], list[Any]], max_batch_size: int, max_wait_seconds: float):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_seconds)
+        self.queue: queue.Queue[tuple[Any, Future]] = queue.Queue()
+        self.lock = threading.Lock()
+        self.worker: threading.Thread | None = None
+        self.worker_pid: int | None = None
+
+    def predict(self, items: list[Any]) -> list[Any]:
+        if not items:
+            return []
+
+        self._ensure_worker()
+        futures = []
+        for item in items:
+            future = Future()
+            self.queue.put((item, future))
+            futures.append(future)
+
+        return [future.result() for future in futures]
+
+    def _ensure_worker(self):
+        with self.lock:
+            if self.worker and self.worker.is_alive() and self.worker_pid == os.getpid():
+                return
+
+            self.queue = queue.Queue()
+            self.worker = threading.Thread(target=self._run, name="batch-inference-scheduler", daemon=True)
+            self.worker_pid = os.getpid()
+            self.worker.start()
+
+    def _next_batch(self) -> list[tuple[Any, Future]]:
+        batch = [self.queue.get()]
+        deadline = time.monotonic() + self.max_wait_seconds
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+                continue
+            except queue.Empty:
+                pass
+
+            remaining_seconds = deadline - time.monotonic()
+            if remaining_seconds <= 0:
+                break
+
+            try:
+                batch.append(self.queue.get(timeout=remaining_seconds))
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                results = self.predict_batch([item for item, _ in batch])
+                if len(results) != len(batch):
+                    raise ValueError(f"Expected {len(batch)} predictions, got {len(results)}")
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
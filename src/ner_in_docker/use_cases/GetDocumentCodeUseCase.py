@@ -14,17 +14,7 @@ class GetDocumentCodeUseCase:
 
     @staticmethod
     def remove_overlapping_entities(entities: list[NamedEntity]):
-        sorted_entities = sorted(entities, key=lambda x: (x.character_start, -len(x.text)))
-
-        result = []
-        last_end = -1
-
-        for entity in sorted_entities:
-            if entity.character_start >= last_end:
-                result.append(entity)
-                last_end = entity.character_end
-
-        return result
+        return NamedEntity.remove_overlapping_entities(entities)
 
     def find_un_codes(self, text: str) -> List[str]:
         words = re.split(r"\s+|,|\(|\)|\[|\]", text)
@@ -1,25 +1,39 @@
+import threading
 from pathlib import Path
 from flair.nn import Classifier
-from ner_in_docker.configuration import MODELS_PATH
+from ner_in_docker.configuration import MODELS_PATH, FLAIR_MAX_BATCH_SIZE, FLAIR_MAX_WAIT_MILLISECONDS
 from ner_in_docker.domain.NamedEntity import NamedEntity
 from flair.data import Sentence, Span
 from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.use_cases.BatchInferenceScheduler import BatchInferenceScheduler
 
-flair_model = Classifier.load(Path(MODELS_PATH, "flair", "pytorch_model.bin"))
+flair_model: Classifier | None = None
+flair_model_lock = threading.Lock()
+
+
+def get_flair_model() -> Classifier:
+    global flair_model
+    with flair_model_lock:
+        if flair_model is None:
+            flair_model = Classifier.load(Path(MODELS_PATH, "flair", "pytorch_model.bin"))
+        return flair_model
+
+
+def predict_sentences(sentences: list[Sentence]) -> list[Sentence]:
+    get_flair_model().predict(sorted(sentences, key=lambda x: len(x), reverse=True), mini_batch_size=FLAIR_MAX_BATCH_SIZE)
+    return sentences
+
+
+flair_scheduler = BatchInferenceScheduler(predict_sentences, FLAIR_MAX_BATCH_SIZE, FLAIR_MAX_WAIT_MILLISECONDS / 1000)
 
 
 class GetFlairEntitiesUseCase:
+    def __init__(self, scheduler: BatchInferenceScheduler = flair_scheduler):
+        self.scheduler = scheduler
 
     @staticmethod
     def remove_overlapping_entities(entities: list[NamedEntity]) -> list[NamedEntity]:
-        sorted_entities = sorted(entities, key=lambda x: (x.character_start, -len(x.text)))
-        result = []
-        last_end = -1
-        for entity in sorted_entities:
-            if entity.character_start >= last_end:
-                result.append(entity)
-                last_end = entity.character_end
-        return result
+        return NamedEntity.remove_overlapping_entities(entities)
 
     @staticmethod
     def convert_to_named_entity_type(flair_raw_result: list[Span]) -> list[NamedEntity]:
@@ -48,10 +62,18 @@ class GetFlairEntitiesUseCase:
             filtered_entities.append(entity)
         return filtered_entities
 
-    def get_entities(self, text: str) -> list[NamedEntity]:
-        sentence = Sentence(text)
-        flair_model.predict(sentence)
+    def get_entities_from_sentence(self, sentence: Sentence) -> list[NamedEntity]:
         flair_raw_result: list[Span] = sentence.get_spans("ner")
         entities = self.convert_to_named_entity_type(flair_raw_result)
         entities = self.remove_overlapping_entities(entities)
         return entities
+
+    def get_entities(self, text: str) -> list[NamedEntity]:
+        sentence = self.scheduler.predict([Sentence(text)])[0]
+        return self.get_entities_from_sentence(sentence)
+
+    def get_entities_from_texts(self, texts: list[str]) -> list[list[NamedEntity]]:
+        sentences = [Sentence(text) if text.strip() else None for text in texts]
+        sentences_by_length = sorted([x for x in sentences if x], key=lambda x: len(x), reverse=True)
+        self.scheduler.predict(sentences_by_length)
+        return [self.get_entities_from_sentence(sentence) if sentence else [] for sentence in sentences]
@@ -21,17 +21,7 @@ class GetGLiNEREntitiesUseCase:
 
     @staticmethod
     def remove_overlapping_entities(entities: list[NamedEntity]):
-        sorted_entities = sorted(entities, key=lambda x: (x.character_start, -len(x.text)))
-
-        result = []
-        last_end = -1
-
-        for entity in sorted_entities:
-            if entity.character_start >= last_end:
-                result.append(entity)
-                last_end = entity.character_end
-
-        return result
+        return NamedEntity.remove_overlapping_entities(entities)
 
     def convert_to_named_entity_type(self, window_entities: list[dict]):
         result = []
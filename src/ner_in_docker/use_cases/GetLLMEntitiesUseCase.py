@@ -41,14 +41,7 @@ class GetLLMEntitiesUseCase:
 
     @staticmethod
     def remove_overlapping_entities(entities: list[NamedEntity]) -> list[NamedEntity]:
-        sorted_entities = sorted(entities, key=lambda x: (x.character_start, -len(x.text)))
-        result = []
-        last_end = -1
-        for entity in sorted_entities:
-            if entity.character_start >= last_end:
-                result.append(entity)
-                last_end = entity.character_end
-        return result
+        return NamedEntity.remove_overlapping_entities(entities)
 
     def _build_prompt(self, text: str) -> str:
         return f"""Extract all named entities from the text below. Return ONLY a valid JSON array with no additional text, markdown, or explanations.
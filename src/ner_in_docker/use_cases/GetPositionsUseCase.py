@@ -1,15 +1,12 @@
-from pathlib import Path
-
 from pdf_features.PdfTextPosition import PdfTextPosition
+from pdf_features.PdfWord import PdfWord
 
 from ner_in_docker.domain.NamedEntity import NamedEntity
-from ner_in_docker.ports.PDFToSegmentsRepository import PDFToSegmentsRepository
 
 
 class GetPositionsUseCase:
-    def __init__(self, pdf_to_segments_repository: PDFToSegmentsRepository, pdf_path: Path):
-        self.pdf_to_segments_repository = pdf_to_segments_repository
-        self.pdf_words = self.pdf_to_segments_repository.get_word_positions(pdf_path)
+    def __init__(self, pdf_words: list[PdfWord]):
+        self.pdf_words = pdf_words
         self.pdf_text_position = PdfTextPosition(self.pdf_words)
 
     def add_positions(self, named_entities: list[NamedEntity]) -> list:
@@ -1,69 +1,81 @@
 from ner_in_docker.domain.NamedEntity import NamedEntity
 from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityGroupIndex import NamedEntityGroupIndex
 from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.PriorGroupsIndex import PriorGroupsIndex
+from ner_in_docker.domain.SimilarTextsMatrix import SimilarTextsMatrix
 
 
 class GroupNamedEntitiesUseCase:
-    def __init__(self, prior_entities: list[NamedEntity] = None, language: str = "en"):
+    def __init__(
+        self,
+        prior_entities: list[NamedEntity] = None,
+        language: str = "en",
+        prior_groups_index: PriorGroupsIndex | None = None,
+    ):
         self.prior_entities = prior_entities if prior_entities else []
         self.language = language
-        self.prior_groups: dict[str, NamedEntityGroup] = dict()
-        self._initialize_prior_groups()
+        self.prior_groups_index = prior_groups_index
+        if self.prior_groups_index is None:
+            self.prior_groups_index = PriorGroupsIndex.from_entities(self.prior_entities)
+        self.used_prior_groups_names: set[str] = set()
         self.groups: dict[str, NamedEntityGroup] = dict()
-
-    def _initialize_prior_groups(self):
-        sorted_prior_entities = sorted(self.prior_entities, key=lambda x: x.relevance_percentage, reverse=True)
-        for prior_entity in sorted_prior_entities:
-            group_name = prior_entity.group_name
-            if group_name in self.prior_groups:
-                self.prior_groups[group_name].named_entities.append(prior_entity)
-                continue
-
-            self.prior_groups[group_name] = NamedEntityGroup(
-                type=prior_entity.type,
-                name=prior_entity.group_name,
-                named_entities=[prior_entity],
-                top_relevance_entity=prior_entity,
-            )
+        self.groups_index = NamedEntityGroupIndex()
+        self.similar_texts: SimilarTextsMatrix | None = None
 
     def group(self, named_entities: list[NamedEntity]) -> list[NamedEntityGroup]:
         self._calculate_relevance_scores(named_entities)
+        normalized_entities = [x.get_with_normalize_entity_text(self.language) for x in named_entities]
 
-        for named_entity in named_entities:
-            normalized_entity = named_entity.get_with_normalize_entity_text(self.language)
+        with self.prior_groups_index.lock:
+            self.similar_texts = self._get_similar_texts(normalized_entities)
+            for normalized_entity in normalized_entities:
+                if self._try_assign_to_prior_group(normalized_entity):
+                    continue
 
-            if self._try_assign_to_prior_group(normalized_entity):
-                continue
+                if self._try_assign_to_existing_group(normalized_entity):
+                    continue
 
-            if self._try_assign_to_existing_group(normalized_entity):
-                continue
-
-            self._create_new_group_for_entity(normalized_entity)
+                self._create_new_group_for_entity(normalized_entity)
 
         self._remove_empty_references_groups()
         return list(self.groups.values())
 
     @staticmethod
     def _calculate_relevance_scores(named_entities: list[NamedEntity]):
-        for named_entity in named_entities:
-            named_entity.set_relevance_score(named_entities)
+        NamedEntity.set_relevance_scores(named_entities)
+
+    def _get_similar_texts(self, named_entities: list[NamedEntity]) -> SimilarTextsMatrix:
+        texts = [x.normalized_text for x in named_entities]
+        prior_texts = set()
+        for text in set(texts):
+            prior_texts.update(self.prior_groups_index.get_candidate_texts(text))
+        return SimilarTextsMatrix(texts, texts + list(prior_texts))
 
     def _try_assign_to_prior_group(self, named_entity: NamedEntity) -> bool:
-        for prior_group in self.prior_groups.values():
-            if prior_group.belongs_to_group(named_entity):
-                named_entity.group_name = prior_group.name
-                prior_group.named_entities = [named_entity]
-                prior_group.top_relevance_entity = self._determine_top_relevance_entity(
-                    prior_group.top_relevance_entity, named_entity
-                )
-                del self.prior_groups[prior_group.name]
-                self.groups[prior_group.name] = prior_group
+        for prior_group, candidate_texts in self.prior_groups_index.get_candidates(named_entity):
+            if prior_group.name in self.used_prior_groups_names:
+                continue
+
+            if prior_group.belongs_to_group(named_entity, candidate_texts, self.similar_texts):
+                self._assign_to_prior_group(named_entity, prior_group)
                 return True
         return False
 
+    def _assign_to_prior_group(self, named_entity: NamedEntity, prior_group: NamedEntityGroup):
+        named_entity.group_name = prior_group.name
+        group = NamedEntityGroup(
+            type=prior_group.type,
+            name=prior_group.name,
+            named_entities=[named_entity],
+            top_relevance_entity=self._determine_top_relevance_entity(prior_group.top_relevance_entity, named_entity),
+        )
+        self.used_prior_groups_names.add(prior_group.name)
+        self._set_group(prior_group.name, group)
+
     def _try_assign_to_existing_group(self, named_entity: NamedEntity) -> bool:
-        for group in self.groups.values():
-            if group.belongs_to_group(named_entity):
+        for group, candidate_texts in self.groups_index.get_candidates(named_entity):
+            if group.belongs_to_group(named_entity, candidate_texts, self.similar_texts):
                 self._assign_to_existing_group(named_entity, group)
                 return True
         return False
@@ -71,15 +83,24 @@ class GroupNamedEntitiesUseCase:
     def _assign_to_existing_group(self, named_entity: NamedEntity, group: NamedEntityGroup):
         better_group_name = self._choose_better_group_name(group.name, named_entity.text, named_entity.type)
         if better_group_name != group.name:
-            del self.groups[group.name]
+            self._delete_group(group.name)
             group.name = better_group_name
-            self.groups[better_group_name] = group
+            self._set_group(better_group_name, group)
             for entity in group.named_entities:
                 entity.group_name = better_group_name
 
         named_entity.group_name = group.name
         group.top_relevance_entity = self._determine_top_relevance_entity(group.top_relevance_entity, named_entity)
         group.named_entities.append(named_entity)
+        self.groups_index.add_named_entity(group.name, named_entity)
+
+    def _set_group(self, name: str, group: NamedEntityGroup):
+        self.groups[name] = group
+        self.groups_index.set_group(name, group)
+
+    def _delete_group(self, name: str):
+        del self.groups[name]
+        self.groups_index.delete_group(name)
 
     @staticmethod
     def _choose_better_group_name(current_name: str, candidate_name: str, entity_type: NamedEntityType) -> str:
@@ -99,9 +120,10 @@ class GroupNamedEntitiesUseCase:
         group_name = self._get_group_name_for_entity(named_entity)
         named_entity.group_name = group_name
 
-        self.groups[group_name] = NamedEntityGroup(
+        group = NamedEntityGroup(
             type=named_entity.type, name=group_name, named_entities=[named_entity], top_relevance_entity=named_entity
         )
+        self._set_group(group_name, group)
 
     @staticmethod
     def _get_group_name_for_entity(named_entity: NamedEntity) -> str:
@@ -122,4 +144,4 @@ class GroupNamedEntitiesUseCase:
             keys_to_remove.append(key)
 
         for key in keys_to_remove:
-            del self.groups[key]
+            self._delete_group(key)
@@ -13,16 +13,31 @@ class NamedEntitiesUseCase:
         self.document_code_extractor = GetDocumentCodeUseCase()
 
     def get_entities_from_text(self, text: str) -> list[NamedEntity]:
+        return self.merge_entities(text, self.entity_extractor.get_entities(text))
+
+    def merge_entities(self, text: str, flair_entities: list[NamedEntity]) -> list[NamedEntity]:
         entities = []
         entities.extend(self.date_extractor.extract_dates(text))
-        entities.extend(self.entity_extractor.get_entities(text))
+        entities.extend(flair_entities)
         entities.extend(self.document_code_extractor.extract_document_codes(text))
         return sorted(entities, key=lambda x: x.character_start)
 
     def get_entities_from_segments(self, segments: list[Segment]) -> list[NamedEntity]:
+        flair_entities_by_segment = self.entity_extractor.get_entities_from_texts([segment.text for segment in segments])
+
         entities: list[NamedEntity] = []
-        for segment in segments:
-            named_entities: list[NamedEntity] = self.get_entities_from_text(segment.text)
+        for segment, flair_entities in zip(segments, flair_entities_by_segment):
+            named_entities: list[NamedEntity] = self.merge_entities(segment.text, flair_entities)
             pdf_named_entities = [NamedEntity.from_segment(named_entity, segment) for named_entity in named_entities]
             entities.extend(pdf_named_entities)
         return entities
+
+    def get_entities_from_documents(self, documents_segments: list[list[Segment]]) -> list[list[NamedEntity]]:
+        entities = self.get_entities_from_segments([segment for segments in documents_segments for segment in segments])
+        document_index_by_segment = {
+            id(segment): index for index, segments in enumerate(documents_segments) for segment in segments
+        }
+        documents_entities: list[list[NamedEntity]] = [list() for _ in documents_segments]
+        for entity in entities:
+            documents_entities[document_index_by_segment[id(entity.segment)]].append(entity)
+        return documents_entities
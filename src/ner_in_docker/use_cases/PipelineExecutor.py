@@ -0,0 +1,53 @@
+import asyncio
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from typing import Any, Callable
+
+
+class PipelineExecutor:
+    def __init__(self, max_workers: int, max_queue_size: int, name: str = "pipeline"):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = self.max_workers + max(0, max_queue_size)
+        self.name = name
+        self.pending = 0
+        self.lock = threading.Lock()
+        self.executor: ThreadPoolExecutor | None = None
+        self.executor_pid: int | None = None
+
+    def submit(self, function: Callable[..., Any], *args, **kwargs) -> Future:
+        with self.lock:
+            executor = self._get_executor()
+            if self.pending >= self.max_pending:
+                raise queue.Full(f"{self.name} executor has {self.pending} pending tasks")
+            self.pending += 1
+
+        try:
+            future = executor.submit(partial(function, *args, **kwargs))
+        except Exception:
+            self._release()
+            raise
+
+        future.add_done_callback(lambda _: self._release())
+        return future
+
+    async def run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        return await asyncio.wrap_future(self.submit(function, *args, **kwargs))
+
+    def get_pending(self) -> int:
+        with self.lock:
+            return self.pending
+
+    def _release(self):
+        with self.lock:
+            self.pending -= 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self.executor is None or self.executor_pid != os.getpid():
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+            self.executor_pid = os.getpid()
+            self.pending = 0
+
+        return self.executor
@@ -0,0 +1,79 @@
+import threading
+from collections import OrderedDict
+
+from ner_in_docker.configuration import PRIOR_GROUPS_INDEX_MAX_NAMESPACES
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.PriorGroupsIndex import PriorGroupsIndex
+from ner_in_docker.ports.EntitiesStoreRepository import EntitiesStoreRepository
+
+
+class PriorGroupsIndexUseCase:
+    prior_groups_indexes: OrderedDict[str, PriorGroupsIndex] = OrderedDict()
+    locks: dict[str, threading.Lock] = dict()
+    lock = threading.Lock()
+
+    def __init__(
+        self,
+        entities_store_repository: EntitiesStoreRepository,
+        namespace: str,
+        language: str = "en",
+        max_namespaces: int = PRIOR_GROUPS_INDEX_MAX_NAMESPACES,
+    ):
+        self.entities_store_repository = entities_store_repository
+        self.key = f"{namespace}_{language}"
+        self.max_namespaces = max(1, max_namespaces)
+        with self.lock:
+            self.key_lock = self.locks.setdefault(self.key, threading.Lock())
+
+    def get_cached_prior_groups_index(self) -> PriorGroupsIndex | None:
+        with self.lock:
+            prior_groups_index = self.prior_groups_indexes.get(self.key)
+            if prior_groups_index is not None:
+                self.prior_groups_indexes.move_to_end(self.key)
+            return prior_groups_index
+
+    def cache_prior_groups_index(self, prior_groups_index: PriorGroupsIndex):
+        with self.lock:
+            self.prior_groups_indexes[self.key] = prior_groups_index
+            self.prior_groups_indexes.move_to_end(self.key)
+            while len(self.prior_groups_indexes) > self.max_namespaces:
+                key, _ = self.prior_groups_indexes.popitem(last=False)
+                if not self.locks[key].locked():
+                    self.locks.pop(key)
+
+    def forget_prior_groups_index(self):
+        with self.lock:
+            self.prior_groups_indexes.pop(self.key, None)
+
+    def get_prior_groups_index(self) -> PriorGroupsIndex:
+        with self.key_lock:
+            namespace_version = self.entities_store_repository.get_namespace_version()
+            prior_groups_index = self.get_cached_prior_groups_index()
+            if prior_groups_index is None or prior_groups_index.namespace_version != namespace_version:
+                prior_entities = self.entities_store_repository.get_prior_entities()
+                prior_groups_index = PriorGroupsIndex.from_prior_entities(prior_entities)
+                prior_groups_index.namespace_version = namespace_version
+                self.cache_prior_groups_index(prior_groups_index)
+            return prior_groups_index
+
+    def save_entities(self, named_entities: list[NamedEntity], identifiers: list[str] | None = None) -> bool:
+        with self.key_lock:
+            saved = self.entities_store_repository.save_documents_entities(named_entities, identifiers or [])
+            prior_groups_index = self.get_cached_prior_groups_index()
+            if not saved or not prior_groups_index:
+                self.forget_prior_groups_index()
+                return saved
+
+            namespace_version = self.entities_store_repository.get_namespace_version()
+            if prior_groups_index.namespace_version is None or namespace_version != prior_groups_index.namespace_version + 1:
+                self.forget_prior_groups_index()
+                return saved
+
+            prior_groups_index.add_entities(named_entities)
+            prior_groups_index.namespace_version = namespace_version
+
+        return saved
+
+    def delete_prior_groups_index(self):
+        with self.key_lock:
+            self.forget_prior_groups_index()
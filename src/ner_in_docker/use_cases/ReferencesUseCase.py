@@ -2,6 +2,8 @@ from ner_in_docker.configuration import TITLES_TYPES
 from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
 from ner_in_docker.domain.NamedEntityType import NamedEntityType
 from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.PriorGroupsIndex import PriorGroupsIndex
+from ner_in_docker.domain.ReferencesMatcher import ReferencesMatcher
 from ner_in_docker.domain.Segment import Segment
 from pdf_token_type_labels import TokenType
 
@@ -10,15 +12,22 @@ class ReferencesUseCase:
     def __init__(self, prior_entities: list[NamedEntity] = None):
         self.prior_entities = prior_entities if prior_entities else []
         self.references_groups: list[NamedEntityGroup] = list()
+        self.references_matcher: ReferencesMatcher | None = None
         self.load_reference_destinations_groups()
 
+    @staticmethod
+    def from_prior_groups_index(prior_groups_index: PriorGroupsIndex) -> "ReferencesUseCase":
+        references_use_case = ReferencesUseCase()
+        references_use_case.references_groups = prior_groups_index.get_reference_destinations()
+        references_use_case.references_matcher = prior_groups_index.get_references_matcher()
+        return references_use_case
+
     def get_entities(self, segment: Segment) -> list[NamedEntity]:
         if str(segment.type).lower() in TITLES_TYPES:
             return []
 
         entities: list[NamedEntity] = list()
-        for group in self.references_groups:
-            positions = group.get_references_in_text(segment.text)
+        for group, positions in self.get_references_matcher().get_references_in_text(segment.text):
             for character_start, character_end in positions:
                 entity = NamedEntity(
                     type=NamedEntityType.REFERENCE,
@@ -32,7 +41,19 @@ class ReferencesUseCase:
 
         return self.remove_references_in_same_words(entities)
 
+    def get_references_matcher(self) -> ReferencesMatcher:
+        if self.references_matcher is None or self.references_matcher.groups_count != len(self.references_groups):
+            self.references_matcher = ReferencesMatcher(self.references_groups)
+        return self.references_matcher
+
     def get_entities_from_segments(self, segments: list[Segment]) -> list[NamedEntity]:
+        reference_entities = self.get_titles_entities(segments)
+        for segment in segments:
+            reference_entities.extend(self.get_entities(segment))
+
+        return reference_entities
+
+    def get_titles_entities(self, segments: list[Segment]) -> list[NamedEntity]:
         reference_entities: list[NamedEntity] = list()
 
         for segment in segments:
@@ -59,45 +80,11 @@ class ReferencesUseCase:
                     )
                 )
 
-        for segment in segments:
-            reference_entities.extend(self.get_entities(segment))
-
         return reference_entities
 
     def load_reference_destinations_groups(self):
-        for entity in self.prior_entities:
-            if entity.type == NamedEntityType.REFERENCE and entity.relevance_percentage == 100:
-                self.references_groups.append(
-                    NamedEntityGroup(
-                        type=NamedEntityType.REFERENCE,
-                        name=entity.text,
-                    )
-                )
+        self.references_groups.extend(PriorGroupsIndex.get_reference_destinations_from_entities(self.prior_entities))
 
     @staticmethod
     def remove_references_in_same_words(entities: list[NamedEntity]) -> list[NamedEntity]:
-        only_references = [e for e in entities if e.type == NamedEntityType.REFERENCE]
-        ordered_entities = sorted(
-            only_references,
-            key=lambda e: (e.segment.source_id, e.segment.page_number, e.segment.segment_number, e.character_start),
-        )
-        indexes_to_remove = set()
-        for index, (entity, next_entity) in enumerate(zip(ordered_entities, ordered_entities[1:])):
-            if entity.segment.source_id != next_entity.segment.source_id:
-                continue
-            if entity.segment.page_number != next_entity.segment.page_number:
-                continue
-            if entity.segment.segment_number != next_entity.segment.segment_number:
-                continue
-            if entity.character_end <= next_entity.character_start:
-                continue
-            if len(entity.text) > len(next_entity.text):
-                indexes_to_remove.add(index + 1)
-            else:
-                indexes_to_remove.add(index)
-
-        for index in indexes_to_remove:
-            entity_index = entities.index(ordered_entities[index])
-            del entities[entity_index]
-
-        return entities
+        return NamedEntity.remove_overlapping_references(entities)
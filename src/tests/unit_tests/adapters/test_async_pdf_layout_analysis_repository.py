@@ -0,0 +1,125 @@
+import json
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import TestCase
+
+import httpx
+
+from ner_in_docker.adapters.AsyncPDFLayoutAnalysisRepository import AsyncPDFLayoutAnalysisRepository
+from ner_in_docker.adapters.LayoutAnalysisCache import LayoutAnalysisCache
+
+SEGMENT_BOX = {"left": 1, "top": 2, "width": 3, "height": 4, "page_number": 1, "text": "Maria Diaz", "type": "Text"}
+PDF_WORD = {"text": "Maria", "bounding_box": {"left": 1, "top": 2, "right": 4, "bottom": 6}, "page_number": 1}
+
+
+class StubLayoutAnalysisHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers["Content-Length"]))
+        with server.lock:
+            server.requests_count += 1
+            server.active_requests += 1
+            server.max_active_requests = max(server.max_active_requests, server.active_requests)
+            status_code = server.status_codes.pop(0) if server.status_codes else 200
+
+        time.sleep(server.delay_seconds)
+        body = json.dumps([PDF_WORD] if self.path == "/word_positions" else [SEGMENT_BOX]).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.active_requests -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class TestAsyncPDFLayoutAnalysisRepository(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubLayoutAnalysisHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests_count = 0
+        self.server.active_requests = 0
+        self.server.max_active_requests = 0
+        self.server.status_codes = []
+        self.server.delay_seconds = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.service_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.repository = AsyncPDFLayoutAnalysisRepository(self.service_url, max_concurrency=2, backoff_seconds=0)
+
+    def tearDown(self):
+        self.repository.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_get_segments_and_word_positions(self):
+        segments = self.repository.get_segments_from_content(b"pdf content", "document.pdf", fast=True)
+        pdf_words = self.repository.get_word_positions_from_content(b"pdf content", "document.pdf")
+
+        self.assertEqual(["Maria Diaz"], [x.text for x in segments])
+        self.assertEqual("document.pdf", segments[0].source_id)
+        self.assertEqual(1, segments[0].segment_number)
+        self.assertEqual(["Maria"], [x.text for x in pdf_words])
+
+    def test_get_word_positions_future_while_getting_segments(self):
+        word_positions_future = self.repository.get_word_positions_future(b"pdf content", "document.pdf")
+        segments = self.repository.get_segments_from_content(b"pdf content", "document.pdf")
+
+        self.assertEqual(["Maria Diaz"], [x.text for x in segments])
+        self.assertEqual(["Maria"], [x.text for x in word_positions_future.result()])
+        self.assertEqual(2, self.server.requests_count)
+
+    def test_retry_unavailable_service(self):
+        self.server.status_codes = [503, 502]
+
+        segments = self.repository.get_segments_from_content(b"pdf content", "document.pdf")
+
+        self.assertEqual(["Maria Diaz"], [x.text for x in segments])
+        self.assertEqual(3, self.server.requests_count)
+
+    def test_raise_after_retries(self):
+        self.server.status_codes = [503, 503, 503]
+
+        with self.assertRaises(httpx.HTTPStatusError):
+            self.repository.get_segments_from_content(b"pdf content", "document.pdf")
+
+        self.assertEqual(3, self.server.requests_count)
+
+    def test_concurrency_cap(self):
+        self.server.delay_seconds = 0.1
+
+        futures = [
+            self.repository.submit(self.repository._get_segments(b"pdf content", f"{index}.pdf", False))
+            for index in range(6)
+        ]
+
+        self.assertEqual(6, len([x.result() for x in futures]))
+        self.assertEqual(2, self.server.max_active_requests)
+
+    def test_timeout(self):
+        self.server.delay_seconds = 0.5
+        repository = AsyncPDFLayoutAnalysisRepository(self.service_url, timeout_seconds=0.1, retries=0)
+
+        with self.assertRaises(httpx.TimeoutException):
+            repository.get_segments_from_content(b"pdf content", "document.pdf")
+
+        repository.close()
+
+    def test_cache(self):
+        with tempfile.TemporaryDirectory() as cache_path:
+            cache = LayoutAnalysisCache(Path(cache_path))
+            repository = AsyncPDFLayoutAnalysisRepository(self.service_url, cache=cache)
+
+            repository.get_segments_from_content(b"pdf content", "first.pdf", fast=True)
+            segments = repository.get_segments_from_content(b"pdf content", "second.pdf", fast=True)
+            repository.get_segments_from_content(b"pdf content", "second.pdf", fast=False)
+            repository.close()
+
+        self.assertEqual("second.pdf", segments[0].source_id)
+        self.assertEqual(2, self.server.requests_count)
+        self.assertEqual((1, 2), (cache.get_metrics()["hits"], cache.get_metrics()["misses"]))
@@ -0,0 +1,50 @@
+import os
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from ner_in_docker.adapters.LayoutAnalysisCache import LayoutAnalysisCache
+
+
+class TestLayoutAnalysisCache(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.cache = LayoutAnalysisCache(Path(self.temporary_directory.name), max_megabytes=1)
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_get_and_put(self):
+        key = LayoutAnalysisCache.get_key(b"pdf content", LayoutAnalysisCache.get_segments_kind(True))
+
+        self.assertIsNone(self.cache.get(key))
+        self.cache.put(key, [{"text": "Maria Diaz", "page_number": 1}])
+
+        self.assertEqual([{"text": "Maria Diaz", "page_number": 1}], self.cache.get(key))
+        metrics = self.cache.get_metrics()
+        self.assertEqual((1, 1, 1, 0.5), (metrics["hits"], metrics["misses"], metrics["writes"], metrics["hit_ratio"]))
+
+    def test_fast_and_accurate_keys(self):
+        fast_key = LayoutAnalysisCache.get_key(b"pdf content", LayoutAnalysisCache.get_segments_kind(True))
+        accurate_key = LayoutAnalysisCache.get_key(b"pdf content", LayoutAnalysisCache.get_segments_kind(False))
+
+        self.cache.put(fast_key, ["fast"])
+
+        self.assertNotEqual(fast_key, accurate_key)
+        self.assertIsNone(self.cache.get(accurate_key))
+
+    def test_evict_least_recently_used(self):
+        payload = os.urandom(250 * 1024).hex()
+        keys = [LayoutAnalysisCache.get_key(str(index).encode(), "word_positions") for index in range(3)]
+        for index, key in enumerate(keys):
+            self.cache.put(key, payload)
+            os.utime(self.cache.get_path(key), (time.time() - 100 + index, time.time() - 100 + index))
+        self.cache.get(keys[0])
+
+        self.cache.put(LayoutAnalysisCache.get_key(b"new", "word_positions"), payload)
+
+        self.assertIsNotNone(self.cache.get(keys[0]))
+        self.assertIsNone(self.cache.get(keys[1]))
+        self.assertLessEqual(self.cache.get_metrics()["size_bytes"], 1024 * 1024)
+        self.assertGreater(self.cache.get_metrics()["evictions"], 0)
@@ -0,0 +1,270 @@
+from unittest import TestCase, SkipTest
+
+import psycopg2
+from pdf_features import Rectangle
+
+from ner_in_docker.adapters.PostgresEntitiesStoreRepository import PostgresEntitiesStoreRepository
+from ner_in_docker.adapters.PostgresMigrations import PostgresMigrations
+from ner_in_docker.configuration import POSTGRES_POOL_HEALTH_CHECK_SECONDS
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.PriorGroupsIndex import PriorGroupsIndex
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.use_cases.PriorGroupsIndexUseCase import PriorGroupsIndexUseCase
+
+
+class TestPostgresEntitiesStoreRepository(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        repository = PostgresEntitiesStoreRepository("unit_tests")
+        try:
+            psycopg2.connect(**repository.pool.connection_parameters, connect_timeout=2).close()
+        except psycopg2.OperationalError:
+            raise SkipTest("Postgres is not available")
+
+    def setUp(self):
+        self.repository = PostgresEntitiesStoreRepository("unit_tests")
+        self.repository.delete_database()
+
+    def tearDown(self):
+        self.repository.pool.health_check_seconds = POSTGRES_POOL_HEALTH_CHECK_SECONDS
+        self.repository.delete_database()
+
+    @staticmethod
+    def get_segments(source_id: str) -> list[Segment]:
+        return [
+            Segment(
+                text=f"Maria Diaz {index}",
+                page_number=1,
+                segment_number=index,
+                source_id=source_id,
+                bounding_box=Rectangle.from_width_height(0, 0, 10, 10),
+            )
+            for index in range(3)
+        ]
+
+    @staticmethod
+    def get_entity(text: str, segment: Segment) -> NamedEntity:
+        entity = NamedEntity(type=NamedEntityType.PERSON, text=text, character_start=0, character_end=len(text))
+        return NamedEntity.from_segment(entity, segment)
+
+    def get_saved_entities(self) -> list[tuple]:
+        with self.repository.pool.cursor() as cursor:
+            cursor.execute(
+                f"""SELECT named_entities.text, segments.source_id, segments.segment_number FROM {self.repository.schema_name}.named_entities
+                LEFT JOIN {self.repository.schema_name}.segments ON segments.id = named_entities.segment_id
+                ORDER BY named_entities.id"""
+            )
+            return cursor.fetchall()
+
+    def test_save_documents_entities(self):
+        first_segments = self.get_segments("first.pdf")
+        second_segments = self.get_segments("second.pdf")
+        self.repository.save_segments(first_segments + second_segments)
+        entities = [self.get_entity(f"Maria {index}", first_segments[index % 3]) for index in range(2500)]
+        entities += [self.get_entity("John Smith", second_segments[0])]
+
+        self.assertTrue(self.repository.save_documents_entities(entities, ["first.pdf", "third.pdf", "third.pdf"]))
+        self.assertTrue(self.repository.save_entities([self.get_entity("Maria Diaz", first_segments[1])]))
+
+        self.assertEqual([("John Smith", "second.pdf", 0), ("Maria Diaz", "first.pdf", 1)], self.get_saved_entities())
+        self.assertEqual(["first.pdf", "second.pdf", "third.pdf"], sorted(self.repository.get_identifiers()))
+
+    def test_save_entities_without_stored_segment(self):
+        self.repository.save_segments(self.get_segments("first.pdf"))
+        segment = Segment.from_text("Maria Diaz", "first.pdf")
+        segment.page_number = 7
+
+        self.repository.save_entities([self.get_entity("Maria Diaz", segment)])
+
+        self.assertEqual([("Maria Diaz", None, None)], self.get_saved_entities())
+
+    def test_replace_entities_without_stored_segments(self):
+        prior_groups_index_use_case = PriorGroupsIndexUseCase(self.repository, "unit_tests")
+        prior_groups_index_use_case.save_entities([self.get_entity("Maria Diaz", Segment.from_text("Maria Diaz", "a.pdf"))])
+        prior_groups_index = prior_groups_index_use_case.get_prior_groups_index()
+
+        prior_groups_index_use_case.save_entities([self.get_entity("Jose Perez", Segment.from_text("Jose Perez", "a.pdf"))])
+        reloaded_prior_groups_index = PriorGroupsIndex.from_prior_entities(self.repository.get_prior_entities())
+
+        self.assertIs(prior_groups_index, prior_groups_index_use_case.get_prior_groups_index())
+        self.assertEqual([("Jose Perez", None, None)], self.get_saved_entities())
+        for index in [prior_groups_index, reloaded_prior_groups_index]:
+            self.assertEqual([("Jose Perez", "a.pdf")], [(x.text, x.segment.source_id) for x in index.get_entities()])
+
+    def test_get_references(self):
+        self.repository.save_segments(self.get_segments("first.pdf") + self.get_segments("second.pdf"))
+        first_segment, second_segment = (
+            self.repository.get_segments("first.pdf")[0],
+            self.repository.get_segments("second.pdf")[1],
+        )
+        self.repository.save_reference(first_segment.id, "Maria", "Annex A")
+        self.repository.save_reference(None, "Annex", "Annex A")
+        self.repository.save_reference(second_segment.id, "John", "Annex B")
+        self.repository.save_reference(first_segment.id, "Smith", "Annex C")
+
+        references = self.repository.get_references()
+        paginated_references = self.repository.get_references(limit=1, offset=1)
+        second_pdf_references = self.repository.get_references(identifier="second.pdf")
+
+        self.assertEqual(["Annex A", "Annex B", "Annex C"], [x["name"] for x in references])
+        self.assertEqual(["Maria", "Annex"], [x["text"] for x in references[0]["named_entities"]])
+        self.assertEqual("first.pdf", references[0]["named_entities"][0]["segment"]["source_id"])
+        self.assertIsNone(references[0]["named_entities"][1]["segment"])
+        self.assertEqual(NamedEntityType.REFERENCE, references[0]["type"])
+        self.assertEqual([references[1]], paginated_references)
+        self.assertEqual([references[1]], second_pdf_references)
+
+    def test_get_prior_entities(self):
+        segments = self.get_segments("first.pdf")
+        self.repository.save_segments(segments)
+        entity = self.get_entity("Maria Diaz", segments[2])
+        entity.group_name = "Maria Diaz Perez"
+        entity.relevance_percentage = 80
+        self.repository.save_entities([entity])
+        self.repository.save_reference(None, "Annex", "Annex A")
+
+        prior_entities = self.repository.get_prior_entities()
+        entities = self.repository.get_entities()
+
+        person, reference = prior_entities
+        self.assertEqual(("PERSON", "Maria Diaz Perez", 80), (person.type, person.group_name, person.relevance_percentage))
+        self.assertEqual(("first.pdf", 1, 2), (person.source_id, person.page_number, person.segment_number))
+        self.assertEqual(("Maria Diaz 2", 0, 10), (person.segment_text, person.bounding_box_left, person.bounding_box_width))
+        self.assertEqual(("REFERENCE", "Annex A", None), (reference.type, reference.group_name, reference.source_id))
+        self.assertEqual(["Maria Diaz Perez", "Annex A"], [x.group_name for x in entities])
+        self.assertEqual("Maria Diaz 2", entities[0].segment.text)
+
+    def test_get_identifiers_page(self):
+        self.repository.save_segments(self.get_segments("first.pdf") + self.get_segments("second.pdf"))
+        self.repository.save_identifier("third.pdf")
+
+        first_page, cursor_token = self.repository.get_identifiers_page(2)
+        second_page, last_cursor_token = self.repository.get_identifiers_page(2, cursor_token)
+
+        self.assertEqual(["first.pdf", "second.pdf", "third.pdf"], sorted(first_page + second_page))
+        self.assertIsNone(last_cursor_token)
+        self.assertEqual(first_page + second_page, list(self.repository.iterate_identifiers()))
+        with self.assertRaises(ValueError):
+            self.repository.get_identifiers_page(2, "invalid")
+
+    def test_get_segments_page(self):
+        self.repository.save_segments(self.get_segments("first.pdf") + self.get_segments("second.pdf"))
+
+        first_page, cursor_token = self.repository.get_segments_page("first.pdf", 2)
+        second_page, last_cursor_token = self.repository.get_segments_page("first.pdf", 2, cursor_token)
+        segments = list(self.repository.iterate_segments("first.pdf"))
+
+        self.assertEqual([0, 1], [x.segment_number for x in first_page])
+        self.assertEqual([2], [x.segment_number for x in second_page])
+        self.assertIsNone(last_cursor_token)
+        self.assertEqual(first_page + second_page, segments)
+        self.assertEqual(self.repository.get_segments("first.pdf"), segments)
+
+    def test_namespace_version(self):
+        self.assertEqual(0, self.repository.get_namespace_version())
+        self.repository.save_segments(self.get_segments("first.pdf"))
+        initial_version = self.repository.get_namespace_version()
+
+        self.repository.save_entities([self.get_entity("Maria Diaz", self.get_segments("first.pdf")[0])])
+        self.repository.save_reference(None, "Annex", "Annex A")
+        self.repository.delete_reference(self.repository.get_references()[0]["named_entities"][0]["id"])
+
+        self.assertEqual(initial_version + 3, self.repository.get_namespace_version())
+        self.repository.delete_database()
+        self.repository.create_database()
+        self.assertNotEqual(initial_version, self.repository.get_namespace_version())
+
+    def test_migrate_existing_schema(self):
+        with self.repository.pool.transaction() as cursor:
+            cursor.execute(f"CREATE SCHEMA {self.repository.schema_name}")
+            cursor.execute(
+                f"""CREATE TABLE {self.repository.schema_name}.named_entities (
+                    id SERIAL PRIMARY KEY, type TEXT NOT NULL, text TEXT, normalized_text TEXT, character_start INTEGER,
+                    character_end INTEGER, group_id INTEGER, segment_id INTEGER, appearance_count INTEGER,
+                    percentage_to_segment_text INTEGER, first_type_appearance BOOLEAN, last_type_appearance BOOLEAN,
+                    relevance_percentage INTEGER
+                )"""
+            )
+            cursor.execute(
+                f"""INSERT INTO {self.repository.schema_name}.named_entities (type, text, normalized_text, relevance_percentage)
+                VALUES ('PERSON', 'Maria Diaz', 'diaz maria', 50)"""
+            )
+
+        prior_entities = self.repository.get_prior_entities()
+
+        with self.repository.pool.transaction() as cursor:
+            self.assertEqual([], PostgresMigrations.migrate(cursor, self.repository.schema_name))
+            applied_versions = PostgresMigrations.get_applied_versions(cursor, self.repository.schema_name)
+            self.assertIn(self.repository.schema_name, PostgresMigrations.get_namespace_schemas(cursor))
+            cursor.execute(
+                "SELECT indexname FROM pg_indexes WHERE schemaname = %s AND indexname LIKE %s",
+                (self.repository.schema_name, "%_index"),
+            )
+            indexes_names = sorted([row[0] for row in cursor.fetchall()])
+
+        self.assertEqual([("Maria Diaz", "Maria Diaz")], [(x.text, x.group_name) for x in prior_entities])
+        self.assertEqual(PostgresMigrations.get_latest_version(), max(applied_versions))
+        self.assertEqual(
+            [
+                "named_entities_group_type_index",
+                "named_entities_normalized_text_type_index",
+                "named_entities_segment_id_index",
+                "named_entities_source_id_index",
+                "segments_key_index",
+            ],
+            indexes_names,
+        )
+        self.assertTrue(self.repository.save_segments(self.get_segments("first.pdf")))
+
+    def test_share_connections_pool(self):
+        other_repository = PostgresEntitiesStoreRepository("unit_tests")
+
+        self.repository.save_segments(self.get_segments("first.pdf"))
+        other_repository.save_segments(self.get_segments("second.pdf"))
+
+        self.assertIs(self.repository.pool, other_repository.pool)
+        self.assertTrue(other_repository.pool.is_schema_created(other_repository.schema_name))
+        self.assertEqual(["first.pdf", "second.pdf"], sorted(other_repository.get_identifiers()))
+
+    def test_recreate_schema_after_delete(self):
+        self.repository.save_identifier("first.pdf")
+        self.repository.delete_database()
+
+        self.assertFalse(self.repository.pool.is_schema_created(self.repository.schema_name))
+        self.assertFalse(self.repository.is_processed("first.pdf"))
+        self.assertTrue(self.repository.save_identifier("first.pdf"))
+        self.assertTrue(self.repository.is_processed("first.pdf"))
+
+    def test_replace_broken_connections(self):
+        self.repository.save_identifier("first.pdf")
+        with self.repository.pool.cursor() as cursor:
+            cursor.execute("SELECT pg_backend_pid()")
+            backend_pid = cursor.fetchone()[0]
+
+        with psycopg2.connect(**self.repository.pool.connection_parameters) as connection:
+            connection.cursor().execute("SELECT pg_terminate_backend(%s)", (backend_pid,))
+        connection.close()
+        self.repository.pool.health_check_seconds = 0
+
+        self.assertTrue(self.repository.is_processed("first.pdf"))
+
+    def test_recreate_schema_deleted_by_other_process(self):
+        segments = self.get_segments("first.pdf")
+        self.repository.save_segments(segments)
+        with psycopg2.connect(**self.repository.pool.connection_parameters) as connection:
+            connection.cursor().execute(f"DROP SCHEMA {self.repository.schema_name} CASCADE")
+        connection.close()
+
+        self.assertTrue(self.repository.pool.is_schema_created(self.repository.schema_name))
+        self.assertEqual(0, self.repository.get_namespace_version())
+        self.assertEqual([], self.repository.get_prior_entities())
+        self.assertTrue(self.repository.save_entities([self.get_entity("Maria Diaz", segments[0])]))
+        self.assertEqual(["Maria Diaz"], [x.text for x in self.repository.get_entities()])
+
+        with psycopg2.connect(**self.repository.pool.connection_parameters) as connection:
+            connection.cursor().execute(f"DROP SCHEMA {self.repository.schema_name} CASCADE")
+        connection.close()
+
+        self.assertTrue(self.repository.save_segments(segments))
+        self.assertEqual(["first.pdf"], self.repository.get_identifiers())
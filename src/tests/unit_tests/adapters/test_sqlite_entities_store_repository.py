@@ -0,0 +1,50 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features import Rectangle
+
+from ner_in_docker.adapters.SQLiteEntitiesStoreRepository import SQLiteEntitiesStoreRepository
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.Segment import Segment
+
+
+class TestSQLiteEntitiesStoreRepository(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.repository = SQLiteEntitiesStoreRepository()
+        self.repository.database_path = Path(self.temporary_directory.name, "named_entities.db")
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    @staticmethod
+    def get_entity(text: str, source_id: str) -> NamedEntity:
+        segment = Segment(
+            text=text,
+            page_number=1,
+            segment_number=1,
+            source_id=source_id,
+            bounding_box=Rectangle.from_width_height(0, 0, 10, 10),
+        )
+        entity = NamedEntity(type=NamedEntityType.PERSON, text=text, character_start=0, character_end=len(text))
+        return NamedEntity.from_segment(entity, segment)
+
+    def test_save_documents_entities(self):
+        entities = [self.get_entity("Maria Diaz", "first.pdf"), self.get_entity("John Smith", "second.pdf")]
+
+        self.assertTrue(self.repository.save_documents_entities(entities, ["first.pdf", "second.pdf"]))
+
+        self.assertEqual(["Maria Diaz", "John Smith"], [x.text for x in self.repository.get_entities()])
+        self.assertTrue(self.repository.is_processed("first.pdf"))
+        self.assertTrue(self.repository.is_processed("second.pdf"))
+
+    def test_save_documents_entities_replaces_documents(self):
+        self.repository.save_documents_entities([self.get_entity("Maria Diaz", "first.pdf")], ["first.pdf"])
+        self.repository.save_documents_entities([self.get_entity("John Smith", "second.pdf")], [])
+
+        self.repository.save_entities([self.get_entity("Maria Diaz Perez", "first.pdf")])
+
+        self.assertEqual(["John Smith", "Maria Diaz Perez"], sorted([x.text for x in self.repository.get_entities()]))
+        self.assertFalse(self.repository.is_processed("second.pdf"))
@@ -0,0 +1,79 @@
+import os
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from ner_in_docker.adapters.SQLiteJobsRepository import SQLiteJobsRepository
+from ner_in_docker.domain.ExtractionJob import ExtractionJob
+from ner_in_docker.domain.ExtractionJobStatus import ExtractionJobStatus
+
+
+class TestSQLiteJobsRepository(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.repository = SQLiteJobsRepository(Path(self.temporary_directory.name))
+
+    def tearDown(self):
+        self.temporary_directory.cleanup()
+
+    def test_create_and_get_job(self):
+        job = ExtractionJob.from_request("folder/document.pdf", "namespace", "identifier", "en", True, False)
+
+        self.repository.create_job(job, b"pdf content")
+
+        self.assertEqual(job, self.repository.get_job(job.job_id))
+        self.assertEqual("document.pdf", self.repository.get_pdf_path(job).name)
+        self.assertEqual(b"pdf content", self.repository.get_pdf_path(job).read_bytes())
+        self.assertIsNone(self.repository.get_job("missing"))
+
+    def test_claim_next_job(self):
+        first_job = ExtractionJob.from_request("first.pdf", None, None, "en", False, False)
+        second_job = ExtractionJob.from_request("second.pdf", None, None, "en", False, False)
+        second_job.created_at = first_job.created_at + 1
+        self.repository.create_job(second_job, b"")
+        self.repository.create_job(first_job, b"")
+
+        claimed_jobs = [self.repository.claim_next_job(os.getpid(), 60) for _ in range(3)]
+
+        self.assertEqual([first_job.job_id, second_job.job_id], [x.job_id for x in claimed_jobs[:2]])
+        self.assertIsNone(claimed_jobs[2])
+        self.assertEqual(ExtractionJobStatus.RUNNING, self.repository.get_job(first_job.job_id).status)
+
+    def test_update_stage_and_finish_job(self):
+        job = ExtractionJob.from_request("document.pdf", None, None, "en", False, False)
+        self.repository.create_job(job, b"")
+        job = self.repository.claim_next_job(os.getpid(), 60)
+
+        job.set_stage("grouping")
+        self.repository.update_job(job)
+        self.assertEqual(66, self.repository.get_job(job.job_id).progress_percentage)
+        self.assertIsNone(self.repository.get_result(job.job_id))
+
+        job.set_done()
+        self.repository.finish_job(job, '{"entities": [], "groups": []}')
+
+        self.assertEqual(ExtractionJobStatus.DONE, self.repository.get_job(job.job_id).status)
+        self.assertEqual('{"entities": [], "groups": []}', self.repository.get_result(job.job_id))
+        self.assertFalse(self.repository.get_pdf_path(job).exists())
+
+    def test_requeue_abandoned_jobs(self):
+        job = ExtractionJob.from_request("document.pdf", None, None, "en", False, False)
+        self.repository.create_job(job, b"")
+        self.repository.claim_next_job(os.getpid(), 0)
+
+        restarted_repository = SQLiteJobsRepository(Path(self.temporary_directory.name))
+
+        self.assertEqual(1, restarted_repository.requeue_abandoned_jobs())
+        self.assertEqual(ExtractionJobStatus.QUEUED, restarted_repository.get_job(job.job_id).status)
+        self.assertEqual(job.job_id, restarted_repository.claim_next_job(os.getpid(), 60).job_id)
+
+    def test_keep_jobs_with_lease(self):
+        job = ExtractionJob.from_request("document.pdf", None, None, "en", False, False)
+        self.repository.create_job(job, b"")
+        job = self.repository.claim_next_job(os.getpid(), 0)
+
+        self.repository.renew_lease(job, 60)
+
+        self.assertEqual(0, self.repository.requeue_abandoned_jobs())
+        self.assertEqual(ExtractionJobStatus.RUNNING, self.repository.get_job(job.job_id).status)
+        self.assertEqual(job.lease_expires_at, self.repository.get_job(job.job_id).lease_expires_at)
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+import country_converter as coco
+
+from ner_in_docker.domain.CountryCodeIndex import country_code_index
+
+
+class TestCountryCodeIndex(TestCase):
+    def test_exact_name_fast_path(self):
+        self.assertIn("france", country_code_index.iso3_by_name)
+        self.assertEqual("FRA", country_code_index.to_iso3("France"))
+        self.assertEqual("FRA", country_code_index.to_iso3("FRANCE"))
+
+    def test_regex_fallback(self):
+        self.assertEqual("GBR", country_code_index.to_iso3("UK"))
+        self.assertEqual("USA", country_code_index.to_iso3("the United States of America"))
+
+    def test_not_found(self):
+        self.assertEqual(country_code_index.NOT_FOUND, country_code_index.to_iso3("London"))
+        self.assertFalse(country_code_index.has_iso3("London"))
+        self.assertTrue(country_code_index.has_iso3("Germany"))
+
+    def test_same_result_as_country_converter(self):
+        converter = coco.CountryConverter()
+        names = [
+            "Côte d'Ivoire",
+            "Congo",
+            "Niger",
+            "Nigeria",
+            "South Sudan",
+            "Holland",
+            "USA",
+            "Paris",
+            "Asia excluding China",
+        ]
+        names += converter.data["name_short"].tolist()[:50]
+        for name in names:
+            self.assertEqual(converter.convert(names=[name], to="ISO3"), country_code_index.to_iso3(name))
@@ -0,0 +1,79 @@
+import copy
+from unittest import TestCase
+
+from pdf_features import Rectangle
+from pdf_token_type_labels import TokenType
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.Segment import Segment
+
+
+class TestNamedEntity(TestCase):
+    @staticmethod
+    def get_entities() -> list[NamedEntity]:
+        segment = Segment(
+            text="María Diaz and John Smith met in Paris with María Diaz.",
+            page_number=1,
+            segment_number=1,
+            bounding_box=Rectangle.from_width_height(0, 0, 10, 10),
+        )
+        return [
+            NamedEntity(type=NamedEntityType.PERSON, text="María Diaz", segment=segment),
+            NamedEntity(type=NamedEntityType.PERSON, text="John Smith", segment=segment, segment_type=TokenType.TITLE),
+            NamedEntity(type=NamedEntityType.LOCATION, text="Paris", segment=segment),
+            NamedEntity(type=NamedEntityType.PERSON, text="María Diaz", segment=segment),
+            NamedEntity(type=NamedEntityType.REFERENCE, text="Paris", segment_type=TokenType.TITLE),
+            NamedEntity(type=NamedEntityType.DATE, text="2020-01-01", relevance_percentage=5),
+        ]
+
+    def test_set_relevance_scores(self):
+        entities = NamedEntity.set_relevance_scores(self.get_entities())
+
+        self.assertEqual(2, entities[0].appearance_count)
+        self.assertTrue(entities[0].first_type_appearance)
+        self.assertTrue(entities[0].last_type_appearance)
+        self.assertFalse(entities[1].first_type_appearance)
+        self.assertFalse(entities[1].last_type_appearance)
+        self.assertEqual(1, entities[2].appearance_count)
+        self.assertEqual(100, entities[4].relevance_percentage)
+
+    def test_set_relevance_scores_same_as_per_entity_scores(self):
+        entities = self.get_entities()
+        expected_entities = copy.deepcopy(entities)
+        for entity in expected_entities:
+            entity.set_relevance_score(expected_entities)
+
+        NamedEntity.set_relevance_scores(entities)
+
+        self.assertEqual(expected_entities, entities)
+
+    def test_remove_overlapping_entities(self):
+        entities = [
+            NamedEntity(type=NamedEntityType.PERSON, text="Smith", character_start=5, character_end=10),
+            NamedEntity(type=NamedEntityType.PERSON, text="John Smith", character_start=0, character_end=10),
+            NamedEntity(type=NamedEntityType.LOCATION, text="Paris", character_start=15, character_end=20),
+        ]
+        result = NamedEntity.remove_overlapping_entities(entities)
+        self.assertEqual(["John Smith", "Paris"], [x.text for x in result])
+
+    def test_remove_overlapping_references(self):
+        segment = self.get_entities()[0].segment
+        other_segment = segment.model_copy(update={"segment_number": 2})
+        reference = NamedEntity(type=NamedEntityType.REFERENCE, text="Diaz", character_start=6, character_end=10)
+        longer_reference = NamedEntity(type=NamedEntityType.REFERENCE, text="María Diaz", character_end=10)
+        person = NamedEntity(type=NamedEntityType.PERSON, text="María", character_end=5, segment=segment)
+        other_reference = NamedEntity(type=NamedEntityType.REFERENCE, text="Diaz", character_start=6, character_end=10)
+        equal_longer_reference = NamedEntity.from_segment(copy.deepcopy(longer_reference), segment)
+        entities = [
+            NamedEntity.from_segment(reference, segment),
+            person,
+            NamedEntity.from_segment(longer_reference, segment),
+            equal_longer_reference,
+            NamedEntity.from_segment(other_reference, other_segment),
+        ]
+
+        result = NamedEntity.remove_overlapping_references(entities)
+
+        self.assertIs(entities, result)
+        self.assertEqual([id(x) for x in [person, equal_longer_reference, other_reference]], [id(x) for x in result])
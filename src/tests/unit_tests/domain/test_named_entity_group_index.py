@@ -0,0 +1,94 @@
+import random
+from unittest import TestCase
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityGroupIndex import NamedEntityGroupIndex
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+
+
+class TestNamedEntityGroupIndex(TestCase):
+    @staticmethod
+    def get_entity(text: str, entity_type: NamedEntityType = NamedEntityType.PERSON) -> NamedEntity:
+        return NamedEntity(type=entity_type, text=text, normalized_text=NamedEntity.normalize_text(text))
+
+    def get_index(self, texts: list[str]) -> NamedEntityGroupIndex:
+        index = NamedEntityGroupIndex()
+        for text in texts:
+            entity = self.get_entity(text)
+            index.set_group(text, NamedEntityGroup(name=text, type=entity.type, named_entities=[entity]))
+        return index
+
+    def test_candidates_in_insertion_order(self):
+        index = self.get_index(["María Diaz Perez", "Juan Gomez", "Maria Diaz"])
+        candidates = index.get_candidates(self.get_entity("Maria Diaz"))
+        self.assertEqual(["María Diaz Perez", "Maria Diaz"], [group.name for group, _ in candidates])
+
+    def test_same_result_as_linear_scan(self):
+        texts = ["Maria Diaz", "Jonathan Smithson", "Jonathon Smithson", "J. Smith", "Acme Corp", "UN", "Paris"]
+        index = self.get_index(texts)
+        for text in texts + ["John Smith", "Acme Corporation", "Smith", "Pari", "U N"]:
+            entity = self.get_entity(text)
+            expected = [name for name, group in index.groups.items() if group.belongs_to_group(entity)]
+            found = [group.name for group, texts in index.get_candidates(entity) if group.belongs_to_group(entity, texts)]
+            self.assertEqual(expected, found)
+
+    def test_same_result_as_linear_scan_for_random_texts(self):
+        random.seed(0)
+        texts = [
+            " ".join(random.choices(["a", "b", "ab", "ba", "aab", "abba", "bab"], k=random.randint(1, 5)))
+            for _ in range(300)
+        ]
+        index = self.get_index(texts[:150])
+        for text in texts:
+            entity = self.get_entity(text)
+            expected = [name for name, group in index.groups.items() if group.belongs_to_group(entity)]
+            found = [group.name for group, texts in index.get_candidates(entity) if group.belongs_to_group(entity, texts)]
+            self.assertEqual(expected, found)
+
+    @staticmethod
+    def get_edited_texts(text: str) -> list[str]:
+        return [
+            text[1:] + "a",
+            "a" + text[:-1],
+            "x" + text[1:],
+            text[:-1] + "x",
+            "x" + text[1:-1] + "x",
+            text[1:],
+            text[:-1],
+            "a" + text,
+            text + "a",
+        ]
+
+    def test_same_result_as_linear_scan_for_edits_at_both_ends(self):
+        random.seed(0)
+        texts = ["Abel Mandarins", "Maria Diaz Pere", "Organization Of"]
+        texts += ["".join(random.choices("abcde ", k=random.randint(9, 14))).strip() for _ in range(60)]
+        index = self.get_index(texts)
+        for text in texts:
+            for edited_text in self.get_edited_texts(text):
+                entity = self.get_entity(edited_text)
+                expected = [name for name, group in index.groups.items() if group.belongs_to_group(entity)]
+                candidates = index.get_candidates(entity)
+                found = [group.name for group, texts in candidates if group.belongs_to_group(entity, texts)]
+                self.assertEqual(expected, found, edited_text)
+
+    def test_renamed_and_deleted_groups(self):
+        index = self.get_index(["Maria Diaz", "Juan Gomez"])
+        group = index.groups["Maria Diaz"]
+        index.delete_group("Maria Diaz")
+        group.name = "Dr Maria Diaz"
+        index.set_group("Dr Maria Diaz", group)
+
+        candidates = index.get_candidates(self.get_entity("Maria Diaz"))
+        self.assertEqual(["Dr Maria Diaz"], [group.name for group, _ in candidates])
+
+        index.delete_group("Dr Maria Diaz")
+        self.assertEqual([], index.get_candidates(self.get_entity("Maria Diaz")))
+
+    def test_exact_name_for_types_without_similarity(self):
+        index = NamedEntityGroupIndex()
+        entity = self.get_entity("2020-01-01", NamedEntityType.DATE)
+        index.set_group("2020-01-01", NamedEntityGroup(name="2020-01-01", type=NamedEntityType.DATE))
+        self.assertEqual(1, len(index.get_candidates(entity)))
+        self.assertEqual([], index.get_candidates(self.get_entity("2020-01-02", NamedEntityType.DATE)))
@@ -0,0 +1,118 @@
+from unittest import TestCase
+
+from pdf_features import Rectangle
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.PriorEntity import PriorEntity
+from ner_in_docker.domain.PriorGroupsIndex import PriorGroupsIndex
+from ner_in_docker.domain.Segment import Segment
+
+
+class TestPriorGroupsIndex(TestCase):
+    @staticmethod
+    def get_entity(text: str, group_name: str, relevance: int, source_id: str = "doc") -> NamedEntity:
+        segment = Segment(
+            text=text,
+            page_number=1,
+            segment_number=1,
+            source_id=source_id,
+            bounding_box=Rectangle.from_width_height(0, 0, 0, 0),
+        )
+        return NamedEntity(
+            type=NamedEntityType.PERSON,
+            text=text,
+            normalized_text=NamedEntity.normalize_text(text),
+            group_name=group_name,
+            relevance_percentage=relevance,
+            segment=segment,
+        )
+
+    @staticmethod
+    def get_summary(prior_groups_index: PriorGroupsIndex) -> list[tuple]:
+        groups = prior_groups_index.get_groups()
+        return [(x.name, x.top_relevance_entity.text, sorted([e.text for e in x.named_entities])) for x in groups]
+
+    def test_groups_ordered_by_relevance(self):
+        entities = [
+            self.get_entity("Maria Diaz", "Maria Diaz", 10),
+            self.get_entity("John Smith", "John Smith", 50),
+            self.get_entity("M. Diaz", "Maria Diaz", 80),
+            self.get_entity("Juan Gomez", "Juan Gomez", 50),
+        ]
+        prior_groups_index = PriorGroupsIndex.from_entities(entities)
+        self.assertEqual(["Maria Diaz", "John Smith", "Juan Gomez"], [x.name for x in prior_groups_index.get_groups()])
+        self.assertEqual("M. Diaz", prior_groups_index.get_groups()[0].top_relevance_entity.text)
+
+    def test_incremental_updates_same_as_rebuild(self):
+        entities = [
+            self.get_entity("Maria Diaz", "Maria Diaz", 10, "a"),
+            self.get_entity("John Smith", "John Smith", 50, "a"),
+            self.get_entity("M. Diaz", "Maria Diaz", 80, "b"),
+            self.get_entity("Juan Gomez", "Juan Gomez", 60, "c"),
+        ]
+        prior_groups_index = PriorGroupsIndex.from_entities(entities[:2])
+        prior_groups_index.add_entities(entities[2:3])
+        prior_groups_index.add_entities(entities[3:])
+        self.assertEqual(self.get_summary(PriorGroupsIndex.from_entities(entities)), self.get_summary(prior_groups_index))
+
+    def test_saving_a_document_again_replaces_its_entities(self):
+        prior_groups_index = PriorGroupsIndex.from_entities(
+            [self.get_entity("Maria Diaz", "Maria Diaz", 10, "a"), self.get_entity("John Smith", "John Smith", 50, "b")]
+        )
+        prior_groups_index.add_entities([self.get_entity("Juan Gomez", "Juan Gomez", 10, "a")])
+        self.assertEqual(["John Smith", "Juan Gomez"], [x.name for x in prior_groups_index.get_groups()])
+        self.assertEqual([], prior_groups_index.get_candidates(self.get_entity("Maria Diaz", "", 0)))
+
+    def test_candidates(self):
+        prior_groups_index = PriorGroupsIndex.from_entities(
+            [self.get_entity("Maria Diaz", "Maria Diaz", 10), self.get_entity("John Smith", "John Smith", 50)]
+        )
+        candidates = prior_groups_index.get_candidates(self.get_entity("Maria Diaz Perez", "", 0))
+        self.assertEqual(["Maria Diaz"], [group.name for group, _ in candidates])
+
+    def test_reference_destinations(self):
+        destination = self.get_entity("Annex A", "Annex A", 100)
+        destination.type = NamedEntityType.REFERENCE
+        prior_groups_index = PriorGroupsIndex.from_entities([destination, self.get_entity("Maria Diaz", "Maria Diaz", 100)])
+        references_matcher = prior_groups_index.get_references_matcher()
+
+        self.assertIs(references_matcher, prior_groups_index.get_references_matcher())
+        self.assertEqual(["Annex A"], [x.name for x in prior_groups_index.get_reference_destinations()])
+
+        other_destination = self.get_entity("Annex B", "Annex B", 100, "other")
+        other_destination.type = NamedEntityType.REFERENCE
+        prior_groups_index.add_entities([other_destination])
+
+        self.assertIsNot(references_matcher, prior_groups_index.get_references_matcher())
+        self.assertEqual(["Annex A", "Annex B"], [x.name for x in prior_groups_index.get_reference_destinations()])
+
+    def test_from_prior_entities(self):
+        segment_text = "Signed by Maria Diaz and M. Diaz"
+        prior_entities = [
+            PriorEntity(
+                "PERSON", "Maria Diaz", "diaz maria", "Maria Diaz", 10, 0, 10, "Text", "doc", 1, 1, segment_text, 1, 2, 3, 4
+            ),
+            PriorEntity(
+                "PERSON", "M. Diaz", "diaz m", "Maria Diaz", 80, 15, 22, "Text", "doc", 1, 1, segment_text, 1, 2, 3, 4
+            ),
+            PriorEntity("REFERENCE", "Annex A", "Annex A", "Annex A", 100, 0, 7, "Title", None, None, None),
+        ]
+
+        prior_groups_index = PriorGroupsIndex.from_prior_entities(prior_entities)
+        maria_diaz_entities = prior_groups_index.get_groups()[1].named_entities
+        segment = maria_diaz_entities[0].segment
+
+        self.assertEqual(
+            [("Annex A", "Annex A", ["Annex A"]), ("Maria Diaz", "M. Diaz", ["M. Diaz", "Maria Diaz"])],
+            self.get_summary(prior_groups_index),
+        )
+        self.assertIs(segment, maria_diaz_entities[1].segment)
+        self.assertEqual(
+            ("doc", 1, 1, segment_text), (segment.source_id, segment.page_number, segment.segment_number, segment.text)
+        )
+        self.assertEqual(
+            (1, 2, 3, 4),
+            (segment.bounding_box.left, segment.bounding_box.top, segment.bounding_box.width, segment.bounding_box.height),
+        )
+        self.assertEqual(["Annex A"], [x.name for x in prior_groups_index.get_reference_destinations()])
@@ -0,0 +1,37 @@
+import random
+from unittest import TestCase
+
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.ReferencesMatcher import ReferencesMatcher
+
+
+class TestReferencesMatcher(TestCase):
+    @staticmethod
+    def get_groups(names: list[str]) -> list[NamedEntityGroup]:
+        return [NamedEntityGroup(type=NamedEntityType.REFERENCE, name=name) for name in names]
+
+    def test_references_in_text(self):
+        groups = self.get_groups(["Section 1.1", "4. Results Interpretation", "Annex: Methods"])
+        text = 'See Section 1.1, "Results Interpretation" and Methods; Section 1.10 is not a reference.'
+        references = ReferencesMatcher(groups).get_references_in_text(text)
+
+        self.assertEqual(["Section 1.1", "4. Results Interpretation", "Annex: Methods"], [x.name for x, _ in references])
+        self.assertEqual([(4, 15)], references[0][1])
+        self.assertEqual([(17, 41)], references[1][1])
+        self.assertEqual([(46, 53)], references[2][1])
+
+    def test_no_references(self):
+        matcher = ReferencesMatcher(self.get_groups(["Chapter 5", " ", ""]))
+        self.assertEqual([], matcher.get_references_in_text("Chapter 50 and chapter 5"))
+        self.assertEqual([], matcher.get_references_in_text(" "))
+
+    def test_same_spans_as_regex(self):
+        random.seed(0)
+        alphabet = ["a", "b", " ", ".", "'", '"', "_", "é", "1", ": ", "1. "]
+        for _ in range(500):
+            groups = self.get_groups(["".join(random.choices(alphabet, k=random.randint(1, 6))) for _ in range(4)])
+            matcher = ReferencesMatcher(groups)
+            text = "".join(random.choices(alphabet, k=random.randint(0, 40)))
+            expected = [(x.name, x.get_references_in_text(text)) for x in groups if x.get_references_in_text(text)]
+            self.assertEqual(expected, [(x.name, spans) for x, spans in matcher.get_references_in_text(text)])
@@ -0,0 +1,37 @@
+import random
+from unittest import TestCase
+
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.SimilarTextsMatrix import SimilarTextsMatrix
+
+
+class TestSimilarTextsMatrix(TestCase):
+    def test_short_texts_need_exact_match(self):
+        matrix = SimilarTextsMatrix(["maria diaz", "paris"], ["maria diaz", "maria dias", "pariss"])
+        self.assertTrue(matrix.is_similar("maria diaz", "maria diaz"))
+        self.assertFalse(matrix.is_similar("maria diaz", "maria dias"))
+        self.assertFalse(matrix.is_similar("paris", "pariss"))
+
+    def test_long_texts_allow_one_edit(self):
+        matrix = SimilarTextsMatrix(["jonathan smithson"], ["jonathan smithsons", "jonathan smithso", "jonatan smitson"])
+        self.assertTrue(matrix.is_similar("jonathan smithsons", "jonathan smithson"))
+        self.assertTrue(matrix.is_similar("jonathan smithson", "jonathan smithso"))
+        self.assertFalse(matrix.is_similar("jonathan smithson", "jonatan smitson"))
+
+    def test_same_boundary_as_scalar_ratio(self):
+        matrix = SimilarTextsMatrix(["jonathan smithson"], ["jonathon smithson"])
+        expected = NamedEntityGroup.similar_text("jonathan smithson", "jonathon smithson")
+        self.assertEqual(expected, matrix.is_similar("jonathan smithson", "jonathon smithson"))
+
+    def test_texts_not_in_matrix(self):
+        matrix = SimilarTextsMatrix(["maria diaz"], ["maria diaz"])
+        self.assertTrue(matrix.is_similar("jonathan smithsons", "jonathan smithson"))
+
+    def test_same_result_as_similar_text(self):
+        random.seed(0)
+        texts = ["".join(random.choices("abc ", k=random.randint(0, 14))) for _ in range(300)]
+        other_texts = texts[:100] + ["".join(random.choices("abc ", k=random.randint(8, 14))) for _ in range(300)]
+        matrix = SimilarTextsMatrix(texts, other_texts)
+        for text in texts:
+            for other_text in other_texts:
+                self.assertEqual(NamedEntityGroup.similar_text(other_text, text), matrix.is_similar(other_text, text))
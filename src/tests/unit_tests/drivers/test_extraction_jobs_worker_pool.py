@@ -0,0 +1,53 @@
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from unittest import TestCase
+
+from ner_in_docker.adapters.SQLiteJobsRepository import SQLiteJobsRepository
+from ner_in_docker.domain.ExtractionJob import ExtractionJob
+from ner_in_docker.domain.ExtractionJobStatus import ExtractionJobStatus
+from ner_in_docker.drivers.rest.ExtractionJobsWorkerPool import ExtractionJobsWorkerPool
+
+
+class UnavailableJobsRepository(SQLiteJobsRepository):
+    def __init__(self, jobs_path: Path):
+        super().__init__(jobs_path)
+        self.claims_count = 0
+
+    def claim_next_job(self, worker_pid: int, lease_seconds: float) -> ExtractionJob | None:
+        job = super().claim_next_job(worker_pid, lease_seconds)
+        if job:
+            self.claims_count += 1
+        return job
+
+    def update_job(self, job: ExtractionJob):
+        raise sqlite3.OperationalError("database is locked")
+
+    def finish_job(self, job: ExtractionJob, result: str | None):
+        raise sqlite3.OperationalError("database is locked")
+
+
+class TestExtractionJobsWorkerPool(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.repository = UnavailableJobsRepository(Path(self.temporary_directory.name))
+        self.worker_pool = ExtractionJobsWorkerPool(self.repository, 1, 0.1, 1)
+
+    def tearDown(self):
+        self.worker_pool.stop()
+        self.temporary_directory.cleanup()
+
+    def test_requeue_job_when_repository_fails(self):
+        job = ExtractionJob.from_request("document.pdf", None, None, "en", False, False)
+        self.worker_pool.submit(job, b"")
+        self.worker_pool.start()
+        worker = self.worker_pool.workers[0]
+
+        deadline = time.time() + 10
+        while self.repository.claims_count < 2 and time.time() < deadline:
+            time.sleep(0.1)
+
+        self.assertGreaterEqual(self.repository.claims_count, 2)
+        self.assertTrue(worker.is_alive())
+        self.assertEqual(ExtractionJobStatus.RUNNING, self.repository.get_job(job.job_id).status)
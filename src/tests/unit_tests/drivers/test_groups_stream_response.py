@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+from pdf_features import Rectangle
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.drivers.rest.response_entities.GroupsStreamResponse import GroupsStreamResponse
+from ner_in_docker.drivers.rest.response_entities.NamedEntitiesResponse import NamedEntitiesResponse
+from ner_in_docker.drivers.rest.response_entities.SegmentEntitiesResponse import SegmentEntitiesResponse
+
+
+class TestGroupsStreamResponse(TestCase):
+    @staticmethod
+    def get_entity(text: str, segment: Segment, relevance_percentage: int) -> NamedEntity:
+        character_start = segment.text.index(text)
+        entity = NamedEntity(
+            type=NamedEntityType.PERSON,
+            text=text,
+            group_name=text,
+            character_start=character_start,
+            character_end=character_start + len(text),
+            relevance_percentage=relevance_percentage,
+        )
+        return NamedEntity.from_segment(entity, segment)
+
+    def test_from_groups(self):
+        segment = Segment(
+            text="John Smith met Maria Diaz",
+            page_number=1,
+            segment_number=1,
+            source_id="document.pdf",
+            bounding_box=Rectangle.from_width_height(0, 0, 10, 10),
+        )
+        john = self.get_entity("John Smith", segment, 40)
+        maria = self.get_entity("Maria Diaz", segment, 80)
+        prior_maria = self.get_entity("Maria Diaz", segment, 90)
+        groups = [
+            NamedEntityGroup(
+                type=NamedEntityType.PERSON, name="Maria Diaz", named_entities=[maria], top_relevance_entity=prior_maria
+            ),
+            NamedEntityGroup(
+                type=NamedEntityType.PERSON, name="John Smith", named_entities=[john], top_relevance_entity=john
+            ),
+        ]
+
+        segment_response = SegmentEntitiesResponse.from_segment(segment, [john, maria], 3)
+        response = GroupsStreamResponse.from_groups(groups, {id(john): 3, id(maria): 4})
+
+        self.assertEqual("segment", segment_response.record)
+        self.assertEqual(len(segment.text), segment_response.segment.character_end)
+        self.assertEqual([(3, 0), (4, 15)], [(x.index, x.character_start) for x in segment_response.entities])
+        self.assertEqual("groups", response.record)
+        self.assertEqual(["John Smith", "Maria Diaz"], [x.group_name for x in response.groups])
+        self.assertEqual([4], [x.index for x in response.groups[1].entities])
+        self.assertEqual(90, response.groups[1].top_relevance_entity.relevance_percentage)
+
+    def test_same_top_relevance_entity_as_named_entities_response(self):
+        segment = Segment(
+            text="Maria Diaz and Maria Diaz",
+            page_number=1,
+            segment_number=1,
+            source_id="document.pdf",
+            bounding_box=Rectangle.from_width_height(0, 0, 10, 10),
+        )
+        first_maria = self.get_entity("Maria Diaz", segment, 80)
+        second_maria = NamedEntity.from_segment(
+            first_maria.model_copy(update={"character_start": 15, "character_end": 25}), segment
+        )
+        prior_segment = segment.model_copy(update={"text": "Signed by Maria Diaz", "source_id": "prior.pdf"})
+        prior_maria = self.get_entity("Maria Diaz", prior_segment, 80)
+        group = NamedEntityGroup(
+            type=NamedEntityType.PERSON,
+            name="Maria Diaz",
+            named_entities=[second_maria, first_maria],
+            top_relevance_entity=prior_maria,
+        )
+
+        response = GroupsStreamResponse.from_groups([group], {id(first_maria): 0, id(second_maria): 1})
+        named_entities_response = NamedEntitiesResponse.from_groups([group])
+
+        self.assertEqual([0, 1], [x.index for x in response.groups[0].entities])
+        self.assertEqual(named_entities_response.groups[0].top_relevance_entity, response.groups[0].top_relevance_entity)
+        self.assertEqual("document.pdf", response.groups[0].top_relevance_entity.source_id)
+        self.assertEqual(0, response.groups[0].top_relevance_entity.character_start)
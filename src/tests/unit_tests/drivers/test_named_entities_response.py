@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from pdf_features import Rectangle
+
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityGroup import NamedEntityGroup
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.drivers.rest.response_entities.NamedEntitiesResponse import NamedEntitiesResponse
+
+
+class TestNamedEntitiesResponse(TestCase):
+    @staticmethod
+    def get_entity(text: str, page_number: int, character_start: int, relevance_percentage: int) -> NamedEntity:
+        segment = Segment(
+            text="Maria Diaz and John Smith met Maria Diaz in Paris",
+            page_number=page_number,
+            segment_number=page_number,
+            source_id="document.pdf",
+            bounding_box=Rectangle.from_width_height(0, 0, 10, 10),
+        )
+        entity = NamedEntity(
+            type=NamedEntityType.PERSON,
+            text=text,
+            group_name=text,
+            character_start=character_start,
+            character_end=character_start + len(text),
+            relevance_percentage=relevance_percentage,
+        )
+        return NamedEntity.from_segment(entity, segment)
+
+    def test_from_groups(self):
+        maria_page_2 = self.get_entity("Maria Diaz", 2, 0, 90)
+        maria_page_1 = self.get_entity("Maria Diaz", 1, 30, 40)
+        john = self.get_entity("John Smith", 1, 15, 50)
+        groups = [
+            NamedEntityGroup(
+                type=NamedEntityType.PERSON,
+                name="Maria Diaz",
+                named_entities=[maria_page_2, maria_page_1],
+                top_relevance_entity=maria_page_2,
+            ),
+            NamedEntityGroup(
+                type=NamedEntityType.PERSON, name="John Smith", named_entities=[john], top_relevance_entity=john
+            ),
+        ]
+
+        response = NamedEntitiesResponse.from_groups(groups)
+
+        self.assertEqual([(1, 15), (1, 30), (2, 0)], [(x.segment.page_number, x.character_start) for x in response.entities])
+        self.assertEqual(["John Smith", "Maria Diaz"], [x.group_name for x in response.groups])
+        self.assertEqual([0], [x.index for x in response.groups[0].entities])
+        self.assertEqual([1, 2], [x.index for x in response.groups[1].entities])
+        self.assertEqual(90, response.groups[1].top_relevance_entity.relevance_percentage)
+        self.assertEqual(2, response.groups[1].top_relevance_entity.segment.page_number)
+
+    def test_from_groups_top_relevance_entity_from_group(self):
+        maria = self.get_entity("Maria Diaz", 1, 0, 40)
+        top_maria = self.get_entity("Maria Diaz", 1, 30, 95)
+        group = NamedEntityGroup(
+            type=NamedEntityType.PERSON, name="Maria Diaz", named_entities=[maria], top_relevance_entity=top_maria
+        )
+
+        response = NamedEntitiesResponse.from_groups([group])
+
+        self.assertEqual(1, len(response.entities))
+        self.assertEqual(95, response.groups[0].top_relevance_entity.relevance_percentage)
+
+    def test_from_groups_equal_entities(self):
+        maria = self.get_entity("Maria Diaz", 1, 0, 40)
+        group = NamedEntityGroup(
+            type=NamedEntityType.PERSON,
+            name="Maria Diaz",
+            named_entities=[maria, maria.model_copy()],
+            top_relevance_entity=maria,
+        )
+
+        response = NamedEntitiesResponse.from_groups([group])
+
+        self.assertEqual(2, len(response.entities))
+        self.assertEqual([0, 1], [x.index for x in response.groups[0].entities])
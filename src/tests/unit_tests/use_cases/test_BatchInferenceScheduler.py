@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from ner_in_docker.use_cases.BatchInferenceScheduler import BatchInferenceScheduler
+
+
+class TestBatchInferenceScheduler(TestCase):
+    def test_results_returned_in_order(self):
+        scheduler = BatchInferenceScheduler(lambda items: [item * 2 for item in items], 4, 0.01)
+        self.assertEqual([2, 4, 6, 8, 10, 12], scheduler.predict([1, 2, 3, 4, 5, 6]))
+
+    def test_empty_items(self):
+        scheduler = BatchInferenceScheduler(lambda items: items, 4, 0.01)
+        self.assertEqual([], scheduler.predict([]))
+
+    def test_batches_bounded_by_max_batch_size(self):
+        batch_sizes = []
+
+        def predict_batch(items):
+            batch_sizes.append(len(items))
+            return items
+
+        scheduler = BatchInferenceScheduler(predict_batch, 3, 0.01)
+        scheduler.predict(list(range(10)))
+        self.assertEqual(10, sum(batch_sizes))
+        self.assertTrue(all(size <= 3 for size in batch_sizes))
+
+    def test_concurrent_requests_share_batches(self):
+        batch_sizes = []
+
+        def predict_batch(items):
+            batch_sizes.append(len(items))
+            return [item.upper() for item in items]
+
+        scheduler = BatchInferenceScheduler(predict_batch, 64, 0.2)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(scheduler.predict, [["a"], ["b"], ["c"], ["d"]]))
+
+        self.assertEqual([["A"], ["B"], ["C"], ["D"]], results)
+        self.assertLess(len(batch_sizes), 4)
+
+    def test_exception_propagated_to_every_caller(self):
+        def predict_batch(items):
+            raise RuntimeError("model error")
+
+        scheduler = BatchInferenceScheduler(predict_batch, 4, 0.01)
+        with self.assertRaises(RuntimeError):
+            scheduler.predict(["text"])
+
+        self.assertRaises(RuntimeError, scheduler.predict, ["other text"])
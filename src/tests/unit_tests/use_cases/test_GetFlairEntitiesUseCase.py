@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from flair.data import Sentence
+
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.use_cases.BatchInferenceScheduler import BatchInferenceScheduler
+from ner_in_docker.use_cases.GetFlairEntitiesUseCase import GetFlairEntitiesUseCase
+
+
+class TestGetFlairEntitiesUseCase(TestCase):
+    def setUp(self):
+        self.tagged_texts: list[str] = []
+        self.use_case = GetFlairEntitiesUseCase(BatchInferenceScheduler(self.tag_people, 64, 0.01))
+
+    def tag_people(self, sentences: list[Sentence]) -> list[Sentence]:
+        for sentence in sentences:
+            self.tagged_texts.append(sentence.to_original_text())
+            tokens = [token.text for token in sentence]
+            for index in range(len(tokens) - 1):
+                if tokens[index : index + 2] == ["Maria", "Diaz"]:
+                    sentence[index : index + 2].add_label("ner", "PERSON")
+        return sentences
+
+    def test_get_entities_from_texts(self):
+        texts = ["Maria Diaz", "", "The report was written by Maria Diaz in Geneva", "   ", "Signed by Maria Diaz"]
+
+        entities_by_text = self.use_case.get_entities_from_texts(texts)
+
+        self.assertEqual([texts[2], texts[4], texts[0]], self.tagged_texts)
+        self.assertEqual(len(texts), len(entities_by_text))
+        self.assertEqual([], entities_by_text[1])
+        self.assertEqual([], entities_by_text[3])
+        for text, entities in zip(texts[::2], entities_by_text[::2]):
+            self.assertEqual(1, len(entities))
+            self.assertEqual(NamedEntityType.PERSON, entities[0].type)
+            self.assertEqual("Maria Diaz", entities[0].text)
+            self.assertEqual(text.index("Maria Diaz"), entities[0].character_start)
+            self.assertEqual("Maria Diaz", text[entities[0].character_start : entities[0].character_end])
+
+    def test_get_entities(self):
+        entities = self.use_case.get_entities("Signed by Maria Diaz")
+
+        self.assertEqual(["Maria Diaz"], [x.text for x in entities])
+        self.assertEqual(10, entities[0].character_start)
+        self.assertEqual(20, entities[0].character_end)
@@ -21,6 +21,29 @@ class TestGroupNamedEntitiesUseCase(TestCase):
         self.assertEqual(group.name, normalized)
         self.assertCountEqual([ne.text for ne in group.named_entities], ["1 Jan 2021", "2021-01-01"])
 
+    def test_group_texts_edited_at_both_ends(self):
+        entities = [NamedEntity(type=NamedEntityType.PERSON, text=x) for x in ["Abel Mandarins", "Bel Mandarinsa"]]
+
+        groups = GroupNamedEntitiesUseCase().group(entities)
+
+        self.assertEqual(1, len(groups))
+        self.assertCountEqual(["Abel Mandarins", "Bel Mandarinsa"], [x.text for x in groups[0].named_entities])
+
+    def test_join_prior_group_edited_at_both_ends(self):
+        prior = NamedEntity(
+            type=NamedEntityType.PERSON,
+            text="Abel Mandarins",
+            normalized_text=NamedEntity.normalize_text("Abel Mandarins"),
+            group_name="Abel Mandarins",
+            relevance_percentage=50,
+        )
+        new_entity = NamedEntity(type=NamedEntityType.PERSON, text="Bel Mandarinsa")
+
+        groups = GroupNamedEntitiesUseCase(prior_entities=[prior]).group([new_entity])
+
+        self.assertEqual(["Abel Mandarins"], [x.name for x in groups])
+        self.assertEqual("Abel Mandarins", new_entity.group_name)
+
     def test_prior_reference_grouping(self):
         prior = NamedEntity(
             type=NamedEntityType.REFERENCE, text="Section 1: Intro", group_name="Section 1: Intro", relevance_percentage=100
@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from flair.data import Sentence
+
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.use_cases.BatchInferenceScheduler import BatchInferenceScheduler
+from ner_in_docker.use_cases.GetFlairEntitiesUseCase import GetFlairEntitiesUseCase
+from ner_in_docker.use_cases.NamedEntitiesUseCase import NamedEntitiesUseCase
+
+
+def tag_people(sentences: list[Sentence]) -> list[Sentence]:
+    for sentence in sentences:
+        tokens = [token.text for token in sentence]
+        for index in range(len(tokens) - 1):
+            if tokens[index : index + 2] in (["Maria", "Diaz"], ["Jose", "Perez"]):
+                sentence[index : index + 2].add_label("ner", "PERSON")
+    return sentences
+
+
+class NoDatesExtractor:
+    @staticmethod
+    def extract_dates(text: str) -> list:
+        return []
+
+
+class TestNamedEntitiesUseCase(TestCase):
+    def setUp(self):
+        self.use_case = NamedEntitiesUseCase()
+        self.use_case.date_extractor = NoDatesExtractor()
+        self.use_case.entity_extractor = GetFlairEntitiesUseCase(BatchInferenceScheduler(tag_people, 64, 0.01))
+
+    def assert_entities_in_segments(self, entities_texts: list[str], entities: list, segments: list[Segment]):
+        self.assertEqual(entities_texts, [x.text for x in entities])
+        for entity in entities:
+            self.assertTrue(any(entity.segment is segment for segment in segments))
+            self.assertEqual(entity.text, entity.segment.text[entity.character_start : entity.character_end])
+
+    def test_get_entities_from_segments(self):
+        texts = ["", "Maria Diaz", "The report was written by Jose Perez and reviewed by Maria Diaz", " ", "Jose Perez"]
+        segments = [Segment.from_text(text, "document.pdf") for text in texts]
+
+        entities = self.use_case.get_entities_from_segments(segments)
+
+        self.assert_entities_in_segments(["Maria Diaz", "Jose Perez", "Maria Diaz", "Jose Perez"], entities, segments)
+        self.assertEqual([segments[1], segments[2], segments[2], segments[4]], [x.segment for x in entities])
+        self.assertEqual([0, 26, 53, 0], [x.character_start for x in entities])
+
+    def test_get_entities_from_documents(self):
+        first_segments = [Segment.from_text(text, "first.pdf") for text in ["Jose Perez", "", "Signed by Maria Diaz"]]
+        second_segments = [Segment.from_text(text, "second.pdf") for text in ["", "Maria Diaz"]]
+
+        first_entities, second_entities, third_entities = self.use_case.get_entities_from_documents(
+            [first_segments, second_segments, []]
+        )
+
+        self.assert_entities_in_segments(["Jose Perez", "Maria Diaz"], first_entities, first_segments)
+        self.assert_entities_in_segments(["Maria Diaz"], second_entities, second_segments)
+        self.assertEqual([0, 10], [x.character_start for x in first_entities])
+        self.assertEqual([], third_entities)
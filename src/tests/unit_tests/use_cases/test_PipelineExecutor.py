@@ -0,0 +1,49 @@
+import asyncio
+import queue
+import threading
+from unittest import TestCase
+
+from ner_in_docker.use_cases.PipelineExecutor import PipelineExecutor
+
+
+class TestPipelineExecutor(TestCase):
+    def test_run(self):
+        executor = PipelineExecutor(max_workers=2, max_queue_size=2)
+
+        result = asyncio.run(executor.run(lambda x, y: x + y, 1, y=2))
+
+        self.assertEqual(3, result)
+        self.assertEqual(0, executor.get_pending())
+
+    def test_run_in_worker_thread(self):
+        executor = PipelineExecutor(max_workers=1, max_queue_size=0, name="test-pipeline")
+
+        thread_name = asyncio.run(executor.run(lambda: threading.current_thread().name))
+
+        self.assertTrue(thread_name.startswith("test-pipeline"))
+
+    def test_fast_fail_when_saturated(self):
+        executor = PipelineExecutor(max_workers=1, max_queue_size=1)
+        release = threading.Event()
+
+        running = executor.submit(release.wait)
+        queued = executor.submit(release.wait)
+        with self.assertRaises(queue.Full):
+            executor.submit(release.wait)
+
+        release.set()
+        running.result(timeout=5)
+        queued.result(timeout=5)
+        self.assertEqual(0, executor.get_pending())
+        self.assertTrue(executor.submit(lambda: True).result(timeout=5))
+
+    def test_exception_releases_slot(self):
+        executor = PipelineExecutor(max_workers=1, max_queue_size=0)
+
+        def fail():
+            raise ValueError("error")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(executor.run(fail))
+
+        self.assertEqual(0, executor.get_pending())
@@ -0,0 +1,116 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from pdf_features import Rectangle
+
+from ner_in_docker.adapters.SQLiteEntitiesStoreRepository import SQLiteEntitiesStoreRepository
+from ner_in_docker.domain.NamedEntity import NamedEntity
+from ner_in_docker.domain.NamedEntityType import NamedEntityType
+from ner_in_docker.domain.PriorEntity import PriorEntity
+from ner_in_docker.domain.Segment import Segment
+from ner_in_docker.use_cases.PriorGroupsIndexUseCase import PriorGroupsIndexUseCase
+
+
+class CountingSQLiteEntitiesStoreRepository(SQLiteEntitiesStoreRepository):
+    def __init__(self, database_path: Path):
+        super().__init__()
+        self.database_path = database_path
+        self.get_prior_entities_count = 0
+
+    def get_prior_entities(self) -> list[PriorEntity]:
+        self.get_prior_entities_count += 1
+        return super().get_prior_entities()
+
+
+class TestPriorGroupsIndexUseCase(TestCase):
+    def setUp(self):
+        self.temporary_directory = tempfile.TemporaryDirectory()
+        self.database_path = Path(self.temporary_directory.name, "named_entities.db")
+        self.repository = CountingSQLiteEntitiesStoreRepository(self.database_path)
+        self.use_case = PriorGroupsIndexUseCase(self.repository, self.temporary_directory.name)
+
+    def tearDown(self):
+        self.use_case.delete_prior_groups_index()
+        self.temporary_directory.cleanup()
+
+    @staticmethod
+    def get_entity(text: str, source_id: str, entity_type: NamedEntityType = NamedEntityType.PERSON) -> NamedEntity:
+        segment = Segment(
+            text=text,
+            page_number=1,
+            segment_number=1,
+            source_id=source_id,
+            bounding_box=Rectangle.from_width_height(0, 0, 10, 10),
+        )
+        entity = NamedEntity(
+            type=entity_type,
+            text=text,
+            group_name=text,
+            character_start=0,
+            character_end=len(text),
+            relevance_percentage=100,
+        )
+        return NamedEntity.from_segment(entity, segment)
+
+    def test_reuse_prior_groups_index_while_namespace_is_unchanged(self):
+        self.repository.save_entities([self.get_entity("Maria Diaz", "first.pdf")])
+
+        first_prior_groups_index = self.use_case.get_prior_groups_index()
+        second_prior_groups_index = self.use_case.get_prior_groups_index()
+
+        self.assertIs(first_prior_groups_index, second_prior_groups_index)
+        self.assertEqual(1, self.repository.get_prior_entities_count)
+        self.assertEqual(["Maria Diaz"], [x.name for x in second_prior_groups_index.get_groups()])
+
+    def test_save_entities_updates_prior_groups_index(self):
+        self.use_case.save_entities([self.get_entity("Maria Diaz", "first.pdf")])
+        prior_groups_index = self.use_case.get_prior_groups_index()
+
+        self.use_case.save_entities([self.get_entity("Annex A", "second.pdf", NamedEntityType.REFERENCE)])
+
+        self.assertIs(prior_groups_index, self.use_case.get_prior_groups_index())
+        self.assertEqual(1, self.repository.get_prior_entities_count)
+        self.assertEqual(["Annex A"], [x.name for x in prior_groups_index.get_reference_destinations()])
+
+    def test_reload_after_write_from_other_worker(self):
+        self.use_case.save_entities([self.get_entity("Maria Diaz", "first.pdf")])
+        self.use_case.get_prior_groups_index()
+
+        other_worker_repository = SQLiteEntitiesStoreRepository()
+        other_worker_repository.database_path = self.database_path
+        other_worker_repository.save_entities([self.get_entity("John Smith", "second.pdf")])
+        prior_groups_index = self.use_case.get_prior_groups_index()
+
+        self.assertEqual(["John Smith", "Maria Diaz"], sorted([x.name for x in prior_groups_index.get_groups()]))
+        self.assertEqual(2, self.repository.get_prior_entities_count)
+
+    def test_prior_entities_keep_segment_text_and_bounding_box(self):
+        self.repository.save_entities([self.get_entity("Maria Diaz", "first.pdf")])
+
+        segment = self.use_case.get_prior_groups_index().get_groups()[0].top_relevance_entity.segment
+
+        self.assertEqual(
+            ("Maria Diaz", "first.pdf", 1, 1), (segment.text, segment.source_id, segment.page_number, segment.segment_number)
+        )
+        self.assertEqual(
+            (0, 0, 10, 10),
+            (segment.bounding_box.left, segment.bounding_box.top, segment.bounding_box.width, segment.bounding_box.height),
+        )
+
+    def test_evict_least_recently_used_namespaces(self):
+        other_repository = CountingSQLiteEntitiesStoreRepository(Path(self.temporary_directory.name, "other.db"))
+        other_use_case = PriorGroupsIndexUseCase(other_repository, f"{self.temporary_directory.name}_other", "en", 1)
+        use_case = PriorGroupsIndexUseCase(self.repository, self.temporary_directory.name, "en", 1)
+        self.repository.save_entities([self.get_entity("Maria Diaz", "first.pdf")])
+        other_repository.save_entities([self.get_entity("John Smith", "first.pdf")])
+
+        use_case.get_prior_groups_index()
+        other_use_case.get_prior_groups_index()
+
+        self.assertNotIn(use_case.key, PriorGroupsIndexUseCase.prior_groups_indexes)
+        self.assertNotIn(use_case.key, PriorGroupsIndexUseCase.locks)
+        self.assertIn(other_use_case.key, PriorGroupsIndexUseCase.prior_groups_indexes)
+        self.assertEqual(["Maria Diaz"], [x.name for x in use_case.get_prior_groups_index().get_groups()])
+        self.assertEqual(2, self.repository.get_prior_entities_count)
+        other_use_case.delete_prior_groups_index()